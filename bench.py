@@ -0,0 +1,937 @@
+#!/usr/bin/env python3
+"""Microbenchmarks for hot paths in server.py (runs offline).
+
+Usage:
+    python bench.py calendar [--calls N]
+    python bench.py items [--count N]
+    python bench.py parsers [--calls N]
+    python bench.py twstalker [--calls N]
+    python bench.py text [--cycles N]
+    python bench.py scroll [--seconds N] [--url URL] [--browser PATH]
+    python bench.py cycle [--cycles N] [--latency-scale X] [--fixtures PATH] [--record]
+    python bench.py throughput [--calls N] [--upstream PATH] [--json OUT] [--compare OLD]
+    python bench.py load [--clients N] [--seconds N] [--reload S] [--poll S] [--no-sse]
+                         [--cache PATH | --url URL] [--json OUT]
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import platform
+import random
+import re
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from html import unescape
+from typing import Callable
+
+sys.path.insert(0, '.')
+
+import replay
+import requests
+import server
+import tracing
+from astral.sun import sun
+from bs4 import BeautifulSoup
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "html")
+
+
+def _timeit(fn, calls: int) -> float:
+    """Return mean microseconds per call."""
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def _best_of(fn, calls: int, repeat: int = 3) -> float:
+    """Lowest mean µs per call over `repeat` runs (filters GC/scheduler noise)."""
+    return min(_timeit(fn, calls) for _ in range(repeat))
+
+
+def _report(rows) -> None:
+    print(f"   {'function':<28} {'legacy µs':>12} {'new µs':>12} {'speedup':>9}")
+    for name, legacy, new in rows:
+        print(f"   {name:<28} {legacy:>12.1f} {new:>12.1f} {legacy / new:>8.1f}x")
+
+
+# ============ CALENDAR ============
+
+def _legacy_shabbos_times() -> dict:
+    """get_shabbos_times() as it was before the calendar index."""
+    now = datetime.now(server._tz)
+    today = now.date()
+    friday = today - timedelta(days=(today.weekday() - 4) % 7)
+    saturday = friday + timedelta(days=1)
+    fri_sunset = sun(server._observer, date=friday, tzinfo=server._tz)["sunset"]
+    sat_sunset = sun(server._observer, date=saturday, tzinfo=server._tz)["sunset"]
+    candle_lighting = fri_sunset - timedelta(minutes=server.CANDLE_LIGHTING_OFFSET)
+    havdalah = sat_sunset + timedelta(minutes=server.HAVDALAH_OFFSET)
+    if now > havdalah:
+        friday = friday + timedelta(days=7)
+        saturday = friday + timedelta(days=1)
+        fri_sunset = sun(server._observer, date=friday, tzinfo=server._tz)["sunset"]
+        sat_sunset = sun(server._observer, date=saturday, tzinfo=server._tz)["sunset"]
+        candle_lighting = fri_sunset - timedelta(minutes=server.CANDLE_LIGHTING_OFFSET)
+        havdalah = sat_sunset + timedelta(minutes=server.HAVDALAH_OFFSET)
+    return {
+        "candle_lighting": candle_lighting,
+        "havdalah": havdalah,
+        "friday_date": friday,
+        "candle_lighting_display": candle_lighting.strftime("%-I:%M %p"),
+        "havdalah_display": havdalah.strftime("%-I:%M %p"),
+    }
+
+
+def _legacy_yom_tov_info() -> dict:
+    """get_yom_tov_info() as it was before the calendar index: refetch
+    (from the in-memory Hebcal cache), rebuild windows, linear scan."""
+    now = datetime.now(server._tz)
+    today = now.date()
+    events = server._fetch_hebcal_events(today.year, today.month)
+    ny, nm = (today.year + 1, 1) if today.month == 12 else (today.year, today.month + 1)
+    events = events + server._fetch_hebcal_events(ny, nm)
+    if not events:
+        return None
+    for w in server._build_yom_tov_windows(events):
+        if w["candle_lighting"] <= now <= w["havdalah"] or (
+            now < w["candle_lighting"] and (w["candle_lighting"] - now).days <= 7
+        ):
+            return {**w, "active": w["candle_lighting"] <= now,
+                    "havdalah_display": w["havdalah"].strftime("%a %-I:%M %p"),
+                    "retention_days": w["days"]}
+    return None
+
+
+def bench_calendar(calls: int) -> None:
+    print("Calendar lookups (Hebcal cache seeded from the offline engine, no network)")
+    today = datetime.now(server._tz).date()
+    ny, nm = (today.year + 1, 1) if today.month == 12 else (today.year, today.month + 1)
+    for y, m in [(today.year, today.month), (ny, nm)]:
+        first = date(y, m, 1)
+        last = (first + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+        server._hebcal_cache[(y, m)] = {"fetched_at": datetime.now(),
+                                        "items": server._local_calendar_events(first, last)}
+
+    # Results must agree before timings mean anything
+    legacy, new = _legacy_shabbos_times(), server.get_shabbos_times()
+    assert legacy == new, f"Shabbos times differ: {legacy} != {new}"
+    legacy_yt, new_yt = _legacy_yom_tov_info(), server.get_yom_tov_info()
+    for key in ("active", "name", "candle_lighting", "havdalah", "days"):
+        assert (legacy_yt or {}).get(key) == (new_yt or {}).get(key), f"Yom Tov {key} differs"
+
+    build_start = time.perf_counter()
+    server._build_calendar_index(today)
+    build_ms = (time.perf_counter() - build_start) * 1000
+
+    _report([
+        ("get_shabbos_times", _timeit(_legacy_shabbos_times, calls), _timeit(server.get_shabbos_times, calls)),
+        ("get_yom_tov_info", _timeit(_legacy_yom_tov_info, calls), _timeit(server.get_yom_tov_info, calls)),
+    ])
+    print(f"   index build (once per day): {build_ms:.1f} ms")
+
+
+# ============ FEED ITEMS ============
+
+def _sample_item_kwargs(i: int) -> dict:
+    return {
+        "author": f"@{['sentdefender', 'Osinttechnical', 'IntelCrab'][i % 3]}",
+        "text": f"Reports of activity near the border, update #{i} https://t.co/{i:08x}",
+        "timestamp": f"2026-03-{1 + i % 28:02d}T12:{i % 60:02d}:00+00:00",
+        "timestamp_display": "12:00 PM",
+        "link": f"https://x.com/status/{1000000 + i}",
+        "source": "nitter",
+        "feed_source": "osint",
+    }
+
+
+def _traced_kib(build) -> float:
+    tracemalloc.start()
+    kept = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size / 1024
+
+
+def bench_items(count: int) -> None:
+    print(f"Feed item model ({count} items)")
+    kwargs = [_sample_item_kwargs(i) for i in range(count)]
+
+    def legacy_dicts():
+        # 028-style dict items: the kwargs plus a normalized epoch
+        return [{**kw, "title": "", "summary": "",
+                 "epoch": server._parse_timestamp_to_epoch(kw["timestamp"])} for kw in kwargs]
+
+    def feed_items():
+        return [server.FeedItem(**kw) for kw in kwargs]
+
+    dict_kib, item_kib = _traced_kib(legacy_dicts), _traced_kib(feed_items)
+    print(f"   {'memory (dicts + values)':<28} {dict_kib:>10.0f} KiB {item_kib:>10.0f} KiB "
+          f"{dict_kib / item_kib:>6.1f}x")
+
+    dicts, items = legacy_dicts(), feed_items()
+    encoded_dicts, encoded_rows = json.dumps(dicts), json.dumps([i.to_row() for i in items])
+    assert [server.FeedItem.from_row(r).to_row() for r in json.loads(encoded_rows)] == \
+        [i.to_row() for i in items], "row codec round-trip mismatch"
+    print(f"   {'persisted JSON size':<28} {len(encoded_dicts) / 1024:>10.0f} KiB "
+          f"{len(encoded_rows) / 1024:>10.0f} KiB")
+
+    calls = max(1, 200000 // count)
+    _report([
+        ("encode (dicts vs rows)", _timeit(lambda: json.dumps(dicts), calls),
+         _timeit(lambda: json.dumps([i.to_row() for i in items]), calls)),
+        ("decode (from_dict vs row)",
+         _timeit(lambda: [server.FeedItem.from_dict(d) for d in json.loads(encoded_dicts)], calls),
+         _timeit(lambda: [server.FeedItem.from_row(r) for r in json.loads(encoded_rows)], calls)),
+    ])
+
+
+# ============ PARSERS ============
+
+def load_fixture(name: str) -> bytes:
+    with open(os.path.join(FIXTURE_DIR, name), "rb") as f:
+        return f.read()
+
+
+@contextmanager
+def full_tree_parsing():
+    """Run parsers the pre-strainer way: whole page, pure-Python html.parser."""
+    original = server.parse_html
+    server.parse_html = lambda markup, only=None: BeautifulSoup(markup, "html.parser")
+    try:
+        yield
+    finally:
+        server.parse_html = original
+
+
+# (label, fixture, parse function taking the page bytes)
+PARSER_CASES = [
+    ("parse_twitter_syndication", "twitter_syndication.html",
+     lambda html: server.parse_twitter_syndication(html, "sentdefender")),
+    ("parse_nitter_profile", "nitter_profile.html",
+     lambda html: server.parse_nitter_profile(html, "sentdefender")),
+    ("parse_toi_liveblog", "toi_liveblog.html",
+     lambda html: server.parse_toi_liveblog(html, server.TOI_LIVEBLOG_URL)),
+    ("parse_think_tank_links", "think_tank_listing.html",
+     lambda html: server.parse_think_tank_links(html, server.THINK_TANK_FEEDS[1])),
+    ("parse_article_text", "think_tank_article.html", server.parse_article_text),
+]
+
+
+def _comparable(result):
+    return [item.to_row() for item in result] if isinstance(result, list) and result and \
+        isinstance(result[0], server.FeedItem) else result
+
+
+def bench_parsers(calls: int) -> None:
+    print(f"HTML parsers on fixtures (builder: {server.HTML_PARSER}, legacy: full html.parser tree)")
+    server.logger.disabled = True  # TOI logs its matched selector on every call
+    rows = []
+    for label, fixture, parse in PARSER_CASES:
+        html = load_fixture(fixture)
+        with full_tree_parsing():
+            legacy_result = parse(html)
+            legacy = _best_of(lambda: parse(html), calls)
+        assert _comparable(parse(html)) == _comparable(legacy_result), f"{label}: output differs"
+        rows.append((label, legacy, _best_of(lambda: parse(html), calls)))
+    server.logger.disabled = False
+    _report(rows)
+
+
+# ============ TWSTALKER ============
+
+def _legacy_parse_twstalker_profile(html: str, username: str, limit: int = 5) -> list:
+    """parse_twstalker_profile() as it was before the single-pass scanner."""
+    items = []
+    # Split by activity-group1 blocks (each is a tweet)
+    blocks = re.split(r'<div class="activity-group1">', html)
+
+    for block in blocks[1:]:  # Skip pre-content
+        if len(items) >= limit:
+            break
+        try:
+            # Extract tweet link and ID
+            link_match = re.search(r'href="(/([^/]+)/status/(\d+))"', block)
+            if not link_match:
+                continue
+            original_author = link_match.group(2)
+            link = f"https://twitter.com{link_match.group(1)}"
+
+            # Extract relative timestamp
+            time_match = re.search(
+                r'(\d+ (?:seconds?|minutes?|hours?|days?|weeks?|months?) ago)',
+                block,
+            )
+            timestamp_display = time_match.group(1) if time_match else ""
+
+            # Extract text: strip HTML tags, SVGs, scripts
+            clean = re.sub(r'<script[^>]*>.*?</script>', '', block, flags=re.S)
+            clean = re.sub(r'<style[^>]*>.*?</style>', '', clean, flags=re.S)
+            clean = re.sub(r'<svg[^>]*>.*?</svg>', '', clean, flags=re.S)
+            clean = re.sub(r'<[^>]+>', '\n', clean)
+            clean = unescape(clean)
+
+            # Filter to lines that look like tweet content
+            lines = [l.strip() for l in clean.split('\n') if l.strip()]
+            text_lines = [
+                l for l in lines
+                if len(l) > 20
+                and 'ago' not in l.lower()
+                and not re.match(r'^[\d,\.]+$', l)
+                and not l.startswith('http')
+            ]
+            text = ' '.join(text_lines[:3]).strip()
+            if not text:
+                continue  # Skip media-only tweets
+
+            text = (lambda t: t[:300] + ("..." if len(t) > 300 else ""))(text)
+
+            # Show original author if it's a retweet
+            author = username
+            if original_author.lower() != username.lower():
+                text = f"RT @{original_author}: {text}"
+
+            items.append(server.FeedItem(
+                author=author,
+                text=text,
+                timestamp=server._relative_to_iso(timestamp_display),  # Approximate ISO for sorting
+                timestamp_display=timestamp_display,
+                link=link,
+                feed_source="osint",
+            ))
+        except Exception:
+            continue
+
+    return items
+
+
+def _twstalker_rows(items) -> list:
+    return [(i.author, i.text, i.link, i.timestamp_display) for i in items]
+
+
+def bench_twstalker(calls: int) -> None:
+    html = load_fixture("twstalker_profile.html").decode()
+    print(f"TwStalker profile parse ({len(html) / 1024:.0f} KiB page)")
+    rows = []
+    for limit in (5, 20):
+        legacy = _legacy_parse_twstalker_profile(html, "sentdefender", limit)
+        new = server.parse_twstalker_profile(html, "sentdefender", limit)
+        assert _twstalker_rows(new) == _twstalker_rows(legacy), f"limit={limit}: output differs"
+        rows.append((f"first {limit} tweets",
+                     _best_of(lambda: _legacy_parse_twstalker_profile(html, "sentdefender", limit), calls),
+                     _best_of(lambda: server.parse_twstalker_profile(html, "sentdefender", limit), calls)))
+    _report(rows)
+
+
+# ============ TEXT EXTRACTION ============
+
+def _legacy_clean_html(html_text: str) -> str:
+    """clean_html() as it was: a full BeautifulSoup tree per call."""
+    if not html_text:
+        return ""
+    return unescape(BeautifulSoup(html_text, "html.parser").get_text(separator=" ", strip=True))
+
+
+def _legacy_extract_text_with_links(html_text: str) -> str:
+    """extract_text_with_links() as it was: a full BeautifulSoup tree per call."""
+    if not html_text:
+        return ""
+    soup = BeautifulSoup(html_text, "html.parser")
+    for a_tag in soup.find_all("a", href=True):
+        href = a_tag["href"]
+        link_text = a_tag.get_text(strip=True)
+        if href and href != link_text:
+            a_tag.replace_with(f"{link_text} [{href}]")
+        else:
+            a_tag.replace_with(link_text or href or "")
+    text = soup.get_text(separator=" ", strip=True)
+    text = re.sub(r'\[?https?://(?:www\.)?truthsocial\.com/\S+\]?', '', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+    return unescape(text)
+
+
+def feed_text_corpus(seed: int = 7) -> tuple:
+    """One cycle's worth of (clean_html inputs, extract_text_with_links inputs):
+    RSS titles/summaries (plain and marked up) and Truth Social post bodies."""
+    rng = random.Random(seed)
+    words = ("Iran Israel strike missile officials said Tuesday talks sanctions nuclear IDF "
+             "ceasefire Hezbollah Gaza statement reports confirmed overnight").split()
+    sentence = lambda n: " ".join(rng.choice(words) for _ in range(n))
+    clean_inputs, link_inputs = [], []
+    for i in range(60):
+        clean_inputs.append(sentence(12))  # titles: plain text
+        clean_inputs.append(f"<p>{sentence(30)} &#8217;{sentence(5)}&#8217; &amp; "
+                            f"<a href=\"https://example.com/{i}\">{sentence(3)}</a></p><p>{sentence(20)}</p>")
+        clean_inputs.append(f"{sentence(25)} AT&amp;T {sentence(10)}")
+    for i in range(40):
+        link_inputs.append(f"<p>{sentence(35)} <a href=\"https://truthsocial.com/@realDonaldTrump/{i}\">"
+                           f"https://truthsocial.com/@realDonaldTrump/{i}</a></p>"
+                           f"<p>RT <a href=\"https://www.example.com/story{i}\">@source</a>: {sentence(15)}</p>")
+        link_inputs.append(sentence(30))
+    return clean_inputs, link_inputs
+
+
+def bench_text(cycles: int) -> None:
+    clean_inputs, link_inputs = feed_text_corpus()
+    print(f"Text extraction: {len(clean_inputs)} clean_html + {len(link_inputs)} "
+          f"extract_text_with_links calls per cycle")
+    for html_text in clean_inputs:
+        assert server.clean_html(html_text) == _legacy_clean_html(html_text), html_text
+    for html_text in link_inputs:
+        assert server.extract_text_with_links(html_text) == _legacy_extract_text_with_links(html_text), html_text
+
+    def run(clean, links):
+        for html_text in clean_inputs:
+            clean(html_text)
+        for html_text in link_inputs:
+            links(html_text)
+
+    def cold():
+        server._text_memo.clear()
+        run(server.clean_html, server.extract_text_with_links)
+
+    legacy = _best_of(lambda: run(_legacy_clean_html, _legacy_extract_text_with_links), cycles)
+    _report([
+        ("first cycle (memo empty)", legacy, _best_of(cold, cycles)),
+        ("later cycles (memo warm)", legacy, _best_of(lambda: run(server.clean_html, server.extract_text_with_links), cycles)),
+    ])
+
+
+# ============ PARSER THROUGHPUT ============
+
+def _feed_ingest(body: bytes) -> list:
+    """parse_feed + item building for every entry (the entry memo bypassed)."""
+    return [server._news_rss_item(entry, 300) for entry in server.parse_feed(body).entries]
+
+
+def _text_pass(extract, inputs: list) -> Callable:
+    def run():
+        server._text_memo.clear()  # measure extraction, not memo hits
+        return [extract(text) for text in inputs]
+    return run
+
+
+def throughput_cases() -> list:
+    """(label, input bytes, zero-argument call) for every parser, on fixtures."""
+    def page(label, name, parse, as_text=False):
+        body = load_fixture(name)
+        arg = body.decode() if as_text else body
+        return (label, len(body), lambda: parse(arg))
+
+    clean_inputs, link_inputs = feed_text_corpus()
+    return [
+        page("parse_twstalker_profile", "twstalker_profile.html",
+             lambda html: server.parse_twstalker_profile(html, "sentdefender"), as_text=True),
+        page("parse_twitter_syndication", "twitter_syndication.html",
+             lambda html: server.parse_twitter_syndication(html, "sentdefender")),
+        page("parse_nitter_profile", "nitter_profile.html",
+             lambda html: server.parse_nitter_profile(html, "sentdefender")),
+        page("parse_toi_liveblog", "toi_liveblog.html",
+             lambda html: server.parse_toi_liveblog(html, server.TOI_LIVEBLOG_URL)),
+        page("_scrape_think_tank_page", "think_tank_listing.html",
+             lambda html: server.parse_think_tank_links(html, server.THINK_TANK_FEEDS[1])),
+        page("_fetch_article_text", "think_tank_article.html", server.parse_article_text),
+        page("feedparser ingest", "news_rss.xml", _feed_ingest),
+        page("_parse_ai_bullets", "ai_bullets.txt", server._parse_ai_bullets, as_text=True),
+        (f"clean_html ({len(clean_inputs)} inputs)", sum(len(t.encode()) for t in clean_inputs),
+         _text_pass(server.clean_html, clean_inputs)),
+        (f"extract_text_with_links ({len(link_inputs)})", sum(len(t.encode()) for t in link_inputs),
+         _text_pass(server.extract_text_with_links, link_inputs)),
+    ]
+
+
+# Recorded upstream responses (bench.py cycle --record) → parser they feed
+_RECORDED_PARSERS = (
+    ("twstalker.com", "parse_twstalker_profile", True,
+     lambda body, url: server.parse_twstalker_profile(body, url.rstrip("/").rsplit("/", 1)[1])),
+    ("syndication.twitter.com", "parse_twitter_syndication", False,
+     lambda body, url: server.parse_twitter_syndication(body, url.rsplit("/", 1)[1])),
+    ("timesofisrael.com/liveblog", "parse_toi_liveblog", False,
+     lambda body, url: server.parse_toi_liveblog(body, url)),
+    ("news.google.com/rss", "feedparser ingest", False, lambda body, url: _feed_ingest(body)),
+)
+
+
+def recorded_cases(path: str) -> list:
+    """Cases on real pages: the largest recorded 200 response for each parser."""
+    store = replay.FixtureStore.load(path)
+    cases = []
+    for marker, label, as_text, parse in _RECORDED_PARSERS:
+        bodies = [(replay.Replayer.body(entry), url) for url, entries in store.responses.items() if marker in url
+                  for entry in entries if entry["status"] == 200]
+        if bodies:
+            body, url = max(bodies, key=lambda b: len(b[0]))
+            arg = body.decode(errors="replace") if as_text else body
+            cases.append((f"{label} (recorded)", len(body), lambda arg=arg, url=url, parse=parse: parse(arg, url)))
+    return cases
+
+
+def _alloc_kib(call: Callable) -> float:
+    """Peak memory allocated during one call, above what was live before it.
+
+    CPython has no cumulative allocation counter; tracemalloc's peak is the
+    closest per-call measure of allocation pressure.
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        result = call()
+        peak = tracemalloc.get_traced_memory()[1]
+        del result
+    finally:
+        tracemalloc.stop()
+    return (peak - before) / 1024
+
+
+def bench_throughput(calls: int, upstream: str, json_out: str, compare: str) -> None:
+    cases = throughput_cases()
+    if upstream:
+        cases += recorded_cases(upstream)
+    print(f"Parser throughput (builder: {server.HTML_PARSER}, best of 3 x {calls} calls)")
+    print(f"   {'parser':<36} {'input KiB':>10} {'µs/call':>10} {'MB/s':>8} {'alloc KiB':>10}")
+    server.logger.disabled = True
+    results = []
+    try:
+        for label, size, call in cases:
+            assert call(), f"{label}: no output"
+            us = _best_of(call, calls)
+            results.append({"parser": label, "input_bytes": size, "us_per_call": round(us, 2),
+                            "mb_per_s": round(size / us, 2), "alloc_kib": round(_alloc_kib(call), 1)})
+            r = results[-1]
+            print(f"   {label:<36} {size / 1024:>10.1f} {us:>10.1f} {r['mb_per_s']:>8.2f} {r['alloc_kib']:>10.1f}")
+    finally:
+        server.logger.disabled = False
+
+    if compare:
+        with open(compare) as f:
+            before = {r["parser"]: r for r in json.load(f)["results"]}
+        print(f"\n   vs {compare}")
+        for r in results:
+            old = before.get(r["parser"])
+            if old:
+                print(f"   {r['parser']:<36} {old['us_per_call'] / r['us_per_call']:>6.2f}x speed "
+                      f"{r['alloc_kib'] - old['alloc_kib']:>+10.1f} KiB alloc")
+    if json_out:
+        with open(json_out, "w") as f:
+            json.dump({
+                "recorded_at": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "html_parser": server.HTML_PARSER,
+                "calls": calls,
+                "results": results,
+            }, f, indent=2)
+        print(f"   saved {json_out}")
+
+
+# ============ DASHBOARD AUTO-SCROLL (headless browser CPU) ============
+
+_BROWSERS = ("chromium", "chromium-browser", "google-chrome", "google-chrome-stable",
+             "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome")
+
+
+def _process_tree_cpu(root_pid: int) -> float:
+    """CPU seconds (user + system) used so far by `root_pid` and its descendants."""
+    rows = subprocess.run(["ps", "-A", "-o", "pid=,ppid=,time="], capture_output=True, text=True).stdout
+    children, cpu = {}, {}
+    for line in rows.splitlines():
+        pid, ppid, elapsed = line.split()
+        days, _, clock = elapsed.rpartition("-")
+        seconds = 0.0
+        for part in clock.split(":"):
+            seconds = seconds * 60 + float(part)
+        cpu[int(pid)] = seconds + int(days or 0) * 86400
+        children.setdefault(int(ppid), []).append(int(pid))
+    total, stack = 0.0, [root_pid]
+    while stack:
+        pid = stack.pop()
+        total += cpu.get(pid, 0.0)
+        stack.extend(children.get(pid, []))
+    return total
+
+
+def _publish_sample_feeds() -> None:
+    """Fill every item column with 40 fresh sample items."""
+    now = datetime.now().astimezone().isoformat()
+    server.publish_feeds({
+        name: {"items": [server.FeedItem(**{**_sample_item_kwargs(i), "timestamp": now,
+                                            "title": f"Headline {i} for {name}",
+                                            "summary": "Summary text. " * 12})
+                         for i in range(40)],
+               "last_updated": datetime.now()}
+        for name in ("twitter_list", "trump", "reuters", "toi_liveblog", "think_tanks")
+    })
+
+
+def _serve_sample_dashboard() -> str:
+    """Serve the dashboard in-process with full columns; return its URL."""
+    from werkzeug.serving import make_server
+    _publish_sample_feeds()
+    httpd = make_server("127.0.0.1", 0, server.app, threaded=True)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{httpd.server_port}/"
+
+
+def bench_scroll(seconds: int, url: str, browser: str) -> None:
+    """CPU used by a headless browser showing the dashboard.
+
+    For a before/after comparison, run once against a server started from
+    each revision (--url).
+    """
+    browser = browser or next((b for b in _BROWSERS if shutil.which(b) or os.path.exists(b)), None)
+    if not browser:
+        sys.exit("No Chrome/Chromium found — pass --browser PATH")
+    url = url or _serve_sample_dashboard()
+    print(f"Dashboard auto-scroll: {browser} --headless on {url} for {seconds}s")
+    with tempfile.TemporaryDirectory() as profile:
+        proc = subprocess.Popen([browser, "--headless=new", "--disable-gpu", "--no-first-run",
+                                 "--mute-audio", f"--user-data-dir={profile}", "--window-size=1920,1080", url],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            time.sleep(10)  # page load, layout, first frames
+            start_cpu, start = _process_tree_cpu(proc.pid), time.monotonic()
+            time.sleep(seconds)
+            used, wall = _process_tree_cpu(proc.pid) - start_cpu, time.monotonic() - start
+        finally:
+            proc.terminate()
+            proc.wait(timeout=10)
+    print(f"   browser CPU {used:.2f}s over {wall:.0f}s = {used / wall * 100:.1f}% of one core")
+
+
+# ============ FULL UPDATE CYCLE (record / replay) ============
+
+UPSTREAM_FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "upstream.json.gz")
+
+
+@contextmanager
+def _scratch_cache_file():
+    """Point CACHE_FILE at a temp file so a benchmark never touches feed_cache.json."""
+    fd, path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    saved, server.CACHE_FILE = server.CACHE_FILE, path
+    try:
+        yield
+    finally:
+        server.CACHE_FILE = saved
+        os.unlink(path)
+
+
+def _peak_rss_mib() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)  # bytes on macOS, KiB on Linux
+
+
+def bench_cycle(cycles: int, latency_scale: float, fixtures: str, record: bool) -> None:
+    """update_all_feeds() replayed from recorded upstream responses.
+
+    --record runs one live cycle and saves every response; later runs replay
+    it offline, so two revisions can be compared on identical input.
+    """
+    server.logger.setLevel(logging.WARNING)
+    with _scratch_cache_file():
+        if record:
+            server.set_upstream_mode(record=fixtures)
+            server.update_all_feeds()
+            server.set_upstream_mode()
+            print(f"Recorded one live cycle to {fixtures}")
+            return
+        if not os.path.exists(fixtures):
+            sys.exit(f"No recording at {fixtures} — run: python bench.py cycle --record")
+        server.set_upstream_mode(replay_from=fixtures, latency_scale=latency_scale)
+        print(f"Update cycle: {cycles} replayed cycles from {fixtures} (latency x{latency_scale})")
+        print(f"   {'cycle':<6} {'wall s':>8} {'CPU s':>8}")
+        per_fetcher: dict = {}
+        walls, cpus = [], []
+        for n in range(cycles):
+            wall, cpu = time.perf_counter(), time.process_time()
+            server.update_all_feeds()
+            walls.append(time.perf_counter() - wall)
+            cpus.append(time.process_time() - cpu)
+            print(f"   {n + 1:<6} {walls[-1]:>8.3f} {cpus[-1]:>8.3f}")
+            for span in tracing.recent()[-1].children:
+                if span.name == "fetcher":
+                    per_fetcher.setdefault(span.attrs["fetcher"], []).append(span.duration)
+        misses = len(set(server._replayer.misses))
+        server.set_upstream_mode()
+    print(f"   {'mean':<6} {sum(walls) / cycles:>8.3f} {sum(cpus) / cycles:>8.3f}")
+    print(f"   peak RSS {_peak_rss_mib():.1f} MiB; {misses} URLs not in the recording")
+    print(f"   {'fetcher':<20} {'mean s':>8} {'max s':>8}")
+    for name, times in sorted(per_fetcher.items(), key=lambda kv: -sum(kv[1])):
+        print(f"   {name:<20} {sum(times) / len(times):>8.3f} {max(times):>8.3f}")
+
+
+# ============ DASHBOARD LOAD (simulated displays) ============
+
+_LOAD_PATHS = ("/", "/health", "/api/ai-status")
+
+
+def _write_fixture_cache(path: str) -> None:
+    """Save a cache with every item column and a day of AI summaries to `path`."""
+    _publish_sample_feeds()
+    now = datetime.now()
+    bullets = server._parse_ai_bullets(load_fixture("ai_bullets.txt").decode())
+    summaries = [{
+        "type": "regular",
+        "generated_at": (now - timedelta(hours=2 * n)).isoformat(),
+        "generated_at_display": (now - timedelta(hours=2 * n)).strftime("%a %-I:%M %p ET"),
+        "hour_label": (now - timedelta(hours=2 * n)).strftime("%-I:%M %p ET"),
+        "bullets": bullets,
+    } for n in range(12)]
+    server.publish("ai_summary", items=bullets, summaries=summaries, last_updated=now)
+    saved, server.CACHE_FILE = server.CACHE_FILE, path
+    try:
+        server.save_cache_to_disk()
+    finally:
+        server.CACHE_FILE = saved
+
+
+def serve_fixture(cache_file: str, publish_every: float) -> None:
+    """Serve the dashboard from a saved cache, the way app.run() does, and
+    print the port and the CPU time used starting up.
+
+    No scheduler runs, and every upstream request fails as a replay miss, so
+    nothing leaves the machine. Every `publish_every` seconds one column gets
+    a new first item, standing in for a fetcher publishing new data.
+    """
+    from werkzeug.serving import make_server
+    server.logger.setLevel(logging.WARNING)
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)  # no access log line per request
+    server.CACHE_FILE = cache_file
+    server.CACHE_MAX_AGE = float("inf")  # serve a copied cache whatever its age
+    server.load_cache_from_disk()
+    server._replayer = replay.Replayer(replay.FixtureStore(cache_file), latency_scale=0)
+
+    def publish_loop():
+        feeds = ("reuters", "toi_liveblog", "twitter_list", "trump")
+        for n in range(1, 1 << 30):
+            time.sleep(publish_every)
+            feed = feeds[n % len(feeds)]
+            items = list(server.cache[feed]["items"])
+            server.publish(feed, items=items[-1:] + items[:-1], last_updated=datetime.now())
+
+    if publish_every > 0:
+        threading.Thread(target=publish_loop, daemon=True).start()
+    httpd = make_server("127.0.0.1", 0, server.app, threaded=True)
+    print(httpd.server_port, time.process_time(), flush=True)
+    httpd.serve_forever()
+
+
+def _dashboard_client(base: str, start: float, until: float, reload: float, poll: float, sse: bool,
+                      rng: random.Random, samples: list, streams: list) -> None:
+    """One display: a page load at a random offset, then reloads every
+    `reload` seconds (each preceded by a /health check, with If-None-Match)
+    and /api/ai-status every `poll` seconds, both ±10%. With `sse` the page
+    also holds its /events stream open, as dashboard.js does."""
+    session = requests.Session()
+    etag = None
+
+    def hit(path: str, **headers):
+        began = time.perf_counter()
+        try:
+            response = session.get(base + path, headers=headers, timeout=30)
+            status = response.status_code
+        except requests.RequestException:
+            response, status = None, 0
+        samples.append((path, time.perf_counter() - began, status))
+        return response
+
+    def listen(version: str) -> None:
+        try:
+            with requests.get(f"{base}/events", params={"since": version}, stream=True, timeout=60) as response:
+                streams.append(response)
+                for _ in response.iter_lines():
+                    if time.monotonic() >= until:
+                        break
+        except Exception:
+            pass  # closed at the end of the run
+
+    next_reload = start + rng.uniform(0, reload)
+    next_poll = start + rng.uniform(0, poll)
+    while True:
+        due = min(next_reload, next_poll)
+        if due >= until:
+            return
+        time.sleep(max(0.0, due - time.monotonic()))
+        if due == next_reload:
+            if etag:
+                hit("/health")  # the reload loop checks the server is up first
+            response = hit("/", **({"If-None-Match": etag} if etag else {}))
+            if sse and etag is None and response is not None and response.headers.get("ETag"):
+                threading.Thread(target=listen, args=(response.headers["ETag"].strip('"'),), daemon=True).start()
+            if response is not None:
+                etag = response.headers.get("ETag", etag)
+            next_reload += reload * rng.uniform(0.9, 1.1)
+        else:
+            hit("/api/ai-status")
+            next_poll += poll * rng.uniform(0.9, 1.1)
+
+
+def _percentile(ordered: list, q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)] if ordered else 0.0
+
+
+def bench_load(clients: int, seconds: float, reload: float, poll: float, sse: bool,
+               cache_file: str, url: str, publish_every: float, json_out: str) -> None:
+    """N dashboards against one server: latency percentiles and requests/s.
+
+    The server runs in its own process (as in production), loaded from
+    --cache or from a generated cache with every column filled. Schedules
+    are compressed: the defaults make each display reload every 30 s rather
+    than every REFRESH_INTERVAL, so a minute's run covers many reloads.
+    """
+    proc = scratch = None
+    if not url:
+        if not cache_file:
+            fd, scratch = tempfile.mkstemp(suffix=".json")
+            os.close(fd)
+            _write_fixture_cache(scratch)
+        proc = subprocess.Popen([sys.executable, os.path.abspath(__file__), "serve-fixture",
+                                 cache_file or scratch, "--publish-every", str(publish_every)],
+                                stdout=subprocess.PIPE, text=True)
+        ready = proc.stdout.readline().split()
+        if not ready:
+            sys.exit("Fixture server failed to start")
+        port, startup_cpu = ready[0], float(ready[1])
+        url = f"http://127.0.0.1:{port}"
+    base = url.rstrip("/")
+    print(f"Dashboard load: {clients} displays for {seconds:.0f}s against {base} "
+          f"(reload ~{reload:.0f}s, ai-status ~{poll:.0f}s, SSE {'on' if sse else 'off'})")
+
+    samples: list = []
+    streams: list = []
+    start = time.monotonic()
+    until = start + seconds
+    threads = [threading.Thread(target=_dashboard_client,
+                                args=(base, start, until, reload, poll, sse, random.Random(n), samples, streams),
+                                daemon=True)
+               for n in range(clients)]
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.monotonic() - start
+        dashboard = requests.get(f"{base}/health", timeout=30).json().get("dashboard", {})
+    finally:
+        for response in streams:
+            response.close()
+        server_cpu = None
+        if proc:
+            proc.terminate()
+            _, proc.returncode, usage = os.wait4(proc.pid, 0)
+            server_cpu = usage.ru_utime + usage.ru_stime - startup_cpu
+        if scratch:
+            os.unlink(scratch)
+
+    results = {}
+    print(f"   {'endpoint':<16} {'requests':>9} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for path in _LOAD_PATHS:
+        rows = [(latency, status) for p, latency, status in samples if p == path]
+        ordered = sorted(latency * 1000 for latency, _ in rows)
+        statuses: dict = {}
+        for _, status in rows:
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+        results[path] = {
+            "requests": len(rows),
+            "rps": round(len(rows) / elapsed, 2),
+            "p50_ms": round(_percentile(ordered, 50), 2),
+            "p95_ms": round(_percentile(ordered, 95), 2),
+            "p99_ms": round(_percentile(ordered, 99), 2),
+            "errors": sum(1 for _, status in rows if status == 0 or status >= 400),
+            "statuses": statuses,
+        }
+        r = results[path]
+        print(f"   {path:<16} {r['requests']:>9} {r['rps']:>8.2f} {r['p50_ms']:>8.1f} "
+              f"{r['p95_ms']:>8.1f} {r['p99_ms']:>8.1f} {r['errors']:>7}")
+    print(f"   {'total':<16} {len(samples):>9} {len(samples) / elapsed:>8.2f}")
+    page = results["/"]["statuses"]
+    print(f"   / answered {page.get('200', 0)}x 200, {page.get('304', 0)}x 304; "
+          f"server renders {dashboard.get('renders')}, hit rate {dashboard.get('hit_rate')}, "
+          f"SSE clients {dashboard.get('clients')}")
+    if server_cpu is not None:
+        print(f"   server CPU {server_cpu:.2f}s over {elapsed:.0f}s = {server_cpu / elapsed * 100:.1f}% of one core")
+    if json_out:
+        with open(json_out, "w") as f:
+            json.dump({"clients": clients, "seconds": round(elapsed, 2), "reload": reload, "poll": poll,
+                       "sse": sse, "url": base, "endpoints": results, "dashboard": dashboard,
+                       "server_cpu_s": server_cpu}, f, indent=2)
+        print(f"   saved {json_out}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="suite", required=True)
+    p = sub.add_parser("calendar", help="calendar index vs. per-call computation")
+    p.add_argument("--calls", type=int, default=2000)
+    p = sub.add_parser("items", help="slotted FeedItem vs. dict items: memory and codec")
+    p.add_argument("--count", type=int, default=2000)
+    p = sub.add_parser("parsers", help="strained parsing vs. full html.parser trees, on fixtures")
+    p.add_argument("--calls", type=int, default=20)
+    p = sub.add_parser("twstalker", help="single-pass TwStalker scanner vs. regex cascade")
+    p.add_argument("--calls", type=int, default=200)
+    p = sub.add_parser("text", help="clean_html / extract_text_with_links vs. BeautifulSoup per call")
+    p.add_argument("--cycles", type=int, default=10)
+    p = sub.add_parser("scroll", help="headless browser CPU while the dashboard auto-scrolls")
+    p.add_argument("--seconds", type=int, default=60)
+    p.add_argument("--url", help="measure a running dashboard instead of an in-process one")
+    p.add_argument("--browser", help="Chrome/Chromium executable")
+    p = sub.add_parser("throughput", help="every parser on fixtures: MB/s and allocation per call")
+    p.add_argument("--calls", type=int, default=20)
+    p.add_argument("--upstream", help="also time parsers on a recorded upstream store (bench.py cycle --record)")
+    p.add_argument("--json", dest="json_out", help="save results as JSON")
+    p.add_argument("--compare", help="JSON from an earlier run to compare against")
+    p = sub.add_parser("cycle", help="full update cycles replayed from recorded upstream responses")
+    p.add_argument("--cycles", type=int, default=5)
+    p.add_argument("--latency-scale", type=float, default=0.0, help="replayed latency multiplier (1 = as recorded)")
+    p.add_argument("--fixtures", default=UPSTREAM_FIXTURES)
+    p.add_argument("--record", action="store_true", help="record one live cycle to --fixtures instead")
+    p = sub.add_parser("load", help="simulated dashboards against one server: latency percentiles, req/s")
+    p.add_argument("--clients", type=int, default=20, help="displays and phones to simulate")
+    p.add_argument("--seconds", type=float, default=60)
+    p.add_argument("--reload", type=float, default=30, help="seconds between page reloads per display")
+    p.add_argument("--poll", type=float, default=15, help="seconds between /api/ai-status polls per display")
+    p.add_argument("--no-sse", dest="sse", action="store_false", help="don't hold an /events stream per display")
+    p.add_argument("--cache", help="serve this saved feed cache (e.g. a copy of feed_cache.json)")
+    p.add_argument("--url", help="load a running server instead of a fixture one")
+    p.add_argument("--publish-every", type=float, default=20, help="seconds between simulated feed updates")
+    p.add_argument("--json", dest="json_out", help="save results as JSON")
+    p = sub.add_parser("serve-fixture", help=argparse.SUPPRESS)
+    p.add_argument("cache_file")
+    p.add_argument("--publish-every", type=float, default=0)
+    args = parser.parse_args()
+
+    if args.suite == "calendar":
+        bench_calendar(args.calls)
+    elif args.suite == "items":
+        bench_items(args.count)
+    elif args.suite == "parsers":
+        bench_parsers(args.calls)
+    elif args.suite == "twstalker":
+        bench_twstalker(args.calls)
+    elif args.suite == "text":
+        bench_text(args.cycles)
+    elif args.suite == "scroll":
+        bench_scroll(args.seconds, args.url, args.browser)
+    elif args.suite == "throughput":
+        bench_throughput(args.calls, args.upstream, args.json_out, args.compare)
+    elif args.suite == "cycle":
+        bench_cycle(args.cycles, args.latency_scale, args.fixtures, args.record)
+    elif args.suite == "load":
+        bench_load(args.clients, args.seconds, args.reload, args.poll, args.sse,
+                   args.cache, args.url, args.publish_every, args.json_out)
+    elif args.suite == "serve-fixture":
+        serve_fixture(args.cache_file, args.publish_every)
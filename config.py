@@ -12,6 +12,16 @@ DEBUG = False
 # Refresh interval (seconds)
 REFRESH_INTERVAL = 600       # 10 minutes (normal / Shabbos)
 REFRESH_INTERVAL_YOM_TOV = 900  # 15 minutes (Yom Tov — longer to conserve resources)
+CYCLE_TIMEOUT = 120  # seconds an update cycle waits for its fetchers (stragglers keep running in the background)
+
+# Watchdog — re-runs only the fetcher of a stale feed, and reports hung fetchers
+WATCHDOG_INTERVAL = 300       # seconds between checks
+WATCHDOG_STALE_FACTOR = 3     # a feed is stale after this many missed updates
+WATCHDOG_FEED_CADENCE = {     # expected seconds between updates, for feeds slower than the refresh interval
+    "think_tanks": 3 * 3600,  # publishes only when a source has new articles
+    "prediction_markets": 3600,
+}
+FETCHER_HUNG_AFTER = 300      # seconds a fetcher may run before it is reported as hung
 
 # OSINT Accounts to Monitor (fetched via Twitter/Nitter/BlueSky fallback chain)
 TWITTER_ACCOUNTS = [
@@ -86,18 +96,65 @@ LOCATION_LON = -74.0060
 LOCATION_TZ = "America/New_York"
 CANDLE_LIGHTING_OFFSET = 18  # minutes before sunset
 HAVDALAH_OFFSET = 50         # minutes after Saturday sunset
+YOM_TOV_ISRAEL = False       # True = Israel Yom Tov schedule (no second days)
+
+# More dashboards from the same process, each at /p/<name>/ (see profiles.py).
+# A profile overrides any of: TITLE, LOCATION_LAT/LON/TZ, CANDLE_LIGHTING_OFFSET,
+# HAVDALAH_OFFSET, YOM_TOV_ISRAEL, TWITTER_ACCOUNTS (which accounts it shows; all
+# profiles' accounts are fetched once) and the AI_SUMMARY_*_PROMPTs. Upstream feeds
+# are shared; its calendar and AI summaries are its own.
+PROFILES = {
+    # "jerusalem": {
+    #     "TITLE": "Shabbos Situation Monitor — Jerusalem",
+    #     "LOCATION_LAT": 31.7683, "LOCATION_LON": 35.2137, "LOCATION_TZ": "Asia/Jerusalem",
+    #     "CANDLE_LIGHTING_OFFSET": 40, "YOM_TOV_ISRAEL": True,
+    # },
+}
 
 # Yom Tov mode: set to end datetime for extended holidays, None for normal Shabbos
 # Format: "YYYY-MM-DDTHH:MM" in ET. Shows "Yom Tov ends: ..." in header.
 # Set before Yom Tov, reset to None after.
-# Yom Tov detection: pulled automatically from Hebcal API
+# Yom Tov detection: computed locally by hebrew_calendar.py (no network needed)
 # Set to None to use automatic detection, or override with a manual ISO datetime string
-YOM_TOV_END = None  # Auto-detected from Hebcal; override example: "2026-04-04T20:05"
+YOM_TOV_END = None  # Auto-detected; override example: "2026-04-04T20:05"
+HEBCAL_CROSS_CHECK = False  # Daily compare of local Yom Tov windows against Hebcal API (logs mismatches)
 
 # Cache persistence (survives server restarts)
 CACHE_FILE = "feed_cache.json"
 CACHE_MAX_AGE = 7200  # seconds (2 hours) - ignore cache files older than this
 
+# Cycle tracing — nested timing spans per update cycle, shown at /debug/cycles/latest
+TRACE_RING_SIZE = 20  # cycles kept in memory
+TRACE_FILE = None     # e.g. "traces.jsonl" to also append every cycle's span tree as one JSON line
+
+# Logging (see logpipe.py) — records are written to server.log by a background thread
+LOG_JSON = False       # server.log as one JSON object per line, with cycle and span ids (console stays text)
+LOG_RATE_LIMIT = 5     # similar INFO messages ("Fetching @x...") let through per window; 0 = no limit
+LOG_RATE_WINDOW = 60   # seconds
+
+# Upstream record/replay (see replay.py) — normally both None (live network)
+UPSTREAM_RECORD = None         # e.g. "fixtures/upstream.json.gz": save every upstream response after each cycle
+UPSTREAM_REPLAY = None         # serve upstream responses from a recorded store instead of the network
+UPSTREAM_LATENCY_SCALE = 1.0   # replayed latency multiplier (0 = no delay)
+
+# Leader/follower (see sync.py) — one instance per building fetches and runs the AI
+# "standalone": fetch and render (default); "leader": also serve snapshots at /api/snapshot;
+# "follower": render the leader's snapshots only (no upstream requests, no API key needed)
+ROLE = "standalone"             # also: python server.py --role follower --leader http://host:8080
+LEADER_URL = None               # follower only, e.g. "http://192.168.1.20:8080"
+SNAPSHOT_POLL_INTERVAL = 30     # seconds between a follower's pulls (unchanged snapshots cost a 304)
+SNAPSHOT_TIMEOUT = 10           # seconds per pull
+SNAPSHOT_FILE = "snapshot_cache.json.gz"  # follower's last good snapshot, shown at startup / while the leader is down
+
+# Memory watch (see memwatch.py) — for multi-day Yom Tov runs; diff snapshots at /debug/memory
+MEMORY_SNAPSHOT_INTERVAL = 900      # seconds between RSS + tracemalloc snapshots
+MEMORY_SNAPSHOT_RING = 96           # snapshots kept in memory (24h at 15 min)
+MEMORY_LOG = "memory.log"           # one JSON line per snapshot (None = don't log)
+MEMORY_LOG_MAX_BYTES = 2 * 1024 * 1024  # rotated at this size, one backup kept
+MEMORY_TRACEMALLOC_FRAMES = 1       # 0 = RSS only (tracemalloc adds some memory and CPU overhead)
+MEMORY_SOFT_LIMIT_MIB = 512         # above this RSS: trim caches
+MEMORY_HARD_LIMIT_MIB = 1024        # still above this after trimming: save cache, exit 75, start.sh restarts
+
 # Display settings
 MAX_ITEMS_PER_FEED = 15
 NEWS_FEED_MAX_AGE_HOURS = 36  # Skip news items older than this (Middle East, etc.)
@@ -135,6 +192,7 @@ THINK_TANK_FEEDS = [
 THINK_TANK_MAX_AGE_HOURS = 36  # Skip articles older than this
 THINK_TANK_SUMMARIZE = True    # AI-summarize each article (uses Haiku)
 THINK_TANK_SUMMARY_MAX_NEW = 5  # Max new articles to summarize per cycle (rate limit)
+ARTICLE_SUMMARY_CACHE_MAX = 200  # Article summaries kept in memory and on disk (least recently shown dropped)
 
 # Prediction Markets — Polymarket Gamma API (no auth required)
 # Used for AI summary context only (no UI display). Fetched every cycle.
@@ -194,6 +252,14 @@ AI_SUMMARY_QUIET_HOURS = range(1, 8)                     # 1 AM - 7 AM: no summa
 AI_SUMMARY_MORNING_MODEL = "claude-opus-4-6"             # Best quality for morning summary
 AI_SUMMARY_REGULAR_MODEL = "claude-haiku-4-5-20251001"   # Fast/cheap for 2-hour summaries
 
+# AI usage accounting (/api/ai-usage) — estimated cost per model, USD per million tokens.
+# Check current pricing when changing models; models missing here are reported without a cost.
+AI_MODEL_PRICES = {
+    "claude-opus-4-6": {"input": 5.00, "output": 25.00, "cache_read": 0.50, "cache_write": 6.25},
+    "claude-haiku-4-5-20251001": {"input": 1.00, "output": 5.00, "cache_read": 0.10, "cache_write": 1.25},
+}
+AI_USAGE_RETENTION_DAYS = 60  # days of usage totals kept (in memory and in the cache file)
+
 AI_SUMMARY_MORNING_PROMPT = """You are a concise news analyst monitoring the Middle East situation.
 Write a comprehensive summary of the key developments from the overnight period (roughly midnight to 8 AM ET).
 Rules:
@@ -0,0 +1,61 @@
+"""
+Shabbos Situation Monitor - Deadlines
+
+A time budget that flows down the fetch tree. The update cycle opens a
+deadline, fetchers may open tighter ones (an inner deadline never extends an
+outer one), and every request or subprocess takes its timeout from
+`timeout(default)` — its usual timeout, cut to whatever budget is left.
+Fallback loops check `expired()` and stop early, publishing what they have.
+
+The deadline lives in a ContextVar, so it follows work handed to threads
+through tracing.submit() or the server's fetcher threads (both run in a copy
+of the caller's context). Without a deadline, `timeout(default)` is just
+`default`.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+# A request given less than this would only fail; skip it instead
+MIN_TIMEOUT = 0.5
+
+
+class DeadlineExceeded(TimeoutError):
+    """The budget is spent; raised instead of starting a request that can't finish."""
+
+
+@contextmanager
+def deadline(seconds: float):
+    """Limit the block (and work it starts in copied contexts) to `seconds`."""
+    at = time.monotonic() + seconds
+    outer = _deadline.get()
+    token = _deadline.set(at if outer is None else min(at, outer))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left in the current budget (None when there is no deadline)."""
+    at = _deadline.get()
+    return None if at is None else max(0.0, at - time.monotonic())
+
+
+def expired() -> bool:
+    left = remaining()
+    return left is not None and left < MIN_TIMEOUT
+
+
+def timeout(default: float) -> float:
+    """`default`, cut to the budget left; raises DeadlineExceeded when none is."""
+    left = remaining()
+    if left is None:
+        return default
+    if left < MIN_TIMEOUT:
+        raise DeadlineExceeded(f"deadline passed ({left:.1f}s left)")
+    return min(default, left)
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""Generate the synthetic HTML page fixtures in fixtures/html/.
+
+The pages mirror the markup the scrapers in server.py key on (Twitter
+syndication, Nitter, TwStalker, TOI liveblog, think tank listing/article,
+Google News RSS, an AI bullet summary),
+padded with the head/nav/script/footer bulk of the real sites so parse
+timings are representative. Deterministic: re-running rewrites identical files.
+
+Usage:
+    python fixtures/make_html_fixtures.py
+"""
+
+import os
+import random
+
+OUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "html")
+
+WORDS = ("Iran Israel strike missile IDF Tehran Hezbollah ceasefire reports officials "
+         "launch drone interception sources confirmed border military regional escalation "
+         "statement talks negotiators sanctions nuclear site satellite imagery Gaza Lebanon "
+         "Red Sea Houthis vessel navy air defense overnight briefing spokesperson").split()
+
+
+def sentence(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(n)).capitalize() + "."
+
+
+def head(rng: random.Random, title: str, scripts: int = 12, css_rules: int = 400) -> str:
+    css = "\n".join(f".c{i} {{ margin: {i % 7}px; color: #{rng.randrange(0xffffff):06x}; }}"
+                    for i in range(css_rules))
+    js = "\n".join(f'<script>window.__cfg{i} = {{"id": {i}, "flags": "{"x" * 200}"}};'
+                   f' if (a < b && c > d) {{ track("{i}"); }}</script>' for i in range(scripts))
+    metas = "\n".join(f'<meta name="m{i}" content="{sentence(rng, 8)}">' for i in range(30))
+    return (f"<!DOCTYPE html><html lang=\"en\"><head><meta charset=\"utf-8\"><title>{title}</title>\n"
+            f"{metas}\n<style>{css}</style>\n{js}\n</head>\n")
+
+
+def nav(rng: random.Random, links: int = 150) -> str:
+    items = "".join(f'<li class="menu-item"><a href="/section/{i}">{rng.choice(WORDS).title()} '
+                    f'{rng.choice(WORDS)}</a></li>' for i in range(links))
+    return f'<header class="site-header"><nav class="main-nav"><ul>{items}</ul></nav></header>\n'
+
+
+def footer(rng: random.Random) -> str:
+    cols = "".join(f'<div class="footer-col"><h4>{rng.choice(WORDS).title()}</h4><ul>'
+                   + "".join(f'<li><a href="/f/{i}/{j}">{sentence(rng, 3)}</a></li>' for j in range(12))
+                   + "</ul></div>" for i in range(8))
+    return f'<footer class="site-footer">{cols}</footer>\n'
+
+
+SVG = ('<svg viewBox="0 0 24 24" aria-hidden="true"><g><path d="M1.751 10c0-4.42 3.584-8 8.005-8h4.366'
+       'c4.49 0 8.129 3.64 8.129 8.13 0 2.96-1.607 5.68-4.196 7.11l-8.054 4.46v-3.69h-.067c-4.49.1-8.183'
+       '-3.51-8.183-8.01z"></path></g></svg>')
+
+
+def twitter_syndication(rng: random.Random) -> str:
+    tweets = []
+    for i in range(20):
+        text = sentence(rng, rng.randrange(12, 45))
+        tweets.append(
+            f'<li class="timeline-TweetList-tweet customisable-border">'
+            f'<div class="timeline-Tweet timeline-Tweet--isRetweet u-floatLeft" data-click-to-open-target="https://twitter.com/x/status/{9000 + i}">'
+            f'<div class="timeline-Tweet-brand u-floatRight">{SVG}</div>'
+            f'<div class="timeline-Tweet-author"><div class="TweetAuthor"><a class="TweetAuthor-link" href="https://twitter.com/sentdefender">'
+            f'<span class="TweetAuthor-avatar"><img class="Avatar" src="https://pbs.twimg.com/a{i}.jpg" alt=""></span>'
+            f'<span class="TweetAuthor-name">OSINTdefender</span> <span class="TweetAuthor-screenName">@sentdefender</span></a></div></div>'
+            f'<p class="timeline-Tweet-text" lang="en" dir="ltr">{text} <a href="https://t.co/{i:06x}" class="link customisable">t.co/{i:06x}</a></p>'
+            f'<div class="timeline-Tweet-metadata"><a class="timeline-Tweet-timestamp" href="https://twitter.com/x/status/{9000 + i}">'
+            f'<time class="dt-updated" datetime="2026-10-18T{12 - i % 12:02d}:{i:02d}:00+0000" title="Time posted">{18 - i % 5} Oct</time></a></div>'
+            f'<ul class="timeline-Tweet-actions">' + "".join(f'<li class="timeline-Tweet-action">{SVG}</li>' for _ in range(3)) + '</ul>'
+            f'</div></li>'
+        )
+    return (head(rng, "Twitter timeline", scripts=30) + '<body><div class="timeline-Widget">'
+            '<div class="timeline-Header">' + SVG * 5 + '</div><ol class="timeline-TweetList">'
+            + "".join(tweets) + '</ol></div>' + footer(rng) + '</body></html>')
+
+
+def nitter_profile(rng: random.Random) -> str:
+    items = []
+    for i in range(20):
+        pinned = '<div class="pinned"><span>' + SVG + 'Pinned Tweet</span></div>' if i == 0 else ""
+        text = sentence(rng, rng.randrange(10, 40))
+        items.append(
+            f'<div class="timeline-item " data-username="sentdefender">'
+            f'<a class="tweet-link" href="/sentdefender/status/{7000 + i}#m"></a><div class="tweet-body"><div>{pinned}'
+            f'<div class="tweet-header"><a class="tweet-avatar" href="/sentdefender"><img class="avatar round" src="/pic/a{i}.jpg" alt=""></a>'
+            f'<div class="tweet-name-row"><div class="fullname-and-username"><a class="fullname" href="/sentdefender" title="OSINTdefender">OSINTdefender</a>'
+            f'<a class="username" href="/sentdefender" title="@sentdefender">@sentdefender</a></div>'
+            f'<span class="tweet-date"><a href="/sentdefender/status/{7000 + i}#m" title="Oct 18, 2026 · {i % 12 + 1}:{i:02d} PM UTC">{i + 1}h</a></span></div></div></div>'
+            f'<div class="tweet-content media-body" dir="auto">{text} <a href="/search?q=%23Iran">#Iran</a></div>'
+            f'<div class="tweet-stats">' + "".join(f'<span class="tweet-stat"><div class="icon-container"><span class="icon-{k}"></span> {rng.randrange(10, 9000):,}</div></span>'
+                                                   for k in ("comment", "retweet", "quote", "heart", "views")) + '</div>'
+            f'</div></div>'
+        )
+    profile = ('<div class="profile-card"><div class="profile-card-info"><a class="profile-card-fullname" href="/sentdefender">OSINTdefender</a>'
+               f'<div class="profile-bio"><p>{sentence(rng, 30)}</p></div></div>'
+               + "".join(f'<li class="{k}"><span class="profile-stat-num">{rng.randrange(1000, 10**6):,}</span></li>' for k in ("tweets", "following", "followers", "likes"))
+               + '</div>' + '<div class="photo-rail-grid">' + "".join(f'<a href="/sentdefender/status/{i}#m"><img src="/pic/m{i}.jpg"></a>' for i in range(16)) + '</div>')
+    return (head(rng, "OSINTdefender (@sentdefender) | nitter", scripts=4, css_rules=900)
+            + '<body class="fixed-nav"><nav><div class="inner-nav"><a class="site-name" href="/">nitter</a>' + SVG * 8 + '</div></nav>'
+            + '<div class="container"><div class="profile-tabs">' + profile + '<div class="timeline">'
+            + "".join(items) + '<div class="show-more"><a href="?cursor=abc">Load more</a></div></div></div></div></body></html>')
+
+
+def toi_liveblog(rng: random.Random) -> str:
+    entries = []
+    for i in range(30):
+        paras = "".join(f"<p>{sentence(rng, rng.randrange(15, 40))}</p>" for _ in range(rng.randrange(1, 4)))
+        entries.append(
+            f'<div class="liveblog-entry" id="liveblog-entry-{3000000 + i}" data-id="{3000000 + i}">'
+            f'<div class="liveblog-date"><a href="/liveblog_entry/entry-{i}/"><span>{i} min ago</span>'
+            f'<time datetime="2026-10-18T{20 - i // 4:02d}:{(i * 7) % 60:02d}:00">{20 - i // 4}:{(i * 7) % 60:02d}</time></a></div>'
+            f'<div class="liveblog-paragraph"><h4><a href="/liveblog_entry/entry-{i}/">{sentence(rng, 10)}</a></h4>'
+            f'<div class="entry-content">{paras}</div>'
+            f'<div class="liveblog-share">' + SVG * 3 + '</div></div></div>'
+        )
+    sidebar = '<aside class="sidebar">' + "".join(
+        f'<div class="item"><a href="/story-{i}/"><img src="/img/{i}.jpg"><div class="headline">{sentence(rng, 9)}</div></a></div>'
+        for i in range(80)) + '</aside>'
+    ads = "".join(f'<div class="ad-slot" id="ad-{i}"><script>googletag.cmd.push(function() {{ googletag.display("ad-{i}"); }});</script></div>'
+                  for i in range(25))
+    return (head(rng, "Liveblog October 18, 2026 | The Times of Israel", scripts=40, css_rules=1200)
+            + '<body class="liveblog single">' + nav(rng, 250) + ads
+            + '<main><div class="liveblog-entries">' + "".join(entries) + '</div></main>' + sidebar + footer(rng) + '</body></html>')
+
+
+def think_tank_listing(rng: random.Random) -> str:
+    cards = []
+    for i in range(40):
+        section = "/analysis/" if i % 2 else "/research/middle-east/iran/"
+        slug = "-".join(rng.choice(WORDS).lower() for _ in range(6))
+        cards.append(
+            f'<article class="teaser"><div class="teaser__media"><a href="{section}{slug}"><img src="/i/{i}.jpg" alt=""></a></div>'
+            f'<div class="teaser__text"><span class="eyebrow"><a href="/topics/{i}">{rng.choice(WORDS).title()}</a></span>'
+            f'<h3 class="headline-md"><a href="{section}{slug}">{sentence(rng, rng.randrange(5, 12))}</a></h3>'
+            f'<p>{sentence(rng, 25)}</p><a href="{section}{slug}">Read more</a></div></article>'
+        )
+    return (head(rng, "Analysis | CSIS", scripts=20, css_rules=800) + '<body>' + nav(rng, 300)
+            + '<main><div class="views-listing">' + "".join(cards) + '</div></main>' + footer(rng) + '</body></html>')
+
+
+def think_tank_article(rng: random.Random) -> str:
+    paras = "".join(f"<p>{sentence(rng, rng.randrange(25, 60))}</p>" for _ in range(45))
+    related = "".join(f'<li><a href="/analysis/r{i}">{sentence(rng, 8)}</a></li>' for i in range(30))
+    return (head(rng, "Iran's Regional Strategy | FDD", scripts=25, css_rules=900) + '<body>' + nav(rng, 250)
+            + '<main><article class="post"><header class="post-header"><h1>Iran\'s Regional Strategy</h1></header>'
+            + '<div class="entry-content">' + paras + '<script>inlineAd();</script><aside class="pullquote">'
+            + sentence(rng, 20) + '</aside><form class="newsletter"><input name="email"></form></div></article>'
+            + f'<section class="related"><ul>{related}</ul></section></main>' + footer(rng) + '</body></html>')
+
+
+def twstalker_profile(rng: random.Random) -> str:
+    blocks = []
+    units = ["minutes", "hours", "hours", "days"]
+    for i in range(60):
+        author = "sentdefender" if i % 6 else "IntelCrab"  # every 6th is a retweet
+        body_kind = i % 9
+        if body_kind == 4:
+            text_html = ""  # media-only
+        elif body_kind == 7:
+            text_html = f'<p>{sentence(rng, 30)}<br>Footage shows launches 2 hours ago &amp; more</p>'
+        else:
+            text_html = (f'<p>{sentence(rng, rng.randrange(6, 40))} &amp; &#39;quoted&#39; '
+                         f'<a href="/hashtag/Iran">#Iran</a></p>'
+                         + (f'<p>https://t.co/{i:06x}</p>' if i % 3 == 0 else "")
+                         + (f'<p>{sentence(rng, 12)}</p>' if i % 4 == 0 else ""))
+        blocks.append(
+            f'<div class="activity-group1"><div class="user-status-item">'
+            f'<div class="user-avatar"><a href="/{author}"><img src="/img/{author}.jpg"></a></div>'
+            f'<div class="user-name"><a href="/{author}"><h4>{author.title()}</h4></a><span>@{author}</span>'
+            f'<a href="/{author}/status/{1840000000000000000 + i}"><span class="time">{i % 50 + 1} {units[i % 4]} ago</span></a></div>'
+            f'<div class="activity-descp">{text_html}</div>'
+            + (f'<style>.m{i} {{ width: 100%; }}</style>' if i % 5 == 0 else "")
+            + (f'<div class="media"><img src="/media/{i}.jpg"><script>lazy({i});</script></div>' if i % 2 else "")
+            + '<div class="like-comment-view">' + "".join(f'<div class="left">{SVG}<span>{rng.randrange(1, 9999):,}</span></div>' for _ in range(4))
+            + '</div></div></div>'
+        )
+    return (head(rng, "OSINTdefender (@sentdefender) Twitter | TwStalker", scripts=300, css_rules=6000)
+            + '<body>' + nav(rng, 200) + '<div class="profile-header"><h1>OSINTdefender</h1><p>' + sentence(rng, 30)
+            + '</p></div><div class="tweets">' + "".join(blocks) + '</div>' + footer(rng) + '</body></html>')
+
+
+def news_rss(rng: random.Random) -> str:
+    """Google News-style RSS: titles with " - Source", HTML descriptions."""
+    items = []
+    for i in range(100):
+        title = f"{sentence(rng, rng.randrange(6, 14))[:-1]} - {rng.choice(('Reuters', 'AP News', 'BBC', 'Al Jazeera'))}"
+        desc = (f'&lt;ol&gt;&lt;li&gt;&lt;a href="https://news.google.com/rss/articles/CBMi{i:08x}?oc=5" '
+                f'target="_blank"&gt;{sentence(rng, 10)}&lt;/a&gt;&amp;nbsp;&amp;nbsp;&lt;font color="#6f6f6f"&gt;'
+                f'Reuters&lt;/font&gt;&lt;/li&gt;&lt;li&gt;{sentence(rng, rng.randrange(20, 50))}&lt;/li&gt;&lt;/ol&gt;')
+        items.append(f"<item><title>{title}</title><link>https://news.google.com/rss/articles/CBMi{i:08x}?oc=5</link>"
+                     f'<guid isPermaLink="false">CBMi{i:08x}</guid>'
+                     f"<pubDate>Sun, 18 Oct 2026 {23 - i % 24:02d}:{i % 60:02d}:00 GMT</pubDate>"
+                     f"<description>{desc}</description><source url=\"https://www.reuters.com\">Reuters</source></item>")
+    return ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?><rss version="2.0" '
+            'xmlns:media="http://search.yahoo.com/mrss/"><channel><generator>NFE/5.0</generator>'
+            '<title>"Israel Iran" - Google News</title><link>https://news.google.com/search?q=Israel+Iran</link>'
+            '<language>en-US</language><description>Google News</description>'
+            + "".join(items) + "</channel></rss>")
+
+
+def ai_bullets(rng: random.Random) -> str:
+    """A 2-hour AI summary in the bullet format the regular prompt asks for."""
+    categories = ("Military", "Diplomatic", "Political", "Breaking", "Strategic")
+    lines = [f"- [{rng.choice(categories)}] {rng.choice(('Fri', 'Sat'))} {rng.randrange(1, 13)}:{rng.randrange(60):02d} "
+             f"{rng.choice(('AM', 'PM'))} - {sentence(rng, rng.randrange(12, 30))}" for _ in range(8)]
+    return "\n".join(lines + ["", "[Market Signal] Odds unchanged."])
+
+
+FIXTURES = {
+    "twitter_syndication.html": twitter_syndication,
+    "nitter_profile.html": nitter_profile,
+    "toi_liveblog.html": toi_liveblog,
+    "think_tank_listing.html": think_tank_listing,
+    "think_tank_article.html": think_tank_article,
+    "twstalker_profile.html": twstalker_profile,
+    "news_rss.xml": news_rss,
+    "ai_bullets.txt": ai_bullets,
+}
+
+
+if __name__ == "__main__":
+    os.makedirs(OUT_DIR, exist_ok=True)
+    for name, build in FIXTURES.items():
+        html = build(random.Random(name))
+        with open(os.path.join(OUT_DIR, name), "w") as f:
+            f.write(html)
+        print(f"{name}: {len(html) / 1024:.0f} KiB")
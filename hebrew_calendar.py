@@ -0,0 +1,195 @@
+"""
+Shabbos Situation Monitor - Offline Hebrew Calendar
+
+Computes Hebrew dates, Yom Tov days and candle-lighting/havdalah events
+locally, so Yom Tov detection never depends on the Hebcal API.
+
+Arithmetic follows the fixed-calendar rules from Dershowitz & Reingold,
+"Calendrical Calculations" (molad of Tishrei + dechiyot). Fixed day numbers
+("RD") are the same as Python's date.toordinal().
+
+Events are emitted in the same shape as Hebcal's JSON items
+({"title", "date", "category"}) so they plug straight into the window
+logic in server.py.
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Tuple
+
+# Month numbers (Nisan = 1 ... Adar = 12, Adar II = 13 in leap years)
+NISAN, IYYAR, SIVAN, TAMMUZ, AV, ELUL = 1, 2, 3, 4, 5, 6
+TISHREI, HESHVAN, KISLEV, TEVET, SHEVAT, ADAR, ADAR_II = 7, 8, 9, 10, 11, 12, 13
+
+MONTH_NAMES = {
+    NISAN: "Nisan", IYYAR: "Iyyar", SIVAN: "Sivan", TAMMUZ: "Tamuz", AV: "Av",
+    ELUL: "Elul", TISHREI: "Tishrei", HESHVAN: "Cheshvan", KISLEV: "Kislev",
+    TEVET: "Tevet", SHEVAT: "Sh'vat", ADAR: "Adar", ADAR_II: "Adar II",
+}
+
+_HEBREW_EPOCH = -1373427  # RD of 1 Tishrei AM 1
+
+
+# ============ HEBREW DATE ARITHMETIC ============
+
+def is_leap_year(year: int) -> bool:
+    """Leap years (13 months) are years 3, 6, 8, 11, 14, 17, 19 of the Metonic cycle."""
+    return (7 * year + 1) % 19 < 7
+
+
+def _last_month(year: int) -> int:
+    return ADAR_II if is_leap_year(year) else ADAR
+
+
+def _elapsed_days(year: int) -> int:
+    """Days from the epoch to the molad of Tishrei, with the lo ADU rosh delay."""
+    months = (235 * year - 234) // 19
+    parts = 12084 + 13753 * months
+    days = 29 * months + parts // 25920
+    return days + 1 if (3 * (days + 1)) % 7 < 3 else days
+
+
+def _year_length_correction(year: int) -> int:
+    """Extra delay keeping year lengths within 353-355 / 383-385 days."""
+    ny0, ny1, ny2 = _elapsed_days(year - 1), _elapsed_days(year), _elapsed_days(year + 1)
+    if ny2 - ny1 == 356:
+        return 2
+    if ny1 - ny0 == 382:
+        return 1
+    return 0
+
+
+def _new_year(year: int) -> int:
+    """RD of 1 Tishrei of `year`."""
+    return _HEBREW_EPOCH + _elapsed_days(year) + _year_length_correction(year)
+
+
+def days_in_year(year: int) -> int:
+    return _new_year(year + 1) - _new_year(year)
+
+
+def days_in_month(year: int, month: int) -> int:
+    length = days_in_year(year)
+    if month in (IYYAR, TAMMUZ, ELUL, TEVET, ADAR_II):
+        return 29
+    if month == ADAR and not is_leap_year(year):
+        return 29
+    if month == HESHVAN and length % 10 != 5:   # Cheshvan is long only in 355/385-day years
+        return 29
+    if month == KISLEV and length % 10 == 3:    # Kislev is short only in 353/383-day years
+        return 29
+    return 30
+
+
+def to_gregorian(year: int, month: int, day: int) -> date:
+    """Convert a Hebrew date to a Gregorian date."""
+    rd = _new_year(year) + day - 1
+    if month < TISHREI:
+        rd += sum(days_in_month(year, m) for m in range(TISHREI, _last_month(year) + 1))
+        rd += sum(days_in_month(year, m) for m in range(NISAN, month))
+    else:
+        rd += sum(days_in_month(year, m) for m in range(TISHREI, month))
+    return date.fromordinal(rd)
+
+
+def from_gregorian(d: date) -> Tuple[int, int, int]:
+    """Convert a Gregorian date to a (year, month, day) Hebrew date."""
+    rd = d.toordinal()
+    year = (rd - _HEBREW_EPOCH) * 98496 // 35975351  # approximate, never too late
+    while _new_year(year + 1) <= rd:
+        year += 1
+    start = TISHREI if rd < to_gregorian(year, NISAN, 1).toordinal() else NISAN
+    month = start
+    while rd > to_gregorian(year, month, days_in_month(year, month)).toordinal():
+        month += 1
+    return year, month, rd - to_gregorian(year, month, 1).toordinal() + 1
+
+
+def format_hebrew_date(d: date) -> str:
+    """e.g. "15 Nisan 5786"."""
+    year, month, day = from_gregorian(d)
+    name = MONTH_NAMES[month]
+    if month == ADAR and is_leap_year(year):
+        name = "Adar I"
+    return f"{day} {name} {year}"
+
+
+# ============ YOM TOV ============
+
+def yom_tov_days(year: int, israel: bool = False) -> Dict[date, str]:
+    """Return {gregorian_date: Hebcal-style title} for the Yom Tov days of a
+    Hebrew year (Rosh Hashana through Shavuot). Only days on which melacha is
+    prohibited are included — no Erev, Chol HaMoed or minor holidays.
+
+    Diaspora observes a second day of Sukkot, Pesach (start and end) and
+    Shavuot, and Simchat Torah after Shmini Atzeret; Israel does not.
+    """
+    days = {
+        to_gregorian(year, TISHREI, 1): f"Rosh Hashana {year}",
+        to_gregorian(year, TISHREI, 2): "Rosh Hashana II",
+        to_gregorian(year, TISHREI, 10): "Yom Kippur",
+        to_gregorian(year, TISHREI, 15): "Sukkot I",
+        to_gregorian(year, TISHREI, 22): "Shmini Atzeret",
+        to_gregorian(year, NISAN, 15): "Pesach I",
+        to_gregorian(year, NISAN, 21): "Pesach VII",
+        to_gregorian(year, SIVAN, 6): "Shavuot" if israel else "Shavuot I",
+    }
+    if not israel:
+        days.update({
+            to_gregorian(year, TISHREI, 16): "Sukkot II",
+            to_gregorian(year, TISHREI, 23): "Simchat Torah",
+            to_gregorian(year, NISAN, 16): "Pesach II",
+            to_gregorian(year, NISAN, 22): "Pesach VIII",
+            to_gregorian(year, SIVAN, 7): "Shavuot II",
+        })
+    return days
+
+
+def calendar_events(
+    start: date,
+    end: date,
+    sunset: Callable[[date], datetime],
+    candle_offset: int,
+    havdalah_offset: int,
+    israel: bool = False,
+) -> List[Dict]:
+    """Build Hebcal-shaped holiday/candles/havdalah events for [start, end].
+
+    Args:
+        sunset: returns the tz-aware sunset for a civil date at the location.
+        candle_offset: minutes before sunset for candle lighting.
+        havdalah_offset: minutes after sunset for havdalah (also used for
+            lighting on a second night of Yom Tov, after nightfall).
+    """
+    holidays: Dict[date, str] = {}
+    for year in range(from_gregorian(start)[0] - 1, from_gregorian(end)[0] + 1):
+        holidays.update(yom_tov_days(year, israel))
+
+    def restricted(d: date) -> bool:
+        return d.weekday() == 5 or d in holidays
+
+    events = []
+    d = start
+    while d <= end:
+        if d in holidays:
+            events.append({"title": holidays[d], "date": d.isoformat(), "category": "holiday"})
+
+        tomorrow = d + timedelta(days=1)
+        if restricted(tomorrow):
+            if restricted(d) and tomorrow.weekday() != 5:
+                # Second night of Yom Tov (or Shabbos → Yom Tov): light after nightfall
+                lighting = sunset(d) + timedelta(minutes=havdalah_offset)
+            else:
+                lighting = sunset(d) - timedelta(minutes=candle_offset)
+            events.append({
+                "title": "Candle lighting",
+                "date": lighting.isoformat(timespec="seconds"),
+                "category": "candles",
+            })
+        elif restricted(d):
+            events.append({
+                "title": "Havdalah",
+                "date": (sunset(d) + timedelta(minutes=havdalah_offset)).isoformat(timespec="seconds"),
+                "category": "havdalah",
+            })
+        d = tomorrow
+    return events
@@ -0,0 +1,200 @@
+"""
+Shabbos Situation Monitor - Log Pipeline
+
+Log records leave the calling thread through a queue: the server logger's
+only handler is a QueueHandler, and a background QueueListener owns the
+console and rotating-file handlers. A fetch or a page render pays for
+putting a record on a queue, never for formatting it or for disk I/O.
+
+Two filters run on the calling thread before a record is queued:
+
+- ContextFilter stamps the record with the current cycle (trace) id and
+  span id from tracing, so log lines can be matched to /debug/cycles.
+- RateLimitFilter caps repetitive INFO messages. Messages that differ only
+  in an @handle, a number or a URL ("Fetching @x...", "Got 12 tweets from
+  @y via nitter") share a key; each key gets `limit` records per `window`
+  seconds, and the next record let through notes how many were dropped
+  (on the queued copy, so other handlers see the message unchanged).
+
+With json_format the file log is one JSON object per line (time, level,
+message, thread, cycle, span); the console stays human-readable text.
+"""
+
+import atexit
+import copy
+import json
+import logging
+import queue
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Optional, Tuple
+
+import tracing
+
+TEXT_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# What varies between otherwise identical messages: URLs, @handles, numbers
+_VARYING = re.compile(r'https?://\S+|@\w+|\d+(?:\.\d+)?')
+
+_listeners: Dict[str, QueueListener] = {}  # logger name → its listener
+_listener_lock = threading.Lock()
+_exc_formatter = logging.Formatter()
+
+
+class ContextFilter(logging.Filter):
+    """Attach the cycle and span ids of the logging thread (None outside a cycle)."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.cycle, record.span = tracing.current_ids()
+        return True
+
+
+class RateLimitFilter(logging.Filter):
+    """Let through at most `limit` similar records per `window` seconds.
+
+    Only records at or below `max_level` are limited — warnings and errors
+    always get through. A limit of 0 disables the filter. The record is not
+    modified beyond its `suppressed` attribute: how many similar records were
+    dropped before it (see _QueueHandler.prepare).
+    """
+
+    MAX_KEYS = 1000
+
+    def __init__(self, limit: int, window: float, max_level: int = logging.INFO):
+        super().__init__()
+        self.limit = limit
+        self.window = window
+        self.max_level = max_level
+        self._windows: Dict[Tuple[int, str], List] = {}  # key → [window start, sent, suppressed]
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.suppressed = 0
+        if self.limit <= 0 or record.levelno > self.max_level:
+            return True
+        key = (record.levelno, _VARYING.sub('#', record.getMessage()))
+        now = time.monotonic()
+        with self._lock:
+            state = self._windows.get(key)
+            if state is None:
+                if len(self._windows) >= self.MAX_KEYS:
+                    self._prune(now)
+                state = self._windows[key] = [now, 0, 0]
+            elif now - state[0] >= self.window:
+                state[0], state[1] = now, 0
+            if state[1] >= self.limit:
+                state[2] += 1
+                return False
+            state[1] += 1
+            record.suppressed, state[2] = state[2], 0
+        return True
+
+    def _prune(self, now: float) -> None:
+        for key, (start, _, suppressed) in list(self._windows.items()):
+            if now - start >= self.window and not suppressed:
+                del self._windows[key]
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record, with the cycle and span ids from ContextFilter."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+            "cycle": getattr(record, "cycle", None),
+            "span": getattr(record, "span", None),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class _QueueHandler(QueueHandler):
+    """Merge args and render the traceback on the calling thread, keeping them apart.
+
+    The stock prepare() folds the traceback into the message, which would
+    leave nothing for JsonFormatter's "exception" field. The copy also gets
+    RateLimitFilter's count of suppressed similar records.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        if getattr(record, "suppressed", 0):
+            record.message = f"{record.message} (+{record.suppressed} similar suppressed)"
+        record.msg, record.args = record.message, None
+        if record.exc_info:
+            record.exc_text = _exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def configure(logger: logging.Logger, console: Optional[logging.Handler], file: Optional[logging.Handler],
+              json_format: bool = False, rate_limit: int = 0, rate_window: float = 60) -> QueueHandler:
+    """Route `logger` through a queue to `console` and `file` on a listener thread.
+
+    Replaces any handlers already on `logger` (and a listener started for it
+    earlier), closing them. Returns the QueueHandler now attached to it.
+    """
+    handlers = [h for h in (console, file) if h is not None]
+    if console is not None:
+        console.setFormatter(logging.Formatter(TEXT_FORMAT))
+    if file is not None:
+        file.setFormatter(JsonFormatter() if json_format else logging.Formatter(TEXT_FORMAT))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = _QueueHandler(log_queue)
+    queue_handler.addFilter(RateLimitFilter(rate_limit, rate_window))
+    queue_handler.addFilter(ContextFilter())
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    with _listener_lock:
+        previous = _listeners.pop(logger.name, None)
+        if previous is not None:
+            _drain(previous)
+            for handler in previous.handlers:
+                handler.close()
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            handler.close()
+        logger.addHandler(queue_handler)
+        _listeners[logger.name] = listener
+        listener.start()
+    return queue_handler
+
+
+def flush() -> None:
+    """Write out everything queued so far and keep listening (e.g. before os._exit)."""
+    with _listener_lock:
+        for listener in _listeners.values():
+            _drain(listener)
+            listener.start()
+
+
+def stop() -> None:
+    """Write out everything queued so far and stop listening (safe to call twice)."""
+    with _listener_lock:
+        for listener in _listeners.values():
+            _drain(listener)
+        _listeners.clear()
+
+
+def _drain(listener: QueueListener) -> None:
+    listener.stop()  # returns once the queue is empty
+    for handler in listener.handlers:
+        try:
+            handler.flush()
+        except (OSError, ValueError):  # stream already closed (e.g. at interpreter exit)
+            pass
+
+
+atexit.register(stop)
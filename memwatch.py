@@ -0,0 +1,160 @@
+"""
+Shabbos Situation Monitor - Memory Watch
+
+Periodic memory snapshots for long (multi-day Yom Tov) runs: process RSS
+and, when tracemalloc is on, the source lines holding the most allocated
+memory. Snapshots are kept in a bounded in-memory ring and appended, one
+JSON line each, to a size-capped rotating log. `diff(older, newer)` shows
+which lines grew between two of them (served at /debug/memory).
+
+The server compares each snapshot's RSS with two ceilings from config.py:
+above the soft one it trims its caches, above the hard one it saves state
+and exits with RESTART_EXIT_CODE, which start.sh treats as a planned
+restart rather than a crash.
+"""
+
+import itertools
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+from logging.handlers import RotatingFileHandler
+from typing import Dict, List, Optional, Tuple
+
+RESTART_EXIT_CODE = 75  # EX_TEMPFAIL: "try again" — a planned restart, not a crash
+
+_ids = itertools.count(1)
+_ring: deque = deque(maxlen=96)
+_ring_lock = threading.Lock()
+_log = logging.getLogger("memwatch")
+_log.propagate = False  # snapshots go to their own log, not server.log
+
+
+class MemorySnapshot:
+    __slots__ = ("id", "taken_at", "rss_mib", "traced_mib", "lines")
+
+    def __init__(self, rss_mib: Optional[float], traced_mib: Optional[float],
+                 lines: Dict[str, Tuple[float, int]]):
+        self.id = next(_ids)
+        self.taken_at = time.time()
+        self.rss_mib = rss_mib
+        self.traced_mib = traced_mib
+        self.lines = lines  # "file:line" → (KiB, allocation count), largest first
+
+    def to_dict(self, top: int = 10) -> Dict:
+        return {
+            "id": self.id,
+            "taken_at": round(self.taken_at, 3),
+            "rss_mib": self.rss_mib,
+            "traced_mib": self.traced_mib,
+            "top": [{"line": line, "kib": kib, "count": count}
+                    for line, (kib, count) in itertools.islice(self.lines.items(), top)],
+        }
+
+
+def configure(ring_size: int, log_file: Optional[str], log_max_bytes: int, trace_frames: int) -> None:
+    """Set the ring size and log file, and start tracemalloc if `trace_frames` > 0."""
+    global _ring
+    with _ring_lock:
+        _ring = deque(_ring, maxlen=ring_size)
+    for handler in list(_log.handlers):
+        _log.removeHandler(handler)
+        handler.close()
+    if log_file:
+        # One backup: the log never exceeds 2 × log_max_bytes on disk
+        handler = RotatingFileHandler(log_file, maxBytes=log_max_bytes, backupCount=1)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        _log.addHandler(handler)
+        _log.setLevel(logging.INFO)
+    if trace_frames > 0 and not tracemalloc.is_tracing():
+        tracemalloc.start(trace_frames)
+
+
+def rss_mib() -> Optional[float]:
+    """Current resident set size in MiB (None if it can't be read)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return round(int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20, 1)
+    except (OSError, ValueError, IndexError):
+        pass
+    # macOS and other systems without /proc: ask ps (KiB)
+    try:
+        out = subprocess.run(["ps", "-o", "rss=", "-p", str(os.getpid())],
+                             capture_output=True, text=True, timeout=5).stdout
+        return round(int(out.strip()) / 1024, 1)
+    except (OSError, ValueError, subprocess.SubprocessError):
+        return None
+
+
+def take(top: int = 200) -> MemorySnapshot:
+    """Record a snapshot (RSS, plus the `top` largest allocating lines when tracing)."""
+    traced_mib = None
+    lines: Dict[str, Tuple[float, int]] = {}
+    if tracemalloc.is_tracing():
+        traced_mib = round(tracemalloc.get_traced_memory()[0] / 2**20, 1)
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+        for stat in snapshot.statistics("lineno")[:top]:
+            frame = stat.traceback[0]
+            lines[f"{_short_path(frame.filename)}:{frame.lineno}"] = (round(stat.size / 1024, 1), stat.count)
+    snap = MemorySnapshot(rss_mib(), traced_mib, lines)
+    with _ring_lock:
+        _ring.append(snap)
+    if _log.handlers:
+        _log.info(json.dumps(snap.to_dict(top=25)))
+    return snap
+
+
+def _short_path(filename: str) -> str:
+    """Paths relative to the project or to site-packages, which is what a reader wants."""
+    for prefix in (os.path.dirname(os.path.abspath(__file__)), *sys.path[1:]):
+        if prefix and filename.startswith(prefix + os.sep):
+            return filename[len(prefix) + 1:]
+    return filename
+
+
+def recent() -> List[MemorySnapshot]:
+    """Kept snapshots, oldest first."""
+    with _ring_lock:
+        return list(_ring)
+
+
+def find(snapshot_id: int) -> Optional[MemorySnapshot]:
+    for snap in recent():
+        if snap.id == snapshot_id:
+            return snap
+    return None
+
+
+def diff(older: MemorySnapshot, newer: MemorySnapshot, top: int = 25) -> Dict:
+    """What grew (or shrank) from `older` to `newer`, largest change first.
+
+    Each snapshot keeps only its largest lines, so a line missing from one
+    side counts as zero there — small allocators can appear to jump in or out.
+    """
+    def delta(a: Optional[float], b: Optional[float]) -> Optional[float]:
+        return round(b - a, 1) if a is not None and b is not None else None
+
+    changes = []
+    for line in older.lines.keys() | newer.lines.keys():
+        old_kib, old_count = older.lines.get(line, (0.0, 0))
+        new_kib, new_count = newer.lines.get(line, (0.0, 0))
+        if new_kib != old_kib:
+            changes.append({"line": line, "kib": new_kib, "kib_delta": round(new_kib - old_kib, 1),
+                            "count_delta": new_count - old_count})
+    changes.sort(key=lambda c: abs(c["kib_delta"]), reverse=True)
+    return {
+        "from": older.to_dict(top=0),
+        "to": newer.to_dict(top=0),
+        "seconds": round(newer.taken_at - older.taken_at, 1),
+        "rss_mib_delta": delta(older.rss_mib, newer.rss_mib),
+        "traced_mib_delta": delta(older.traced_mib, newer.traced_mib),
+        "lines": changes[:top],
+    }
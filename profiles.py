@@ -0,0 +1,131 @@
+"""
+Shabbos Situation Monitor - Profiles
+
+One process can serve dashboards for several communities. The default
+profile is config.py itself, served at /. Each entry in config.PROFILES
+adds a profile served at /p/<name>/, overriding any of PROFILE_SETTINGS:
+location and candle-lighting offsets, which OSINT accounts are shown, the
+AI prompts, the page title.
+
+Upstream feeds are fetched once for all profiles (the OSINT fetcher covers
+every profile's accounts). What differs per profile is computed from the
+shared feeds: the calendar (get_shabbos_times and Yom Tov windows at its
+location), which accounts its dashboard shows, and its AI summaries, which
+are kept in a feed of their own (`ai_feed`).
+
+The active profile lives in a ContextVar, like the current span (tracing)
+and the current deadline (deadlines): a request to /p/<name>/ or a
+scheduler job runs inside `use(profile)`, and code that depends on the
+profile asks `current()`. Outside of `use()` the default profile is active.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Mapping, Optional
+from zoneinfo import ZoneInfo
+
+DEFAULT = "default"
+AI_FEED = "ai_summary"  # the default profile's AI feed; others use "ai_summary@<name>"
+
+# config.py settings a profile may override
+PROFILE_SETTINGS = (
+    "TITLE",
+    "LOCATION_LAT", "LOCATION_LON", "LOCATION_TZ",
+    "CANDLE_LIGHTING_OFFSET", "HAVDALAH_OFFSET", "YOM_TOV_ISRAEL",
+    "TWITTER_ACCOUNTS",
+    "AI_SUMMARY_MORNING_PROMPT", "AI_SUMMARY_REGULAR_PROMPT", "AI_SUMMARY_CANDLE_LIGHTING_PROMPT",
+)
+
+
+class Profile:
+    __slots__ = ("name", "title", "lat", "lon", "tz", "tzinfo", "candle_lighting_offset", "havdalah_offset",
+                 "israel", "accounts", "morning_prompt", "regular_prompt", "candle_lighting_prompt",
+                 "ai_feed", "base_path")
+
+    def __init__(self, name: str, settings: Mapping):
+        self.name = name
+        self.title = settings["TITLE"]
+        self.lat = settings["LOCATION_LAT"]
+        self.lon = settings["LOCATION_LON"]
+        self.tz = settings["LOCATION_TZ"]
+        self.tzinfo = ZoneInfo(self.tz)
+        self.candle_lighting_offset = settings["CANDLE_LIGHTING_OFFSET"]
+        self.havdalah_offset = settings["HAVDALAH_OFFSET"]
+        self.israel = settings["YOM_TOV_ISRAEL"]
+        # None: config.TWITTER_ACCOUNTS as the server sees it at fetch time
+        accounts = settings.get("TWITTER_ACCOUNTS")
+        self.accounts = tuple(accounts) if accounts is not None else None
+        self.morning_prompt = settings["AI_SUMMARY_MORNING_PROMPT"]
+        self.regular_prompt = settings["AI_SUMMARY_REGULAR_PROMPT"]
+        self.candle_lighting_prompt = settings["AI_SUMMARY_CANDLE_LIGHTING_PROMPT"]
+        self.ai_feed = AI_FEED if name == DEFAULT else f"{AI_FEED}@{name}"
+        self.base_path = "" if name == DEFAULT else f"/p/{name}"
+
+    def __repr__(self) -> str:
+        return f"Profile({self.name!r})"
+
+
+_profiles: Dict[str, Profile] = {}
+_current: ContextVar[Optional[Profile]] = ContextVar("profile", default=None)
+
+
+def configure(defaults: Mapping, overrides: Mapping[str, Mapping]) -> None:
+    """Build the default profile from `defaults` (config.py values, without
+    TWITTER_ACCOUNTS) and one profile per `overrides` entry."""
+    global _profiles
+    built = {DEFAULT: Profile(DEFAULT, defaults)}
+    for name, settings in overrides.items():
+        unknown = set(settings) - set(PROFILE_SETTINGS)
+        if unknown:
+            raise ValueError(f"Profile {name!r}: unknown settings {', '.join(sorted(unknown))}")
+        if name == DEFAULT or not name.isidentifier():
+            raise ValueError(f"Profile name {name!r} is reserved or not a plain name")
+        built[name] = Profile(name, {**defaults, **settings})
+    _profiles = built
+
+
+def get(name: str) -> Optional[Profile]:
+    return _profiles.get(name)
+
+
+def default() -> Profile:
+    return _profiles[DEFAULT]
+
+
+def all_profiles() -> List[Profile]:
+    """Every profile, the default first."""
+    return list(_profiles.values())
+
+
+def extra_profiles() -> List[Profile]:
+    """Profiles beyond the default (empty in a single-dashboard setup)."""
+    return [p for name, p in _profiles.items() if name != DEFAULT]
+
+
+def current() -> Profile:
+    return _current.get() or _profiles[DEFAULT]
+
+
+@contextmanager
+def use(profile: Profile):
+    """Make `profile` the active one for the block (and work it starts in copied contexts)."""
+    token = _current.set(profile)
+    try:
+        yield profile
+    finally:
+        _current.reset(token)
+
+
+def activate(profile: Profile):
+    """Make `profile` active until deactivate(token) — for request hooks, where a
+    `with` block can't span the request."""
+    return _current.set(profile)
+
+
+def deactivate(token) -> None:
+    _current.reset(token)
+
+
+def is_ai_feed(feed: str) -> bool:
+    return feed == AI_FEED or feed.startswith(AI_FEED + "@")
+
@@ -0,0 +1,130 @@
+"""
+Shabbos Situation Monitor - Upstream Record / Replay
+
+Captures every upstream response an update cycle receives (status, headers,
+body, latency) into a fixture store, and serves them back through the same
+request layer so a cycle can run offline and reproducibly — for
+`python bench.py cycle`, `python test_server.py --replay`, or the whole
+server with UPSTREAM_REPLAY set in config.py.
+
+A store is one gzipped JSON file: {url: [response, ...]}. A URL fetched
+several times in one recorded cycle keeps every response, and replay hands
+them out in the same order (wrapping around), rewound per cycle.
+"""
+
+import base64
+import gzip
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# Describe the decoded body we store, not the wire format it arrived in
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "set-cookie"}
+
+
+class FixtureStore:
+    """Recorded responses keyed by URL."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.responses: Dict[str, List[Dict]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: str) -> "FixtureStore":
+        store = cls(path)
+        with gzip.open(path, "rt") as f:
+            store.responses = json.load(f)["responses"]
+        return store
+
+    def add(self, url: str, status: int, headers: Dict[str, str], body: bytes, latency: float) -> None:
+        entry = {
+            "status": status,
+            "headers": {k: v for k, v in headers.items() if k.lower() not in _DROPPED_HEADERS},
+            "body": base64.b64encode(body).decode("ascii"),
+            "latency": round(latency, 4),
+        }
+        with self._lock:
+            self.responses.setdefault(url, []).append(entry)
+
+    def save(self) -> None:
+        """Write atomically (temp file + rename), like the feed cache."""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt") as f:
+            with self._lock:
+                json.dump({"recorded_at": time.time(), "responses": self.responses}, f)
+        os.replace(tmp_path, self.path)
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self.responses.values())
+
+
+class Recorder:
+    """Adds every response passed to `record()` to a store."""
+
+    def __init__(self, store: FixtureStore):
+        self.store = store
+
+    def record(self, url: str, status: int, headers: Dict[str, str], body: bytes, latency: float) -> None:
+        self.store.add(url, status, headers, body, latency)
+
+
+class Replayer:
+    """Serves a store's responses in recorded order, sleeping the recorded
+    latency times `latency_scale` (0 replays as fast as possible)."""
+
+    def __init__(self, store: FixtureStore, latency_scale: float = 1.0):
+        self.store = store
+        self.latency_scale = latency_scale
+        self.misses: List[str] = []
+        self._next: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def rewind(self) -> None:
+        """Start handing out each URL's responses from the first again (per cycle)."""
+        with self._lock:
+            self._next.clear()
+
+    def entry(self, url: str) -> Optional[Dict]:
+        entries = self.store.responses.get(url)
+        if not entries:
+            with self._lock:
+                self.misses.append(url)
+            return None
+        with self._lock:
+            index = self._next.get(url, 0)
+            self._next[url] = index + 1
+        entry = entries[index % len(entries)]
+        if self.latency_scale:
+            time.sleep(entry["latency"] * self.latency_scale)
+        return entry
+
+    def response(self, url: str) -> requests.Response:
+        """The next recorded response for `url` as a requests.Response.
+
+        Raises requests.ConnectionError for URLs that were never recorded,
+        which fetchers already treat as an unreachable upstream.
+        """
+        entry = self.entry(url)
+        if entry is None:
+            raise requests.ConnectionError(f"No recorded response for {url}")
+        response = requests.Response()
+        response.url = url
+        response.status_code = entry["status"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = base64.b64decode(entry["body"])
+        return response
+
+    @staticmethod
+    def body(entry: Dict) -> bytes:
+        return base64.b64decode(entry["body"])
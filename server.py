@@ -8,19 +8,34 @@ Run with: python server.py
 Or use: ./start.sh
 """
 
+import gc
+import gzip
+import hashlib
 import json
 import logging
 import os
 import subprocess
+import sys
 import tempfile
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import date, datetime, timedelta
+import traceback
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from contextvars import copy_context
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache, wraps
 from logging.handlers import RotatingFileHandler
-from typing import Dict, List, Optional
+from operator import attrgetter
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlsplit
 from email.utils import parsedate_to_datetime
 from html import unescape
+from html.entities import html5 as _HTML5_ENTITIES
+from html.parser import HTMLParser
 from zoneinfo import ZoneInfo
 import re
 
@@ -30,11 +45,21 @@ _twstalker_semaphore = threading.Semaphore(2)
 from astral import LocationInfo
 from astral.sun import sun
 
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, abort, g, render_template, jsonify, request
 from apscheduler.schedulers.background import BackgroundScheduler
 import requests
 import feedparser
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+import deadlines
+import hebrew_calendar
+import logpipe
+import memwatch
+import metrics
+import profiles
+import replay
+import sync
+import tracing
 
 # Conditional import: anthropic SDK is optional (graceful degradation)
 try:
@@ -43,6 +68,28 @@ try:
 except ImportError:
     HAS_ANTHROPIC = False
 
+# Optional C-backed tree builder: lxml parses large pages several times faster
+# than the pure-Python html.parser (which remains the fallback)
+try:
+    import lxml  # noqa: F401
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+# Optional brotli: static assets are also stored brotli-compressed when available
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+# bs4 >= 4.13 restricts parsing through ElementFilter; older versions call a
+# SoupStrainer name function with (name, attrs) during parsing instead
+try:
+    from bs4.filter import ElementFilter
+except ImportError:
+    ElementFilter = None
+
 # Load .env file if present (so API key doesn't need terminal export)
 _env_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
 if os.path.exists(_env_path):
@@ -65,11 +112,12 @@ ai_summary_enabled = False  # Off by default — toggle on via dashboard to avoi
 # Inactivity tracking: auto-pause AI summaries if nobody views the dashboard
 _last_dashboard_view = None  # Set when someone loads the dashboard
 
-# Candle lighting summary dedup: stores the Friday date of the last generated summary
-_last_candle_lighting_summary_date = None
+# Candle lighting summary dedup: profile name → date of its last generated summary
+_last_candle_lighting_summary_date: Dict[str, date] = {}
 
 from config import (
     HOST, PORT, DEBUG, REFRESH_INTERVAL, REFRESH_INTERVAL_YOM_TOV,
+    CYCLE_TIMEOUT, WATCHDOG_INTERVAL, WATCHDOG_STALE_FACTOR, WATCHDOG_FEED_CADENCE, FETCHER_HUNG_AFTER,
     TWITTER_ACCOUNTS, TRUMP_TRUTH_RSS, TRUMP_TWITTER_MIRROR,
     REUTERS_MIDEAST_RSS, REUTERS_FALLBACK_RSS,
     NITTER_INSTANCES, NITTER_TIMEOUT, TOI_RSS_URL, TOI_LIVEBLOG_URL,
@@ -80,36 +128,49 @@ from config import (
     TWSTALKER_BASE, TWSTALKER_TIMEOUT,
     MAX_ITEMS_PER_FEED, NEWS_FEED_MAX_AGE_HOURS, OSINT_MAX_AGE_HOURS, REQUEST_TIMEOUT,
     LOCATION_LAT, LOCATION_LON, LOCATION_TZ,
-    CANDLE_LIGHTING_OFFSET, HAVDALAH_OFFSET,
-    CACHE_FILE, CACHE_MAX_AGE,
+    CANDLE_LIGHTING_OFFSET, HAVDALAH_OFFSET, YOM_TOV_ISRAEL, HEBCAL_CROSS_CHECK, PROFILES,
+    CACHE_FILE, CACHE_MAX_AGE, TRACE_RING_SIZE, TRACE_FILE,
+    LOG_JSON, LOG_RATE_LIMIT, LOG_RATE_WINDOW,
+    UPSTREAM_RECORD, UPSTREAM_REPLAY, UPSTREAM_LATENCY_SCALE,
+    ROLE, LEADER_URL, SNAPSHOT_POLL_INTERVAL, SNAPSHOT_TIMEOUT, SNAPSHOT_FILE,
+    MEMORY_SNAPSHOT_INTERVAL, MEMORY_SNAPSHOT_RING, MEMORY_LOG, MEMORY_LOG_MAX_BYTES,
+    MEMORY_TRACEMALLOC_FRAMES, MEMORY_SOFT_LIMIT_MIB, MEMORY_HARD_LIMIT_MIB,
     AI_SUMMARY_MAX_TOKENS,
     AI_SUMMARY_MORNING_HOUR, AI_SUMMARY_REGULAR_HOURS, AI_SUMMARY_QUIET_HOURS,
     AI_SUMMARY_MORNING_MODEL, AI_SUMMARY_REGULAR_MODEL,
     AI_SUMMARY_MORNING_PROMPT, AI_SUMMARY_REGULAR_PROMPT,
     AI_SUMMARY_RETENTION_DAYS, AI_SUMMARY_MAX_ENTRIES, AI_INACTIVITY_TIMEOUT,
+    AI_MODEL_PRICES, AI_USAGE_RETENTION_DAYS,
     THINK_TANK_FEEDS, THINK_TANK_MAX_AGE_HOURS,
-    THINK_TANK_SUMMARIZE, THINK_TANK_SUMMARY_MAX_NEW,
+    THINK_TANK_SUMMARIZE, THINK_TANK_SUMMARY_MAX_NEW, ARTICLE_SUMMARY_CACHE_MAX,
     POLYMARKET_API_BASE, POLYMARKET_TIMEOUT, PREDICTION_MARKETS,
     AI_SUMMARY_MARKET_THRESHOLD, AI_SUMMARY_CANDLE_LIGHTING_PROMPT,
     OIL_TICKER, OIL_FETCH_TIMEOUT,
     YOM_TOV_END,
 )
 
-# Setup logging with rotation
+# Setup logging with rotation. Records are queued and written by a listener
+# thread (logpipe), so log I/O never runs on a fetch or request thread.
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-_log_fmt = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
 
-_console_handler = logging.StreamHandler()
-_console_handler.setFormatter(_log_fmt)
-logger.addHandler(_console_handler)
 
-_file_handler = RotatingFileHandler(
-    'server.log', maxBytes=50 * 1024 * 1024, backupCount=5
-)
-_file_handler.setFormatter(_log_fmt)
-logger.addHandler(_file_handler)
+def configure_logging(log_file: str = 'server.log') -> None:
+    """Log to the console and a rotating `log_file`, through logpipe's queue."""
+    logpipe.configure(
+        logger,
+        console=logging.StreamHandler(),
+        file=RotatingFileHandler(log_file, maxBytes=50 * 1024 * 1024, backupCount=5),
+        json_format=LOG_JSON,
+        rate_limit=LOG_RATE_LIMIT,
+        rate_window=LOG_RATE_WINDOW,
+    )
+
+
+configure_logging()
+
+tracing.configure(TRACE_RING_SIZE, TRACE_FILE)
 
 # Log anthropic SDK status
 if not HAS_ANTHROPIC:
@@ -129,23 +190,449 @@ def friendly_date_filter(date_str):
         return date_str
 
 
-# Global cache for all feeds
-cache: Dict = {
-    "twitter_list": {"items": [], "last_updated": None, "error": None},
-    "trump": {"items": [], "last_updated": None, "error": None},
-    "reuters": {"items": [], "last_updated": None, "error": None},
-    "toi_liveblog": {"items": [], "last_updated": None, "error": None},
-    "think_tanks": {"items": [], "last_updated": None, "error": None},
-    "prediction_markets": {"items": [], "last_updated": None, "error": None},
-    "ai_summary": {
-        "items": [],
-        "last_updated": None,
-        "error": None,
-        "summaries": [],          # Accumulated summary blocks (morning + 2-hour)
-        "morning_summary": None,  # Latest morning summary (multi-paragraph, displayed specially)
-    },
+# ============ METRICS ============
+# Exported in the Prometheus text format at /metrics (see metrics.py).
+
+CYCLE_DURATION = metrics.Histogram(
+    "shabbos_cycle_duration_seconds", "Wall time of a full feed update cycle")
+FETCHER_DURATION = metrics.Histogram(
+    "shabbos_fetcher_duration_seconds", "Wall time of one fetcher run", ["fetcher"])
+FETCHER_RUNS = metrics.Counter(
+    "shabbos_fetcher_runs_total",
+    "Fetcher runs by outcome (ok, error = published an error, exception)", ["fetcher", "outcome"])
+FETCHER_TIMEOUTS = metrics.Counter(
+    "shabbos_fetcher_timeouts_total", "Fetchers still running when the cycle timed out", ["fetcher"])
+DEADLINE_SKIPS = metrics.Counter(
+    "shabbos_deadline_skips_total",
+    "Requests and fallbacks skipped because the cycle's time budget was spent", ["stage"])
+FETCHER_HUNG = metrics.Counter(
+    "shabbos_fetcher_hung_total", "Fetcher runs the watchdog found running past FETCHER_HUNG_AFTER", ["fetcher"])
+WATCHDOG_RECOVERIES = metrics.Counter(
+    "shabbos_watchdog_recoveries_total", "Fetchers re-run by the watchdog for a stale feed", ["fetcher"])
+OSINT_METHOD_DURATION = metrics.Histogram(
+    "shabbos_osint_method_duration_seconds", "Wall time of one OSINT fallback method attempt", ["method"])
+OSINT_METHOD_ATTEMPTS = metrics.Counter(
+    "shabbos_osint_method_attempts_total",
+    "OSINT fallback method attempts by result (items, empty, error)", ["method", "result"])
+NITTER_ATTEMPTS = metrics.Counter(
+    "shabbos_nitter_attempts_total", "Nitter instance attempts by result", ["instance", "result"])
+HTTP_DURATION = metrics.Histogram(
+    "shabbos_http_request_duration_seconds", "Upstream request latency", ["host"])
+HTTP_REQUESTS = metrics.Counter(
+    "shabbos_http_requests_total", "Upstream requests by status (HTTP code, curl or error)", ["host", "status"])
+HTTP_BYTES = metrics.Counter(
+    "shabbos_http_response_bytes_total", "Response body bytes downloaded", ["host"])
+RATE_LIMITED = metrics.Counter(
+    "shabbos_rate_limited_total", "429 responses from upstream", ["host"])
+BACKOFFS = metrics.Counter(
+    "shabbos_backoffs_total", "Rate-limit backoffs started", ["feed"])
+BACKOFF_SKIPS = metrics.Counter(
+    "shabbos_backoff_skips_total", "Fetches skipped while a backoff was active", ["feed"])
+AI_DURATION = metrics.Histogram(
+    "shabbos_ai_request_duration_seconds", "Anthropic API call latency", ["model"])
+AI_REQUESTS = metrics.Counter(
+    "shabbos_ai_requests_total", "Anthropic API calls by outcome", ["model", "outcome"])
+AI_TOKENS = metrics.Counter(
+    "shabbos_ai_tokens_total",
+    "Tokens used by Anthropic API calls (input, output, cache_read, cache_write)", ["model", "direction"])
+RENDER_DURATION = metrics.Histogram(
+    "shabbos_dashboard_render_seconds", "Dashboard render time (page or SSE sections)", ["kind"])
+SNAPSHOT_SERVED = metrics.Counter(
+    "shabbos_snapshot_served_total", "Leader snapshots served to followers (ok, not_modified)", ["status"])
+SNAPSHOT_PULLS = metrics.Counter(
+    "shabbos_snapshot_pulls_total", "Follower pulls from the leader (updated, unchanged, error)", ["result"])
+
+
+# ============ UPSTREAM RECORD / REPLAY ============
+# Every upstream response goes through http_get(), the TwStalker curl call
+# or create_ai_message(). In record mode each response is also captured into
+# a fixture store (saved after every cycle); in replay mode it is served from
+# one instead of the network. See replay.py.
+
+_recorder: Optional[replay.Recorder] = None
+_replayer: Optional[replay.Replayer] = None
+
+
+def set_upstream_mode(record: Optional[str] = None, replay_from: Optional[str] = None,
+                      latency_scale: float = 1.0) -> None:
+    """Record upstream responses to `record`, replay them from `replay_from`,
+    or (neither) go back to the network."""
+    global _recorder, _replayer
+    _recorder = replay.Recorder(replay.FixtureStore(record)) if record else None
+    _replayer = replay.Replayer(replay.FixtureStore.load(replay_from), latency_scale) if replay_from else None
+    if record:
+        logger.info(f"Recording upstream responses to {record}")
+    if replay_from:
+        logger.info(f"Replaying upstream responses from {replay_from} "
+                    f"({len(_replayer.store)} responses, latency x{latency_scale})")
+
+
+def _ai_fixture_key(kwargs: Dict) -> str:
+    request_body = json.dumps([kwargs.get("system"), kwargs.get("messages")], sort_keys=True)
+    return f"anthropic:{kwargs['model']}:{hashlib.blake2b(request_body.encode(), digest_size=12).hexdigest()}"
+
+
+def _record_http(host: str, status: str, size: int, seconds: float) -> None:
+    HTTP_DURATION.observe(seconds, host=host)
+    HTTP_REQUESTS.inc(host=host, status=status)
+    if size:
+        HTTP_BYTES.inc(size, host=host)
+    if status == "429":
+        RATE_LIMITED.inc(host=host)
+
+
+def http_get(url: str, **kwargs) -> requests.Response:
+    """requests.get, recorded in the per-host request, byte and latency metrics.
+
+    The timeout is cut to the current deadline; with no budget left the
+    request isn't made (DeadlineExceeded).
+    """
+    host = urlsplit(url).hostname or ""
+    try:
+        kwargs["timeout"] = deadlines.timeout(kwargs.get("timeout", REQUEST_TIMEOUT))
+    except deadlines.DeadlineExceeded:
+        DEADLINE_SKIPS.inc(stage="request")
+        raise
+    with tracing.span("http", host=host) as sp:
+        start = time.perf_counter()
+        try:
+            response = _replayer.response(url) if _replayer else requests.get(url, **kwargs)
+        except Exception:
+            _record_http(host, "error", 0, time.perf_counter() - start)
+            raise
+        latency = time.perf_counter() - start
+        _record_http(host, str(response.status_code), len(response.content), latency)
+        if _recorder:
+            _recorder.record(url, response.status_code, dict(response.headers), response.content, latency)
+        if sp:
+            sp.set(status=response.status_code, bytes=len(response.content))
+        return response
+
+
+def create_ai_message(client, summary_type: str = "other", attempt: int = 0, **kwargs):
+    """client.messages.create(**kwargs), recorded in the AI latency and token
+    metrics and in the usage accounting under `summary_type` (`attempt` > 0
+    counts as a retry)."""
+    model = kwargs["model"]
+    if deadlines.remaining() is not None:
+        kwargs["timeout"] = deadlines.timeout(kwargs.get("timeout", 600))  # SDK default is 10 min
+    with tracing.span("ai", model=model, summary_type=summary_type) as sp:
+        start = time.perf_counter()
+        try:
+            with AI_DURATION.time(model=model):
+                message = _create_message(client, kwargs)
+        except Exception:
+            AI_REQUESTS.inc(model=model, outcome="error")
+            _record_ai_usage(summary_type, model, attempt, time.perf_counter() - start, None)
+            raise
+        AI_REQUESTS.inc(model=model, outcome="ok")
+        usage = getattr(message, "usage", None)
+        _record_ai_usage(summary_type, model, attempt, time.perf_counter() - start,
+                         usage if usage is not None else SimpleNamespace())
+        if usage is not None:
+            AI_TOKENS.inc(usage.input_tokens or 0, model=model, direction="input")
+            AI_TOKENS.inc(usage.output_tokens or 0, model=model, direction="output")
+            AI_TOKENS.inc(getattr(usage, "cache_read_input_tokens", 0) or 0, model=model, direction="cache_read")
+            AI_TOKENS.inc(getattr(usage, "cache_creation_input_tokens", 0) or 0, model=model, direction="cache_write")
+            if sp:
+                sp.set(input_tokens=usage.input_tokens, output_tokens=usage.output_tokens)
+        return message
+
+
+def _create_message(client, kwargs: Dict):
+    """client.messages.create, or its recorded reply when replaying."""
+    if _replayer:
+        entry = _replayer.entry(_ai_fixture_key(kwargs))
+        if entry is None:
+            raise ConnectionError(f"No recorded {kwargs['model']} reply")
+        usage = SimpleNamespace(**{k: int(v) for k, v in entry["headers"].items()})
+        return SimpleNamespace(content=[SimpleNamespace(text=replay.Replayer.body(entry).decode())], usage=usage)
+    start = time.perf_counter()
+    message = client.messages.create(**kwargs)
+    if _recorder:
+        usage = {"input_tokens": str(message.usage.input_tokens), "output_tokens": str(message.usage.output_tokens)}
+        _recorder.record(_ai_fixture_key(kwargs), 200, usage, message.content[0].text.encode(),
+                         time.perf_counter() - start)
+    return message
+
+
+# ============ AI USAGE ACCOUNTING ============
+# Every create_ai_message() call is added to per-day (ET) totals, split by
+# summary type and model: calls, errors, retries, tokens (input, output,
+# cache reads/writes), latency and estimated cost. Persisted with the feed
+# cache and served at /api/ai-usage.
+
+_AI_USAGE_FIELDS = ("calls", "errors", "retries", "input_tokens", "output_tokens",
+                    "cache_read_tokens", "cache_write_tokens", "latency_s", "latency_max_s")
+_ai_usage: Dict[str, Dict[str, Dict[str, Dict[str, float]]]] = {}  # day → summary type → model → totals
+_ai_usage_lock = threading.Lock()
+
+
+def _record_ai_usage(summary_type: str, model: str, attempt: int, latency: float, usage) -> None:
+    """Add one call to today's totals (`usage` is None when the call failed)."""
+    day = datetime.now(ZoneInfo("America/New_York")).strftime("%Y-%m-%d")
+    with _ai_usage_lock:
+        totals = _ai_usage.setdefault(day, {}).setdefault(summary_type, {}).setdefault(
+            model, dict.fromkeys(_AI_USAGE_FIELDS, 0))
+        totals["calls"] += 1
+        totals["retries"] += 1 if attempt else 0
+        totals["latency_s"] = round(totals["latency_s"] + latency, 3)
+        totals["latency_max_s"] = round(max(totals["latency_max_s"], latency), 3)
+        if usage is None:
+            totals["errors"] += 1
+        else:
+            totals["input_tokens"] += getattr(usage, "input_tokens", 0) or 0
+            totals["output_tokens"] += getattr(usage, "output_tokens", 0) or 0
+            totals["cache_read_tokens"] += getattr(usage, "cache_read_input_tokens", 0) or 0
+            totals["cache_write_tokens"] += getattr(usage, "cache_creation_input_tokens", 0) or 0
+        for old_day in sorted(_ai_usage)[:-AI_USAGE_RETENTION_DAYS]:
+            del _ai_usage[old_day]
+
+
+def _ai_usage_copy(days: Optional[int] = None) -> Dict:
+    """A copy of the totals for the last `days` days (all kept days if None)."""
+    with _ai_usage_lock:
+        kept = sorted(_ai_usage.items())[-days:] if days else sorted(_ai_usage.items())
+        return {day: {summary_type: {model: dict(totals) for model, totals in models.items()}
+                      for summary_type, models in types.items()}
+                for day, types in kept}
+
+
+def _ai_cost_usd(model: str, totals: Dict) -> Optional[float]:
+    """Estimated cost from AI_MODEL_PRICES (None for models without a price)."""
+    prices = AI_MODEL_PRICES.get(model)
+    if not prices:
+        return None
+    per_token = {field: prices[price] / 1e6 for field, price in (
+        ("input_tokens", "input"), ("output_tokens", "output"),
+        ("cache_read_tokens", "cache_read"), ("cache_write_tokens", "cache_write"))}
+    return round(sum(totals[field] * rate for field, rate in per_token.items()), 4)
+
+
+def _ai_usage_rollup(rows: List[Dict]) -> Dict:
+    """Sum per-model totals (each with a "cost_usd") into one row."""
+    rollup = dict.fromkeys(_AI_USAGE_FIELDS, 0)
+    costs = []
+    for row in rows:
+        for field in _AI_USAGE_FIELDS:
+            rollup[field] = max(rollup[field], row[field]) if field == "latency_max_s" else rollup[field] + row[field]
+        costs.append(row["cost_usd"])
+    rollup["latency_s"] = round(rollup["latency_s"], 3)
+    successful = rollup["calls"] - rollup["errors"]
+    rollup["mean_latency_s"] = round(rollup["latency_s"] / rollup["calls"], 3) if rollup["calls"] else None
+    rollup["mean_output_tokens"] = round(rollup["output_tokens"] / successful) if successful else None
+    known = [cost for cost in costs if cost is not None]
+    rollup["cost_usd"] = round(sum(known), 4) if known else None
+    return rollup
+
+
+def ai_usage_report(days: int) -> Dict:
+    """Daily rollups (newest first) for the last `days` days, each broken down by
+    summary type and model, plus totals over the period."""
+    recent = _ai_usage_copy(days)
+    report_days = []
+    all_rows = []
+    for day, types in sorted(recent.items(), reverse=True):
+        by_type = {}
+        day_rows = []
+        for summary_type, models in sorted(types.items()):
+            rows = [{**totals, "cost_usd": _ai_cost_usd(model, totals)} for model, totals in models.items()]
+            by_type[summary_type] = {
+                **_ai_usage_rollup(rows),
+                "models": {model: _ai_usage_rollup([row]) for model, row in zip(models, rows)},
+            }
+            day_rows.extend(rows)
+        all_rows.extend(day_rows)
+        report_days.append({"date": day, **_ai_usage_rollup(day_rows), "by_type": by_type})
+    return {"days": report_days, "totals": _ai_usage_rollup(all_rows)}
+
+
+# ============ FEED CACHE (copy-on-write snapshots) ============
+# `cache` always refers to an immutable Snapshot of every feed. Nothing
+# modifies a snapshot: writers call publish(), which builds the next one
+# (copying only the feeds that changed), tags it with the next generation
+# and swaps the module-level reference. A reader that takes `snap = cache`
+# once sees one consistent state, without locks, for as long as it holds it.
+
+
+class Snapshot(Mapping):
+    """Every feed's state at one generation.
+
+    Each feed state is a read-only mapping whose list values (items,
+    summaries) are tuples. FeedItems and summary dicts are shared between
+    snapshots and must not be modified once published (see FeedItem.replace).
+    """
+
+    __slots__ = ("_feeds", "generation")
+
+    def __init__(self, feeds: Dict[str, Mapping], generation: int):
+        self._feeds = feeds
+        self.generation = generation
+
+    def __getitem__(self, feed: str) -> Mapping:
+        return self._feeds[feed]
+
+    def __iter__(self):
+        return iter(self._feeds)
+
+    def __len__(self) -> int:
+        return len(self._feeds)
+
+
+def _freeze_feed(state: Dict) -> Mapping:
+    return MappingProxyType({key: tuple(value) if isinstance(value, list) else value
+                             for key, value in state.items()})
+
+
+_EMPTY_AI_FEED = {
+    "items": [],
+    "last_updated": None,
+    "error": None,
+    "summaries": [],          # Accumulated summary blocks (morning + 2-hour)
+    "morning_summary": None,  # Latest morning summary (multi-paragraph, displayed specially)
 }
 
+cache: Snapshot = Snapshot({
+    "twitter_list": _freeze_feed({"items": [], "last_updated": None, "error": None}),
+    "trump": _freeze_feed({"items": [], "last_updated": None, "error": None}),
+    "reuters": _freeze_feed({"items": [], "last_updated": None, "error": None}),
+    "toi_liveblog": _freeze_feed({"items": [], "last_updated": None, "error": None}),
+    "think_tanks": _freeze_feed({"items": [], "last_updated": None, "error": None}),
+    "prediction_markets": _freeze_feed({"items": [], "last_updated": None, "error": None}),
+    # Each profile of PROFILES adds its own "ai_summary@<name>" (see configure_profiles)
+    "ai_summary": _freeze_feed(_EMPTY_AI_FEED),
+}, generation=0)
+
+# Serializes publishers and wakes readers waiting for a new generation
+_cache_published = threading.Condition()
+
+
+def publish_feeds(changes: Dict[str, Dict]) -> Snapshot:
+    """Publish new state for several feeds at once: {feed: {field: value}}.
+
+    Each feed's fields are merged over its current state. The new snapshot
+    replaces `cache` atomically, with the next generation number.
+    """
+    global cache
+    with _cache_published:
+        feeds = dict(cache._feeds)
+        for feed, fields in changes.items():
+            feeds[feed] = _freeze_feed({**feeds[feed], **fields})
+        cache = Snapshot(feeds, cache.generation + 1)
+        _cache_published.notify_all()
+        return cache
+
+
+def publish(feed: str, **fields) -> Snapshot:
+    """Publish `feed` with `fields` replaced, e.g. publish("reuters", items=..., error=None)."""
+    return publish_feeds({feed: fields})
+
+
+def bump_generation() -> int:
+    """Start a new generation without changing any feed (for state outside the
+    cache that the page shows, like the AI toggle)."""
+    return publish_feeds({}).generation
+
+
+def wait_for_generation(seen: int, timeout: float) -> int:
+    """Block until a generation after `seen` is published or `timeout` seconds
+    pass; return the current generation."""
+    with _cache_published:
+        _cache_published.wait_for(lambda: cache.generation != seen, timeout)
+        return cache.generation
+
+
+# ============ PROFILE VIEWS ============
+# A profile's dashboard and AI digest read the shared snapshot through a
+# ProfileView: its own AI feed appears as "ai_summary" (other profiles' AI
+# feeds are hidden), and "twitter_list" keeps only the accounts it shows.
+# With no PROFILES configured the snapshot is used as it is.
+
+
+class ProfileView(Mapping):
+    """`snap` as `profile` sees it (same generation)."""
+
+    __slots__ = ("_snap", "_profile", "generation")
+
+    def __init__(self, snap: Snapshot, profile: "profiles.Profile"):
+        self._snap = snap
+        self._profile = profile
+        self.generation = snap.generation
+
+    def __getitem__(self, feed: str) -> Mapping:
+        if feed == profiles.AI_FEED:
+            return self._snap[self._profile.ai_feed]
+        if profiles.is_ai_feed(feed):
+            raise KeyError(feed)
+        if feed == "twitter_list":
+            return _profile_twitter_feed(self._snap[feed], self._profile)
+        return self._snap[feed]
+
+    def __iter__(self):
+        return (feed for feed in self._snap if feed == profiles.AI_FEED or not profiles.is_ai_feed(feed))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+# profile name → (shared twitter_list state, the profile's filtered state)
+_profile_twitter_feeds: Dict[str, tuple] = {}
+
+
+def _profile_twitter_feed(feed: Mapping, profile: "profiles.Profile") -> Mapping:
+    """`feed` without posts from accounts `profile` doesn't show, cut to
+    MAX_ITEMS_PER_FEED; filtered once per published state."""
+    memo = _profile_twitter_feeds.get(profile.name)
+    if memo is not None and memo[0] is feed:
+        return memo[1]
+    shown = set(profile_accounts(profile))
+    hidden = {account.lower() for account in fetched_twitter_accounts() if account not in shown}
+    view = _freeze_feed({
+        **feed,
+        "items": [item for item in feed["items"] if (item.author or "").lower() not in hidden][:MAX_ITEMS_PER_FEED],
+        "account_status": {account: ok for account, ok in (feed.get("account_status") or {}).items()
+                           if account in shown},
+    })
+    _profile_twitter_feeds[profile.name] = (feed, view)
+    return view
+
+
+def profile_view(snap: Snapshot) -> Mapping:
+    """`snap` as the active profile sees it."""
+    if not profiles.extra_profiles():
+        return snap
+    return ProfileView(snap, profiles.current())
+
+
+def configure_profiles(overrides: Dict[str, Dict]) -> None:
+    """Set up the profiles (config.py's own plus `overrides`, i.e. PROFILES)
+    and give each an AI feed of its own; AI feeds of profiles no longer
+    configured are dropped. Starts a new generation, so every page is
+    rendered again."""
+    global cache
+    profiles.configure({
+        "TITLE": "Shabbos Situation Monitor",
+        "LOCATION_LAT": LOCATION_LAT, "LOCATION_LON": LOCATION_LON, "LOCATION_TZ": LOCATION_TZ,
+        "CANDLE_LIGHTING_OFFSET": CANDLE_LIGHTING_OFFSET, "HAVDALAH_OFFSET": HAVDALAH_OFFSET,
+        "YOM_TOV_ISRAEL": YOM_TOV_ISRAEL,
+        "AI_SUMMARY_MORNING_PROMPT": AI_SUMMARY_MORNING_PROMPT,
+        "AI_SUMMARY_REGULAR_PROMPT": AI_SUMMARY_REGULAR_PROMPT,
+        "AI_SUMMARY_CANDLE_LIGHTING_PROMPT": AI_SUMMARY_CANDLE_LIGHTING_PROMPT,
+    }, overrides)
+    wanted = {profile.ai_feed for profile in profiles.all_profiles()}
+    _profile_twitter_feeds.clear()
+    with _cache_published:
+        feeds = {feed: state for feed, state in cache._feeds.items()
+                 if not profiles.is_ai_feed(feed) or feed in wanted}
+        for feed in wanted - feeds.keys():
+            feeds[feed] = _freeze_feed(_EMPTY_AI_FEED)
+        cache = Snapshot(feeds, cache.generation + 1)
+        _cache_published.notify_all()
+
+
+# Dashboards served by this process: config.py's own at /, each of PROFILES at /p/<name>/
+configure_profiles(PROFILES)
+
 
 # ============ CACHE PERSISTENCE ============
 
@@ -156,18 +643,7 @@ def save_cache_to_disk() -> None:
     corrupted files if the process is killed mid-write.
     """
     try:
-        serializable = {}
-        for feed_name, feed_data in cache.items():
-            entry = {
-                "items": feed_data["items"],
-                "last_updated": feed_data["last_updated"].isoformat() if feed_data["last_updated"] else None,
-                "error": feed_data["error"],
-            }
-            # AI summary has extra fields to persist
-            if feed_name == "ai_summary":
-                entry["summaries"] = feed_data.get("summaries", [])
-                entry["morning_summary"] = feed_data.get("morning_summary")
-            serializable[feed_name] = entry
+        serializable = {feed_name: _serialize_feed(feed_name, feed_data) for feed_name, feed_data in cache.items()}
         # Build backoff state for persistence across crash-restarts
         backoff_state = {
             "toi_backoff_until": _toi_backoff_until.isoformat() if _toi_backoff_until else None,
@@ -186,11 +662,13 @@ def save_cache_to_disk() -> None:
             with os.fdopen(fd, "w") as f:
                 json.dump({
                     "saved_at": datetime.now().isoformat(),
-                    "schema_version": 1,
+                    "schema_version": 2,
+                    "item_fields": list(FeedItem.FIELDS),
                     "feeds": serializable,
                     "backoff_state": backoff_state,
-                "ai_summary_enabled": ai_summary_enabled,
-                "article_summary_cache": dict(_article_summary_cache),
+                    "ai_summary_enabled": ai_summary_enabled,
+                    "article_summary_cache": dict(_article_summary_cache),
+                    "ai_usage": _ai_usage_copy(),
                 }, f)
             os.replace(tmp_path, CACHE_FILE)
         except Exception:
@@ -205,6 +683,23 @@ def save_cache_to_disk() -> None:
         logger.warning(f"Failed to save cache to disk: {e}")
 
 
+def _serialize_feed(feed_name: str, feed_data: Mapping) -> Dict:
+    """`feed_data` as JSON-ready fields: FeedItems as rows, last_updated as ISO."""
+    items = feed_data["items"]
+    if feed_name in _FEED_ITEM_FEEDS:
+        items = [item.to_row() for item in items]
+    entry = {
+        "items": items,
+        "last_updated": feed_data["last_updated"].isoformat() if feed_data["last_updated"] else None,
+        "error": feed_data["error"],
+    }
+    # AI summary has extra fields to persist
+    if profiles.is_ai_feed(feed_name):
+        entry["summaries"] = feed_data.get("summaries", [])
+        entry["morning_summary"] = feed_data.get("morning_summary")
+    return entry
+
+
 def load_cache_from_disk() -> bool:
     """Load cached feed data from disk on startup.
 
@@ -231,31 +726,44 @@ def load_cache_from_disk() -> bool:
 
         feeds = data.get("feeds", {})
         loaded_count = 0
+        restored = {}  # feed → fields, published together at the end
 
-        # --- Phase 1: Always restore AI summaries (independent retention) ---
-        ai_data = feeds.get("ai_summary", {})
-        if "ai_summary" in cache and (ai_data.get("items") or ai_data.get("summaries")):
-            cache["ai_summary"]["items"] = ai_data.get("items", [])
-            cache["ai_summary"]["error"] = ai_data.get("error")
+        # --- Phase 1: Always restore AI summaries (independent retention), every profile's ---
+        for ai_feed in filter(profiles.is_ai_feed, cache):
+            ai_data = feeds.get(ai_feed, {})
+            if not (ai_data.get("items") or ai_data.get("summaries")):
+                continue
+            restored[ai_feed] = {
+                "items": ai_data.get("items", []),
+                "error": ai_data.get("error"),
+                "summaries": ai_data.get("summaries", []),
+                "morning_summary": ai_data.get("morning_summary"),
+            }
             if ai_data.get("last_updated"):
-                cache["ai_summary"]["last_updated"] = datetime.fromisoformat(ai_data["last_updated"])
-            cache["ai_summary"]["summaries"] = ai_data.get("summaries", [])
-            cache["ai_summary"]["morning_summary"] = ai_data.get("morning_summary")
+                restored[ai_feed]["last_updated"] = datetime.fromisoformat(ai_data["last_updated"])
             loaded_count += 1
 
         # --- Phase 1: Always restore article summary cache (expensive API calls) ---
         persisted_summaries = data.get("article_summary_cache", {})
-        if persisted_summaries:
-            _article_summary_cache.update(persisted_summaries)
+        for url, summary in persisted_summaries.items():
+            _remember_article_summary(url, summary)
+        # Decode FeedItem rows (schema 2) or legacy dict items (schema 1)
+        item_fields = data.get("item_fields")
+        for feed_name in _FEED_ITEM_FEEDS:
+            if feeds.get(feed_name, {}).get("items"):
+                feeds[feed_name]["items"] = _decode_feed_items(feeds[feed_name]["items"], item_fields)
         # Also restore from think tank items if present
         for item in feeds.get("think_tanks", {}).get("items", []):
-            url = item.get("link", "")
-            summary = item.get("summary", "")
-            if url and summary:
-                _article_summary_cache[url] = summary
+            if item.link and item.summary:
+                _remember_article_summary(item.link, item.summary)
         if _article_summary_cache:
             logger.info(f"Restored {len(_article_summary_cache)} article summaries from disk cache")
 
+        # --- Phase 1: Always restore AI usage accounting (days of history) ---
+        with _ai_usage_lock:
+            for day, types in data.get("ai_usage", {}).items():
+                _ai_usage.setdefault(day, types)
+
         # --- Phase 1: Always restore backoff state and AI toggle ---
         _restore_backoff_state(data)
         global ai_summary_enabled
@@ -266,17 +774,19 @@ def load_cache_from_disk() -> bool:
         # --- Phase 2: Only load feed items if cache is fresh ---
         if feeds_fresh:
             for feed_name, feed_data in feeds.items():
-                if feed_name == "ai_summary":
+                if profiles.is_ai_feed(feed_name):
                     continue  # Already handled in Phase 1
                 if feed_name in cache and feed_data.get("items"):
-                    cache[feed_name]["items"] = feed_data["items"]
-                    cache[feed_name]["error"] = feed_data.get("error")
+                    restored[feed_name] = {"items": feed_data["items"], "error": feed_data.get("error")}
                     if feed_data.get("last_updated"):
-                        cache[feed_name]["last_updated"] = datetime.fromisoformat(feed_data["last_updated"])
+                        restored[feed_name]["last_updated"] = datetime.fromisoformat(feed_data["last_updated"])
                     loaded_count += 1
 
+        publish_feeds(restored)
         # Prune AI summaries outside the retention window
-        _prune_old_summaries()
+        for profile in profiles.all_profiles():
+            with profiles.use(profile):
+                _prune_old_summaries()
         logger.info(f"Loaded {loaded_count} feeds from disk cache ({age/60:.1f}m old)")
         return loaded_count > 0
     except (FileNotFoundError, json.JSONDecodeError, KeyError, ValueError) as e:
@@ -284,6 +794,20 @@ def load_cache_from_disk() -> bool:
         return False
 
 
+def _decode_feed_items(items: list, item_fields: Optional[list]) -> List["FeedItem"]:
+    """Rebuild FeedItems from persisted rows, or from dicts in older cache files.
+
+    Rows are positional. If the file recorded a different field order
+    (`item_fields`) they are mapped by name; with no recorded order they are
+    taken to be in the current FIELDS order.
+    """
+    if items and isinstance(items[0], dict):
+        return [FeedItem.from_dict(item) for item in items]
+    if not item_fields or item_fields == list(FeedItem.FIELDS):
+        return [FeedItem.from_row(row) for row in items]
+    return [FeedItem.from_dict(dict(zip(item_fields, row))) for row in items]
+
+
 def _restore_backoff_state(data: dict) -> None:
     """Restore backoff globals from persisted cache state.
 
@@ -324,7 +848,120 @@ def _restore_backoff_state(data: dict) -> None:
         logger.info(f"Restored active backoff state: {', '.join(restored)}")
 
 
+# ============ LEADER / FOLLOWER SYNC ============
+# A leader serves the whole cache as a snapshot (see sync.py), encoded once
+# per generation; a follower publishes each snapshot it pulls into its own
+# cache and renders it like any other. Feeds keep the leader's last_updated,
+# so a follower's stale badges show how current the leader is.
+
+_BOOT_ID = os.urandom(4).hex()  # versions from a restarted leader never repeat the last run's
+_snapshot_blob = {"version": None, "gzip": b""}
+_snapshot_lock = threading.Lock()
+_follower: Optional[sync.Follower] = None  # set when running as a follower
+_leader_ai: Optional[Dict] = None          # follower: the leader's AI availability, for the page
+
+
+def snapshot_version(snap: Snapshot = None) -> str:
+    return f"{_BOOT_ID}-{(snap or cache).generation}"
+
+
+def snapshot_payload(snap: Snapshot) -> Dict:
+    """Everything a follower shows: every feed of `snap` (all profiles') and the AI state."""
+    has_anthropic, has_api_key = _ai_availability()
+    return {
+        "snapshot_schema": sync.SCHEMA_VERSION,
+        "version": snapshot_version(snap),
+        "generated_at": datetime.now().isoformat(),
+        "item_fields": list(FeedItem.FIELDS),
+        "feeds": {feed_name: _serialize_feed(feed_name, feed_data) for feed_name, feed_data in snap.items()},
+        "ai": {"enabled": ai_summary_enabled, "has_anthropic": has_anthropic, "has_api_key": has_api_key},
+    }
+
+
+def snapshot_blob() -> tuple:
+    """(version, gzip-compressed payload) of the current cache, encoded once per generation."""
+    snap = cache
+    version = snapshot_version(snap)
+    with _snapshot_lock:
+        if _snapshot_blob["version"] != version:
+            _snapshot_blob["gzip"] = sync.encode(snapshot_payload(snap))
+            _snapshot_blob["version"] = version
+        return version, _snapshot_blob["gzip"]
+
+
+def apply_snapshot(payload: Dict) -> None:
+    """Publish a leader's snapshot as this process's cache (follower).
+
+    Feeds this process doesn't serve (AI feeds of profiles it isn't
+    configured with) are skipped.
+    """
+    global ai_summary_enabled, _leader_ai
+    item_fields = payload.get("item_fields")
+    changes = {}
+    for feed_name, feed_data in payload["feeds"].items():
+        if feed_name not in cache:
+            continue
+        fields = dict(feed_data)
+        if feed_name in _FEED_ITEM_FEEDS:
+            fields["items"] = _decode_feed_items(fields.get("items", []), item_fields)
+        if fields.get("last_updated"):
+            fields["last_updated"] = datetime.fromisoformat(fields["last_updated"])
+        changes[feed_name] = fields
+    ai = payload.get("ai", {})
+    ai_summary_enabled = bool(ai.get("enabled"))
+    _leader_ai = {"has_anthropic": bool(ai.get("has_anthropic")), "has_api_key": bool(ai.get("has_api_key"))}
+    publish_feeds(changes)
+
+
+def _ai_availability() -> tuple:
+    """(has_anthropic, has_api_key) as the page shows them — the leader's on a follower."""
+    if _leader_ai is not None:
+        return _leader_ai["has_anthropic"], _leader_ai["has_api_key"]
+    return HAS_ANTHROPIC, bool(os.environ.get("ANTHROPIC_API_KEY"))
+
+
+def _note_follower_view(age: Optional[float]) -> None:
+    """A follower's dashboard was viewed `age` seconds ago: keep the AI inactivity timer going."""
+    global _last_dashboard_view
+    if age is None or age < 0:
+        return
+    viewed = datetime.now() - timedelta(seconds=age)
+    if _last_dashboard_view is None or viewed > _last_dashboard_view:
+        _last_dashboard_view = viewed
+
+
+def _view_age_header() -> Dict[str, str]:
+    """Follower → leader: how long ago this dashboard was last viewed."""
+    if _last_dashboard_view is None:
+        return {}
+    return {"X-Last-View-Age": f"{(datetime.now() - _last_dashboard_view).total_seconds():.0f}"}
+
+
+def start_following(leader_url: str, last_good_path: Optional[str]) -> sync.Follower:
+    """Become a follower of `leader_url`: show the last good snapshot, then pull
+    every SNAPSHOT_POLL_INTERVAL on a background thread."""
+    global _follower
+    _follower = sync.Follower(leader_url, apply_snapshot, last_good_path, SNAPSHOT_TIMEOUT, _view_age_header)
+    if _follower.restore():
+        logger.info(f"SYNC: Showing last good snapshot {_follower.version} from {last_good_path}")
+    threading.Thread(target=_follow_loop, args=(_follower,), daemon=True, name="follower").start()
+    return _follower
+
+
+def _follow_loop(follower: sync.Follower) -> None:
+    while True:
+        result = follower.pull()
+        SNAPSHOT_PULLS.inc(result=result)
+        if result == "updated":
+            logger.info(f"SYNC: Applied snapshot {follower.version} from {follower.url}")
+        elif result == "error":
+            logger.warning(f"SYNC: Pull from leader failed ({follower.error}); keeping snapshot {follower.version}")
+        time.sleep(SNAPSHOT_POLL_INTERVAL)
+
+
 # ============ SHABBOS TIME CALCULATIONS ============
+# Times are for the active profile's location and offsets (see profiles.py);
+# _tz and _observer are the default profile's (config.py).
 
 _tz = ZoneInfo(LOCATION_TZ)
 _observer = LocationInfo(
@@ -332,35 +969,25 @@ _observer = LocationInfo(
 ).observer
 
 
-def get_shabbos_times() -> Dict:
-    """Calculate candle lighting & havdalah for the current/upcoming Shabbos.
+@lru_cache(maxsize=4096)
+def _sunset_at(lat: float, lon: float, tz: str, day: date) -> datetime:
+    """Sunset at a location (memoized — it never changes for a date)."""
+    observer = LocationInfo(latitude=lat, longitude=lon, timezone=tz).observer
+    return sun(observer, date=day, tzinfo=ZoneInfo(tz))["sunset"]
 
-    Finds the most recent Friday, computes sunset-based times, and if
-    we're already past havdalah, advances to next week.
-    """
-    now = datetime.now(_tz)
-    today = now.date()
 
-    # Find the most recent Friday (weekday 4) including today
-    days_since_friday = (today.weekday() - 4) % 7
-    friday = today - timedelta(days=days_since_friday)
-    saturday = friday + timedelta(days=1)
+def _sunset(day: date) -> datetime:
+    """Sunset at the active profile's location."""
+    profile = profiles.current()
+    return _sunset_at(profile.lat, profile.lon, profile.tz, day)
 
-    fri_sunset = sun(_observer, date=friday, tzinfo=_tz)["sunset"]
-    sat_sunset = sun(_observer, date=saturday, tzinfo=_tz)["sunset"]
-
-    candle_lighting = fri_sunset - timedelta(minutes=CANDLE_LIGHTING_OFFSET)
-    havdalah = sat_sunset + timedelta(minutes=HAVDALAH_OFFSET)
-
-    # If we're past this Shabbos, look ahead to next week
-    if now > havdalah:
-        friday = friday + timedelta(days=7)
-        saturday = friday + timedelta(days=1)
-        fri_sunset = sun(_observer, date=friday, tzinfo=_tz)["sunset"]
-        sat_sunset = sun(_observer, date=saturday, tzinfo=_tz)["sunset"]
-        candle_lighting = fri_sunset - timedelta(minutes=CANDLE_LIGHTING_OFFSET)
-        havdalah = sat_sunset + timedelta(minutes=HAVDALAH_OFFSET)
 
+def _shabbos_for_friday(friday: date) -> Dict:
+    """Compute candle lighting & havdalah for the Shabbos starting on `friday`."""
+    profile = profiles.current()
+    saturday = friday + timedelta(days=1)
+    candle_lighting = _sunset(friday) - timedelta(minutes=profile.candle_lighting_offset)
+    havdalah = _sunset(saturday) + timedelta(minutes=profile.havdalah_offset)
     return {
         "candle_lighting": candle_lighting,
         "havdalah": havdalah,
@@ -370,87 +997,42 @@ def get_shabbos_times() -> Dict:
     }
 
 
+def get_shabbos_times() -> Dict:
+    """Return candle lighting & havdalah for the current/upcoming Shabbos.
+
+    The current Shabbos is the first one whose havdalah hasn't passed yet
+    (the most recent Friday, or next week once we're past havdalah). Answered
+    from the precomputed calendar index.
+    """
+    now = datetime.now(profiles.current().tzinfo)
+    idx = _get_calendar_index()
+    pos = bisect_left(idx["shabbos_ends"], now.timestamp())
+    if pos >= len(idx["shabbos"]):
+        # Beyond the indexed horizon (clock jumped) — compute directly
+        days_since_friday = (now.date().weekday() - 4) % 7
+        times = _shabbos_for_friday(now.date() - timedelta(days=days_since_friday))
+        if now > times["havdalah"]:
+            times = _shabbos_for_friday(times["friday_date"] + timedelta(days=7))
+        return times
+    return dict(idx["shabbos"][pos])
+
+
 def is_shabbos() -> bool:
     """Check if we're currently in the Shabbos window."""
     times = get_shabbos_times()
-    now = datetime.now(_tz)
+    now = datetime.now(profiles.current().tzinfo)
     return times["candle_lighting"] <= now <= times["havdalah"]
 
 
-# ============ YOM TOV DETECTION (HEBCAL API) ============
-
-# Cache Hebcal results: {(year, month): {"fetched_at": datetime, "items": [...]}}
-_hebcal_cache: Dict[tuple, Dict] = {}
-_HEBCAL_CACHE_TTL = 86400  # 24 hours — holiday dates don't change
+# ============ YOM TOV DETECTION ============
 
+def _build_yom_tov_windows(events: list) -> List[Dict]:
+    """Turn Hebcal-shaped events into chronologically sorted Yom Tov windows.
 
-def _fetch_hebcal_events(year: int, month: int) -> list:
-    """Fetch holiday and candle/havdalah events from Hebcal API for a given month."""
-    cache_key = (year, month)
-    cached = _hebcal_cache.get(cache_key)
-    if cached and (datetime.now() - cached["fetched_at"]).total_seconds() < _HEBCAL_CACHE_TTL:
-        return cached["items"]
-
-    try:
-        params = {
-            "cfg": "json", "v": "1",
-            "maj": "on", "min": "off", "mod": "off", "nx": "off",
-            "ss": "off", "mf": "off", "c": "on", "M": "on",
-            "geo": "pos",
-            "latitude": str(LOCATION_LAT),
-            "longitude": str(LOCATION_LON),
-            "tzid": LOCATION_TZ,
-            "year": str(year),
-            "month": str(month),
-            "b": str(CANDLE_LIGHTING_OFFSET),
-        }
-        response = safe_request(
-            "https://www.hebcal.com/hebcal?" + "&".join(f"{k}={v}" for k, v in params.items())
-        )
-        if not response:
-            return []
-        data = response.json()
-        items = data.get("items", [])
-        _hebcal_cache[cache_key] = {"fetched_at": datetime.now(), "items": items}
-        logger.info(f"Hebcal: fetched {len(items)} events for {year}-{month:02d}")
-        return items
-    except Exception as e:
-        logger.warning(f"Hebcal API failed: {e}")
-        return []
-
-
-def get_yom_tov_info() -> Dict:
-    """Detect if we're currently in a Yom Tov period or one is upcoming within 7 days.
-
-    Queries the Hebcal API for the current and next month, finds multi-day
-    holiday windows (candle lighting → havdalah sequences that span 2+ days),
-    and returns the relevant info.
-
-    Returns dict with keys:
-        active: bool — are we currently in a Yom Tov window?
-        name: str — holiday name (e.g. "Pesach")
-        candle_lighting: datetime — when Yom Tov starts
-        havdalah: datetime — when Yom Tov ends
-        havdalah_display: str — e.g. "Sat 8:05 PM"
-        days: int — number of days in this Yom Tov block
-        retention_days: int — recommended AI_SUMMARY_RETENTION_DAYS
-    Or None if no Yom Tov is active/upcoming.
+    Finds multi-day holiday windows (candle lighting → havdalah sequences that
+    span 2+ days, or that contain a named holiday) and merges adjacent ones.
+    Each window: {"name", "candle_lighting", "havdalah", "days"}.
     """
-    now = datetime.now(_tz)
-    today = now.date()
-
-    # Fetch events for this month and next month (in case Yom Tov spans month boundary)
-    events = _fetch_hebcal_events(today.year, today.month)
-    next_month = today.month + 1
-    next_year = today.year
-    if next_month > 12:
-        next_month = 1
-        next_year += 1
-    events += _fetch_hebcal_events(next_year, next_month)
-
-    if not events:
-        return None
-
     # Build timeline: extract candle lighting and havdalah events with their datetimes
     candles = []  # [(datetime, title)]
     havdalahs = []  # [(datetime, title)]
@@ -486,13 +1068,11 @@ def get_yom_tov_info() -> Dict:
     # Find windows: a window starts with a candle event and ends at the next havdalah
     windows = []
     window_start = None
-    window_candles = 0
 
     for dt, etype, title in all_events:
         if etype == "candle":
             if window_start is None:
                 window_start = dt
-            window_candles += 1
         elif etype == "havdalah" and window_start is not None:
             # This havdalah closes the window
             days = (dt.date() - window_start.date()).days + 1
@@ -519,7 +1099,6 @@ def get_yom_tov_info() -> Dict:
                     "days": days,
                 })
             window_start = None
-            window_candles = 0
 
     # Merge adjacent windows where gap < 36 hours
     # Handles Yom Tov → Shabbat, Shabbat → Yom Tov, multi-part holidays
@@ -536,34 +1115,188 @@ def get_yom_tov_info() -> Dict:
                 prev["name"] = w["name"]
         else:
             merged.append(w)
-    windows = merged
+    return merged
+
+
+def get_yom_tov_info() -> Dict:
+    """Detect if we're currently in a Yom Tov period or one is upcoming within 7 days.
+
+    Windows come from the calendar index (computed locally by hebrew_calendar
+    for the coming year). The first window whose havdalah hasn't passed is the
+    only candidate: later windows start later.
+
+    Returns dict with keys:
+        active: bool — are we currently in a Yom Tov window?
+        name: str — holiday name (e.g. "Pesach")
+        candle_lighting: datetime — when Yom Tov starts
+        havdalah: datetime — when Yom Tov ends
+        havdalah_display: str — e.g. "Sat 8:05 PM"
+        days: int — number of days in this Yom Tov block
+        retention_days: int — recommended AI_SUMMARY_RETENTION_DAYS
+    Or None if no Yom Tov is active/upcoming.
+    """
+    now = datetime.now(profiles.current().tzinfo)
+    idx = _get_calendar_index()
+    pos = bisect_left(idx["window_ends"], now.timestamp())
+    if pos >= len(idx["windows"]):
+        return None
 
-    # Find the most relevant window: currently active or upcoming within 7 days
+    w = idx["windows"][pos]
+    if w["candle_lighting"] <= now:
+        active = True  # Currently in this Yom Tov
+    elif (w["candle_lighting"] - now).days <= 7:
+        active = False  # Upcoming within 7 days
+    else:
+        return None
+
+    return {
+        "active": active,
+        "name": w["name"],
+        "candle_lighting": w["candle_lighting"],
+        "havdalah": w["havdalah"],
+        "havdalah_display": w["havdalah_display"],
+        "days": w["days"],
+        "retention_days": w["days"],
+    }
+
+
+# ============ CALENDAR INDEX ============
+# get_shabbos_times() and get_yom_tov_info() are hit several times per
+# dashboard render and per AI run. Instead of recomputing sunsets and
+# re-walking calendar events each time, a sorted index is built once per day
+# and lookups are answered by bisect. Each profile has its own index.
+
+_CALENDAR_INDEX_WEEKS = 53    # Shabbos entries to precompute (~1 year ahead)
+_CALENDAR_INDEX_DAYS = 366    # Yom Tov horizon
+
+_calendar_indexes: Dict["profiles.Profile", Dict] = {}
+_calendar_index_lock = threading.Lock()
+
+
+def _build_calendar_index(today: date) -> Dict:
+    """Precompute sorted Shabbos times and Yom Tov windows starting at `today`."""
+    # Shabbos: start from the most recent Friday (including today)
+    friday = today - timedelta(days=(today.weekday() - 4) % 7)
+    shabbos = [
+        _shabbos_for_friday(friday + timedelta(weeks=i))
+        for i in range(_CALENDAR_INDEX_WEEKS)
+    ]
+
+    # Yom Tov: start a little in the past so a window already in progress is found
+    events = _local_calendar_events(today - timedelta(days=10), today + timedelta(days=_CALENDAR_INDEX_DAYS))
+    windows = _build_yom_tov_windows(events)
     for w in windows:
-        if w["candle_lighting"] <= now <= w["havdalah"]:
-            # Currently in this Yom Tov
-            return {
-                "active": True,
-                "name": w["name"],
-                "candle_lighting": w["candle_lighting"],
-                "havdalah": w["havdalah"],
-                "havdalah_display": w["havdalah"].strftime("%a %-I:%M %p"),
-                "days": w["days"],
-                "retention_days": w["days"],
-            }
-        elif now < w["candle_lighting"] and (w["candle_lighting"] - now).days <= 7:
-            # Upcoming within 7 days
-            return {
-                "active": False,
-                "name": w["name"],
-                "candle_lighting": w["candle_lighting"],
-                "havdalah": w["havdalah"],
-                "havdalah_display": w["havdalah"].strftime("%a %-I:%M %p"),
-                "days": w["days"],
-                "retention_days": w["days"],
-            }
+        w["havdalah_display"] = w["havdalah"].strftime("%a %-I:%M %p")
 
-    return None
+    return {
+        "built_for": today,
+        "shabbos": shabbos,
+        "shabbos_ends": [s["havdalah"].timestamp() for s in shabbos],
+        "windows": windows,
+        "window_ends": [w["havdalah"].timestamp() for w in windows],
+    }
+
+
+def _get_calendar_index() -> Dict:
+    """Return the active profile's calendar index, rebuilding it once per day."""
+    profile = profiles.current()
+    today = datetime.now(profile.tzinfo).date()
+    idx = _calendar_indexes.get(profile)
+    if idx is not None and idx["built_for"] == today:
+        return idx
+    with _calendar_index_lock:
+        idx = _calendar_indexes.get(profile)
+        if idx is None or idx["built_for"] != today:
+            idx = _build_calendar_index(today)
+            _calendar_indexes[profile] = idx
+            logger.info(f"Calendar index built for {profile.name}: {len(idx['shabbos'])} Shabbosim, "
+                        f"{len(idx['windows'])} Yom Tov windows")
+    return idx
+
+
+# ============ LOCAL CALENDAR & HEBCAL CROSS-CHECK ============
+
+def _local_calendar_events(start: date, end: date) -> list:
+    """Hebcal-shaped holiday/candles/havdalah events from the offline engine."""
+    profile = profiles.current()
+    return hebrew_calendar.calendar_events(
+        start, end, _sunset, profile.candle_lighting_offset, profile.havdalah_offset, israel=profile.israel,
+    )
+
+
+# Cache Hebcal results: {(year, month): {"fetched_at": datetime, "items": [...]}}
+_hebcal_cache: Dict[tuple, Dict] = {}
+_HEBCAL_CACHE_TTL = 86400  # 24 hours — holiday dates don't change
+
+
+def _fetch_hebcal_events(year: int, month: int) -> list:
+    """Fetch holiday and candle/havdalah events from Hebcal API for a given month."""
+    cache_key = (year, month)
+    cached = _hebcal_cache.get(cache_key)
+    if cached and (datetime.now() - cached["fetched_at"]).total_seconds() < _HEBCAL_CACHE_TTL:
+        return cached["items"]
+
+    try:
+        params = {
+            "cfg": "json", "v": "1",
+            "maj": "on", "min": "off", "mod": "off", "nx": "off",
+            "ss": "off", "mf": "off", "c": "on", "M": "on",
+            "geo": "pos",
+            "latitude": str(LOCATION_LAT),
+            "longitude": str(LOCATION_LON),
+            "tzid": LOCATION_TZ,
+            "year": str(year),
+            "month": str(month),
+            "b": str(CANDLE_LIGHTING_OFFSET),
+            "i": "on" if YOM_TOV_ISRAEL else "off",
+        }
+        response = safe_request(
+            "https://www.hebcal.com/hebcal?" + "&".join(f"{k}={v}" for k, v in params.items())
+        )
+        if not response:
+            return []
+        data = response.json()
+        items = data.get("items", [])
+        _hebcal_cache[cache_key] = {"fetched_at": datetime.now(), "items": items}
+        logger.info(f"Hebcal: fetched {len(items)} events for {year}-{month:02d}")
+        return items
+    except Exception as e:
+        logger.warning(f"Hebcal API failed: {e}")
+        return []
+
+
+def hebcal_cross_check() -> None:
+    """Compare local Yom Tov windows with Hebcal's for this month and next.
+
+    Optional (HEBCAL_CROSS_CHECK) — runs daily from the scheduler, never on
+    the render path. Only dates are compared: Hebcal's default havdalah uses
+    tzeit rather than HAVDALAH_OFFSET, so exact times legitimately differ.
+    """
+    today = datetime.now(_tz).date()
+    next_year, next_month = (today.year + 1, 1) if today.month == 12 else (today.year, today.month + 1)
+    remote = _fetch_hebcal_events(today.year, today.month) + _fetch_hebcal_events(next_year, next_month)
+    if not remote:
+        logger.warning("Hebcal cross-check skipped: Hebcal unreachable")
+        return
+    after_next = date(next_year, next_month, 28) + timedelta(days=4)
+    local = _local_calendar_events(date(today.year, today.month, 1), after_next.replace(day=1) - timedelta(days=1))
+
+    # Names are not compared: Hebcal's major holidays include Chanukah etc.,
+    # which rename ordinary Shabbos windows
+    def spans(events):
+        return {
+            (w["candle_lighting"].date(), w["havdalah"].date())
+            for w in _build_yom_tov_windows(events)
+        }
+
+    remote_spans, local_spans = spans(remote), spans(local)
+    if remote_spans == local_spans:
+        logger.info(f"Hebcal cross-check OK: {len(local_spans)} windows agree")
+    else:
+        logger.warning(
+            f"Hebcal cross-check mismatch — only Hebcal: {sorted(remote_spans - local_spans)}, "
+            f"only local: {sorted(local_spans - remote_spans)}"
+        )
 
 
 # Nitter instance health tracking
@@ -583,11 +1316,13 @@ def get_healthy_nitter_instances() -> List[str]:
 
 
 def record_nitter_success(instance: str):
+    NITTER_ATTEMPTS.inc(instance=instance, result="success")
     nitter_health[instance]["failures"] = 0
     nitter_health[instance]["last_success"] = datetime.now()
 
 
 def record_nitter_failure(instance: str):
+    NITTER_ATTEMPTS.inc(instance=instance, result="failure")
     nitter_health[instance]["failures"] += 1
     nitter_health[instance]["last_failure"] = datetime.now()
 
@@ -655,10 +1390,12 @@ def format_timestamp(timestamp_str: str, source_tz: str = None) -> str:
     return dt.strftime('%a %-I:%M %p')
 
 
-def _parse_timestamp_to_epoch(timestamp_str: str) -> float:
+def _parse_timestamp_to_epoch(timestamp_str: str, source_tz: str = None) -> float:
     """Parse various timestamp formats to Unix epoch for reliable sorting.
 
     Handles: ISO 8601, RFC 2822, Nitter/BlueSky display format.
+    Naive ISO times are read in `source_tz` if given (else server-local time);
+    naive RFC 2822 times ("-0000") are UTC.
     Returns 0.0 for empty/unparseable strings (sorts to bottom in reverse).
     """
     if not timestamp_str:
@@ -666,12 +1403,16 @@ def _parse_timestamp_to_epoch(timestamp_str: str) -> float:
     # Try ISO 8601 first (BlueSky API, TwStalker _relative_to_iso)
     try:
         dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+        if dt.tzinfo is None and source_tz:
+            dt = dt.replace(tzinfo=ZoneInfo(source_tz))
         return dt.timestamp()
     except (ValueError, TypeError):
         pass
     # Try RFC 2822 (Trump RSS, Reuters RSS, TOI RSS)
     try:
         dt = parsedate_to_datetime(timestamp_str)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
         return dt.timestamp()
     except (ValueError, TypeError):
         pass
@@ -688,15 +1429,208 @@ def _parse_timestamp_to_epoch(timestamp_str: str) -> float:
     return 0.0
 
 
+def _age_cutoff(max_age_hours: float) -> float:
+    """Epoch before which items count as stale."""
+    return time.time() - max_age_hours * 3600
+
+
+def _filter_by_age(items: List["FeedItem"], max_age_hours: float) -> List["FeedItem"]:
+    """Drop items older than `max_age_hours`.
+
+    One cutoff epoch, one float comparison per item. Items with unknown
+    timestamps (epoch 0.0) pass through.
+    """
+    cutoff = _age_cutoff(max_age_hours)
+    return [item for item in items if item.epoch >= cutoff or not item.epoch]
+
+
+def _sort_newest_first(items: List["FeedItem"]) -> List["FeedItem"]:
+    items.sort(key=attrgetter("epoch"), reverse=True)
+    return items
+
+
+# ============ HTML PARSING ============
+# Scrapers only read a few subtrees of large pages (tweets, liveblog entries,
+# article links). Each parser declares the subtrees it needs as a strainer, so
+# the rest of the page (head, nav, scripts, sidebars) is never built into a tree.
+
+HTML_PARSER = "lxml" if HAS_LXML else "html.parser"
+
+
+def _class_tokens(attrs: Dict) -> set:
+    """Class names of a tag's raw attributes (a string while parsing, a list after)."""
+    value = attrs.get("class") or ""
+    return set(value.split() if isinstance(value, str) else value)
+
+
+def html_strainer(keep: Callable[[str, Dict], bool]):
+    """Build a parse_only filter keeping top-level tags where keep(name, attrs)
+    is true, along with everything inside them."""
+    if ElementFilter is None:
+        return SoupStrainer(lambda name, attrs=None: keep(name, attrs or {}))
+    strainer = ElementFilter()
+    strainer.allow_tag_creation = lambda nsprefix, name, attrs: keep(name, attrs or {})
+    strainer.allow_string_creation = lambda string: False  # text outside kept subtrees
+    return strainer
+
+
+def parse_html(markup, only=None) -> BeautifulSoup:
+    """Parse `markup` with the fastest available builder, restricted to `only`
+    (an html_strainer) when given."""
+    return BeautifulSoup(markup, HTML_PARSER, parse_only=only)
+
+
+# ============ HTML TEXT EXTRACTION ============
+# clean_html() / extract_text_with_links() run on every RSS summary and Truth
+# Social post each cycle. Plain strings skip parsing entirely; everything else
+# goes through a streaming HTMLParser (no tree) and is memoized by content
+# hash, since most entries are unchanged from the previous cycle.
+
+_TEXT_MEMO_MAX = 4096  # entries (LRU)
+_text_memo: "OrderedDict[tuple, str]" = OrderedDict()
+_text_memo_lock = threading.Lock()
+_text_memo_stats = {"hits": 0, "misses": 0, "plain": 0}
+
+_TRUTHSOCIAL_URL = re.compile(r'\[?https?://(?:www\.)?truthsocial\.com/\S+\]?')
+_WHITESPACE = re.compile(r'\s+')
+
+
+class _TextStripper(HTMLParser):
+    """Collect the text of an HTML fragment as BeautifulSoup's
+    get_text(separator=" ", strip=True) would, without building a tree.
+
+    Each run of text between tags is stripped and kept if non-empty; script,
+    style and template contents, comments and declarations are dropped. With
+    `inline_links`, each <a href> becomes one "text [URL]" string.
+    """
+
+    _HIDDEN = {"script", "style", "template"}
+
+    def __init__(self, inline_links: bool = False):
+        super().__init__(convert_charrefs=False)
+        self.inline_links = inline_links
+        self.strings: List[str] = []
+        self._data: List[str] = []
+        self._hidden = 0
+        self._link = None  # (href, [link text pieces]) while inside <a href>
+
+    def _flush(self) -> None:
+        if self._data:
+            text = "".join(self._data).strip()
+            self._data = []
+            if text:
+                (self._link[1] if self._link else self.strings).append(text)
+
+    def handle_starttag(self, tag, attrs):
+        self._flush()
+        if tag in self._HIDDEN:
+            self._hidden += 1
+        elif tag == "a" and self.inline_links and self._link is None:
+            href = dict(attrs).get("href", False)
+            if href is not False:
+                self._link = (href or "", [])
+
+    def handle_startendtag(self, tag, attrs):
+        self._flush()
+
+    def handle_endtag(self, tag):
+        self._flush()
+        if tag in self._HIDDEN:
+            self._hidden = max(0, self._hidden - 1)
+        elif tag == "a" and self._link is not None:
+            self._close_link()
+
+    def _close_link(self) -> None:
+        href, pieces = self._link
+        self._link = None
+        link_text = "".join(pieces)
+        text = f"{link_text} [{href}]" if href and href != link_text else (link_text or href)
+        if text.strip():
+            self.strings.append(text.strip())
+
+    def handle_data(self, data):
+        if not self._hidden:
+            self._data.append(data)
+
+    def handle_entityref(self, name):
+        # Like BeautifulSoup: unknown names stay literal (without the ';')
+        self.handle_data(_HTML5_ENTITIES.get(name + ";", "&" + name))
+
+    def handle_charref(self, name):
+        self.handle_data(unescape(f"&#{name};"))
+
+    def handle_comment(self, data):
+        self._flush()
+
+    def handle_decl(self, decl):
+        self._flush()
+
+    def handle_pi(self, data):
+        self._flush()
+
+    def unknown_decl(self, data):
+        self._flush()
+        if data.startswith("CDATA[") and not self._hidden:
+            self._data.append(data[6:])
+            self._flush()
+
+    def text(self, html_text: str) -> str:
+        self.feed(html_text)
+        self.close()
+        self._flush()
+        if self._link is not None:
+            self._close_link()
+        return " ".join(self.strings)
+
+
+def _memoized_text(kind: str, html_text: str, extract: Callable[[str], str]) -> str:
+    """Return extract(html_text), memoized by (kind, content hash) in a bounded LRU."""
+    key = (kind, hashlib.blake2b(html_text.encode("utf-8", "surrogatepass"), digest_size=16).digest())
+    with _text_memo_lock:
+        cached = _text_memo.get(key)
+        if cached is not None:
+            _text_memo.move_to_end(key)
+            _text_memo_stats["hits"] += 1
+            return cached
+    result = extract(html_text)
+    with _text_memo_lock:
+        _text_memo[key] = result
+        _text_memo_stats["misses"] += 1
+        if len(_text_memo) > _TEXT_MEMO_MAX:
+            _text_memo.popitem(last=False)
+    return result
+
+
+def _has_markup(text: str) -> bool:
+    return "<" in text or "&" in text
+
+
+def _clean_html_text(html_text: str) -> str:
+    return unescape(_TextStripper().text(html_text))
+
+
 def clean_html(html_text: str) -> str:
     """Remove HTML tags and decode entities."""
     if not html_text:
         return ""
-    soup = BeautifulSoup(html_text, "html.parser")
-    text = soup.get_text(separator=" ", strip=True)
+    if not _has_markup(html_text):
+        _text_memo_stats["plain"] += 1
+        return html_text.strip()
+    return _memoized_text("clean", html_text, _clean_html_text)
+
+
+def _tidy_post_text(text: str) -> str:
+    # Strip bare truthsocial.com URLs — they're opaque post links that add no
+    # readable content.  The entry's link field already has the canonical URL.
+    text = _TRUTHSOCIAL_URL.sub('', text)
+    text = _WHITESPACE.sub(' ', text).strip()
     return unescape(text)
 
 
+def _links_text(html_text: str) -> str:
+    return _tidy_post_text(_TextStripper(inline_links=True).text(html_text))
+
+
 def extract_text_with_links(html_text: str) -> str:
     """Remove HTML tags but preserve link URLs inline.
 
@@ -705,20 +1639,92 @@ def extract_text_with_links(html_text: str) -> str:
     """
     if not html_text:
         return ""
-    soup = BeautifulSoup(html_text, "html.parser")
-    for a_tag in soup.find_all("a", href=True):
-        href = a_tag["href"]
-        link_text = a_tag.get_text(strip=True)
-        if href and href != link_text:
-            a_tag.replace_with(f"{link_text} [{href}]")
-        else:
-            a_tag.replace_with(link_text or href or "")
-    text = soup.get_text(separator=" ", strip=True)
-    # Strip bare truthsocial.com URLs — they're opaque post links that add no
-    # readable content.  The entry's link field already has the canonical URL.
-    text = re.sub(r'\[?https?://(?:www\.)?truthsocial\.com/\S+\]?', '', text)
-    text = re.sub(r'\s+', ' ', text).strip()
-    return unescape(text)
+    if not _has_markup(html_text):
+        _text_memo_stats["plain"] += 1
+        return _tidy_post_text(html_text.strip())
+    return _memoized_text("links", html_text, _links_text)
+
+
+# ============ FEED ITEM MODEL ============
+
+class FeedItem:
+    """One feed entry — tweet, Truth Social post, news article, liveblog update.
+
+    Slotted to keep per-item memory small; `author`/`source` are interned since
+    a handful of values repeat across every cycle. The timestamp is normalized
+    once, on construction: `epoch` is a float (0.0 when unknown) and
+    `timestamp` an aware UTC ISO string (the source string is kept when it
+    can't be parsed). Pass `epoch` to skip re-parsing (e.g. when decoding
+    persisted rows).
+
+    Dict-style reads (`item["text"]`, `item.get("title")`) still work, so
+    templates and generic code treat it like the dicts it replaced.
+    """
+
+    FIELDS = ("author", "text", "title", "summary", "timestamp", "timestamp_display",
+              "link", "source", "feed_source", "epoch")
+    __slots__ = FIELDS
+
+    def __init__(self, author: str = "", text: str = "", title: str = "", summary: str = "",
+                 timestamp: str = "", timestamp_display: str = "", link: str = "",
+                 source: str = "", feed_source: str = "", epoch: float = None,
+                 source_tz: str = None):
+        self.author = sys.intern(author) if author else ""
+        self.text = text
+        self.title = title
+        self.summary = summary
+        if not epoch:
+            # Unknown (or previously unparseable) — parse; keep the source string on failure
+            epoch = _parse_timestamp_to_epoch(timestamp, source_tz)
+            if epoch:
+                timestamp = datetime.fromtimestamp(epoch, timezone.utc).isoformat()
+        self.timestamp = timestamp
+        self.timestamp_display = timestamp_display
+        self.link = link
+        self.source = sys.intern(source) if source else ""
+        self.feed_source = feed_source
+        self.epoch = epoch
+
+    def __getitem__(self, key: str):
+        if key not in _FEED_ITEM_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in _FEED_ITEM_FIELDS else default
+
+    def __contains__(self, key: str) -> bool:
+        return key in _FEED_ITEM_FIELDS
+
+    def __repr__(self) -> str:
+        return f"FeedItem({self.author or self.source!r}, {(self.title or self.text)[:40]!r}, epoch={self.epoch})"
+
+    def to_row(self) -> list:
+        """Positional JSON row (field order = FIELDS) — no repeated key strings on disk."""
+        return [self.author, self.text, self.title, self.summary, self.timestamp,
+                self.timestamp_display, self.link, self.source, self.feed_source, self.epoch]
+
+    def replace(self, **changes) -> "FeedItem":
+        """A copy with `changes` applied (published items are never modified)."""
+        row = self.to_row()
+        for key, value in changes.items():
+            row[FeedItem.FIELDS.index(key)] = value
+        return FeedItem.from_row(row)
+
+    @classmethod
+    def from_row(cls, row: list) -> "FeedItem":
+        return cls(*row)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "FeedItem":
+        """Build from a legacy dict item (older cache files), ignoring unknown keys."""
+        return cls(**{k: v for k, v in data.items() if k in _FEED_ITEM_FIELDS})
+
+
+_FEED_ITEM_FIELDS = frozenset(FeedItem.FIELDS)
+
+# Feeds whose items are FeedItems (ai_summary and prediction_markets hold plain dicts)
+_FEED_ITEM_FEEDS = ("twitter_list", "trump", "reuters", "toi_liveblog", "think_tanks")
 
 
 class RateLimitError(Exception):
@@ -737,7 +1743,7 @@ def safe_request(url: str, timeout: int = REQUEST_TIMEOUT, raise_on_429: bool =
         headers = {
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
         }
-        response = requests.get(url, timeout=timeout, headers=headers)
+        response = http_get(url, timeout=timeout, headers=headers)
         if response.status_code == 429:
             logger.warning(f"Rate limited (429) by {url}")
             if raise_on_429:
@@ -747,17 +1753,111 @@ def safe_request(url: str, timeout: int = REQUEST_TIMEOUT, raise_on_429: bool =
         return response
     except RateLimitError:
         raise
+    except deadlines.DeadlineExceeded:
+        logger.info(f"Skipped {url}: cycle deadline reached")
+        return None
     except Exception as e:
         logger.warning(f"Request failed for {url}: {e}")
         return None
 
 
+def _out_of_time(stage: str) -> bool:
+    """True once the current deadline is spent: the caller stops its fallbacks
+    and publishes what it has."""
+    if not deadlines.expired():
+        return False
+    DEADLINE_SKIPS.inc(stage=stage)
+    logger.info(f"Deadline reached — skipping remaining {stage} attempts")
+    return True
+
+
+@tracing.traced("parse")
+def parse_feed(content) -> feedparser.FeedParserDict:
+    """feedparser.parse, recorded as a parse span when a cycle is traced."""
+    return feedparser.parse(content)
+
+
+# ============ ENTRY MEMO ============
+# Most feed entries are unchanged from one cycle to the next. Fetchers build
+# each item through memo_entry(), which hands back the previous cycle's item
+# when the entry's id (guid, else link) and the fields it was built from are
+# unchanged — only new or edited entries pay for clean_html, timestamp
+# parsing and truncation. Hit rates per feed are on /health.
+
+_ENTRY_MEMO_MAX = 256  # entries per feed (LRU)
+_entry_memo: Dict[str, "OrderedDict[str, tuple]"] = {}
+_entry_memo_stats: Dict[str, Dict[str, int]] = {}
+_entry_memo_lock = threading.Lock()
+
+
+def _entry_digest(entry, fields: tuple) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    for field in fields:
+        value = entry.get(field, "")
+        digest.update((value if isinstance(value, str) else repr(value)).encode("utf-8", "surrogatepass"))
+        digest.update(b"\x1f")
+    return digest.digest()
+
+
+def memo_entry(feed: str, entry, fields: tuple, build: Callable[[], Any]) -> Any:
+    """Return build() for a feedparser entry, reusing an earlier cycle's result.
+
+    `fields` are the entry keys `build` reads; a change in any of them (an
+    edited post, a corrected timestamp) rebuilds. Results — including None for
+    skipped entries — are kept per feed in a bounded LRU. Entries without a
+    guid or link are always built.
+    """
+    entry_id = entry.get("id") or entry.get("link")
+    if not entry_id:
+        return build()
+    digest = _entry_digest(entry, fields)
+    with _entry_memo_lock:
+        memo = _entry_memo.setdefault(feed, OrderedDict())
+        stats = _entry_memo_stats.setdefault(feed, {"hits": 0, "misses": 0})
+        cached = memo.get(entry_id)
+        if cached is not None and cached[0] == digest:
+            memo.move_to_end(entry_id)
+            stats["hits"] += 1
+            return cached[1]
+    result = build()
+    with _entry_memo_lock:
+        memo[entry_id] = (digest, result)
+        memo.move_to_end(entry_id)
+        stats["misses"] += 1
+        if len(memo) > _ENTRY_MEMO_MAX:
+            memo.popitem(last=False)
+    return result
+
+
+def entry_memo_hit_rates() -> Dict[str, Dict]:
+    """Per-feed hits, misses and hit rate since startup."""
+    rates = {}
+    with _entry_memo_lock:
+        for feed, stats in _entry_memo_stats.items():
+            total = stats["hits"] + stats["misses"]
+            rates[feed] = {**stats, "hit_rate": round(stats["hits"] / total, 3) if total else None}
+    return rates
+
+
 # ============ TWITTER ACCOUNTS FETCHER ============
 
 # Track which fetch method last succeeded per account (optimization: try it first)
 _twitter_method_cache: Dict[str, str] = {}
 
 
+def profile_accounts(profile: "profiles.Profile") -> List[str]:
+    """The OSINT accounts `profile` shows (TWITTER_ACCOUNTS unless it names its own)."""
+    return list(profile.accounts) if profile.accounts is not None else TWITTER_ACCOUNTS
+
+
+def fetched_twitter_accounts() -> List[str]:
+    """Every profile's accounts, each once — fetched once and shared."""
+    accounts = {}
+    for profile in profiles.all_profiles():
+        accounts.update(dict.fromkeys(profile_accounts(profile)))
+    return list(accounts)
+
+
 def fetch_twitter_accounts() -> None:
     """Fetch tweets from monitored Twitter accounts via web scraping."""
     logger.info("Fetching Twitter accounts...")
@@ -765,98 +1865,113 @@ def fetch_twitter_accounts() -> None:
     all_items = []
     account_status = {}
 
-    with ThreadPoolExecutor(max_workers=6) as executor:
-        futures = {
-            executor.submit(fetch_single_twitter_account, username): username
-            for username in TWITTER_ACCOUNTS
-        }
-        for future in as_completed(futures, timeout=TWITTER_ACCOUNT_TIMEOUT):
-            username = futures[future]
-            try:
-                items = future.result()
-                all_items.extend(items)
-                account_status[username] = len(items) > 0
-            except Exception as e:
-                logger.warning(f"Twitter fetch for @{username} failed: {e}")
-                account_status[username] = False
+    # Accounts share one budget (within the cycle's): their requests are cut to
+    # it and their fallbacks stop at it. Accounts that finished in time are
+    # kept even if others are still running when it ends.
+    executor = ThreadPoolExecutor(max_workers=6)
+    try:
+        with deadlines.deadline(TWITTER_ACCOUNT_TIMEOUT):
+            futures = {
+                tracing.submit(executor, fetch_single_twitter_account, username): username
+                for username in fetched_twitter_accounts()
+            }
+            # A little past the deadline, so requests it cut short can still report
+            _, late = wait(futures, timeout=deadlines.remaining() + 2)
+    finally:
+        # Don't wait for stragglers (leaving a `with` block would); unstarted accounts are dropped
+        executor.shutdown(wait=False, cancel_futures=True)
+    for future, username in futures.items():
+        if future in late:
+            account_status[username] = False
+            continue
+        try:
+            items = future.result()
+            all_items.extend(items)
+            account_status[username] = len(items) > 0
+        except Exception as e:
+            logger.warning(f"Twitter fetch for @{username} failed: {e}")
+            account_status[username] = False
+    if late:
+        logger.warning(f"Twitter: deadline reached with {len(late)} accounts unfinished "
+                       f"({', '.join('@' + futures[f] for f in late)}); keeping the "
+                       f"{len(futures) - len(late)} that finished")
 
     if all_items:
         # Filter out stale items (prevents ancient posts from filling cache when sources fail)
-        now_utc = datetime.now(ZoneInfo("UTC"))
-        max_age = timedelta(hours=OSINT_MAX_AGE_HOURS)
-        fresh_items = []
-        for item in all_items:
-            ts = item.get("timestamp", "")
-            if ts:
-                try:
-                    item_dt = datetime.fromisoformat(ts)
-                    if item_dt.tzinfo is None:
-                        item_dt = item_dt.replace(tzinfo=ZoneInfo("UTC"))
-                    if (now_utc - item_dt) > max_age:
-                        continue
-                except (ValueError, TypeError):
-                    pass  # Keep items with unparseable timestamps
-            fresh_items.append(item)
-        all_items = fresh_items
-
-        all_items.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
-        cache["twitter_list"] = {
-            "items": all_items[:MAX_ITEMS_PER_FEED],
-            "last_updated": datetime.now(),
-            "error": None,
-            "account_status": account_status,
-            "source": "twitter",
-        }
+        all_items = _sort_newest_first(_filter_by_age(all_items, OSINT_MAX_AGE_HOURS))
+        publish(
+            "twitter_list",
+            # Room for every profile's accounts; each profile's view keeps its own MAX_ITEMS_PER_FEED
+            items=all_items[:MAX_ITEMS_PER_FEED * len(profiles.all_profiles())],
+            last_updated=datetime.now(),
+            error=None,
+            account_status=account_status,
+            source="twitter",
+        )
         logger.info(f"Got {len(all_items)} total items from Twitter accounts")
     else:
         # 5th fallback: Google News RSS for the monitored topics
         logger.info("All Twitter methods failed, trying Google News fallback...")
-        gnews_items = _fetch_twitter_google_news_fallback()
+        with tracing.span("method", method="google_news"), OSINT_METHOD_DURATION.time(method="google_news"):
+            gnews_items = _fetch_twitter_google_news_fallback()
+        OSINT_METHOD_ATTEMPTS.inc(method="google_news", result="items" if gnews_items else "empty")
         if gnews_items:
             all_items = gnews_items
-            cache["twitter_list"] = {
-                "items": gnews_items[:MAX_ITEMS_PER_FEED],
-                "last_updated": datetime.now(),
-                "error": "Feeds unavailable — showing news via Google News",
-                "account_status": account_status,
-                "source": "google_news",
-            }
+            publish(
+                "twitter_list",
+                items=gnews_items[:MAX_ITEMS_PER_FEED],
+                last_updated=datetime.now(),
+                error="Feeds unavailable — showing news via Google News",
+                account_status=account_status,
+                source="google_news",
+            )
             logger.info(f"Got {len(gnews_items)} items from Google News fallback")
         else:
-            cache["twitter_list"]["account_status"] = account_status
-            cache["twitter_list"]["source"] = "none"
+            failed = {"account_status": account_status, "source": "none"}
             if not cache["twitter_list"]["items"]:
-                cache["twitter_list"]["error"] = "Could not fetch any OSINT feeds"
+                failed["error"] = "Could not fetch any OSINT feeds"
+            publish("twitter_list", **failed)
             logger.warning("All Twitter account fetches failed (including Google News)")
 
 
-def _fetch_twitter_google_news_fallback() -> List[Dict]:
+def _fetch_twitter_google_news_fallback() -> List[FeedItem]:
     """Fallback: fetch related news from Google News RSS when Twitter is unavailable."""
     all_items = []
     for query in TWITTER_TOPIC_QUERIES:
+        if _out_of_time("google_news_query"):
+            break
         url = GOOGLE_NEWS_TWITTER_FALLBACK.format(query=query.replace(" ", "+"))
         response = safe_request(url, timeout=10)
         if response:
-            feed = feedparser.parse(response.content)
+            feed = parse_feed(response.content)
             for entry in feed.entries[:3]:
-                # Google News titles use format "Headline - Source Name"
-                title = entry.get("title", "")
-                source = "News"
-                if " - " in title:
-                    parts = title.rsplit(" - ", 1)
-                    title = parts[0]
-                    source = parts[1] if len(parts) > 1 else "News"
-                all_items.append({
-                    "author": source,
-                    "text": title[:300] + ("..." if len(title) > 300 else ""),
-                    "timestamp": entry.get("published", ""),
-                    "timestamp_display": format_timestamp(entry.get("published", "")),
-                    "link": entry.get("link", ""),
-                })
+                all_items.append(memo_entry("google_news_fallback", entry, _GOOGLE_NEWS_FIELDS,
+                                            lambda: _google_news_item(entry)))
     return all_items
 
 
-def _fetch_via_syndication(username: str) -> List[Dict]:
+_GOOGLE_NEWS_FIELDS = ("title", "published", "link")
+
+
+def _google_news_item(entry) -> FeedItem:
+    # Google News titles use format "Headline - Source Name"
+    title = entry.get("title", "")
+    source = "News"
+    if " - " in title:
+        parts = title.rsplit(" - ", 1)
+        title = parts[0]
+        source = parts[1] if len(parts) > 1 else "News"
+    return FeedItem(
+        author=source,
+        text=title[:300] + ("..." if len(title) > 300 else ""),
+        timestamp=entry.get("published", ""),
+        timestamp_display=format_timestamp(entry.get("published", "")),
+        link=entry.get("link", ""),
+        feed_source="osint",
+    )
+
+
+def _fetch_via_syndication(username: str) -> List[FeedItem]:
     """Method 1: Twitter syndication API (fastest when available)."""
     url = f"https://syndication.twitter.com/srv/timeline-profile/screen-name/{username}"
     try:
@@ -864,7 +1979,7 @@ def _fetch_via_syndication(username: str) -> List[Dict]:
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
         }
-        response = requests.get(url, timeout=TWITTER_SYNDICATION_TIMEOUT, headers=headers)
+        response = http_get(url, timeout=TWITTER_SYNDICATION_TIMEOUT, headers=headers)
         if response.status_code == 200:
             return parse_twitter_syndication(response.text, username)
     except Exception as e:
@@ -872,14 +1987,14 @@ def _fetch_via_syndication(username: str) -> List[Dict]:
     return []
 
 
-def _fetch_via_bluesky(username: str) -> List[Dict]:
+def _fetch_via_bluesky(username: str) -> List[FeedItem]:
     """Method 2: BlueSky AT Protocol API (public, no auth needed)."""
     bsky_handle = BLUESKY_HANDLES.get(username)
     if not bsky_handle:
         return []  # This account isn't on BlueSky
     try:
         url = f"{BLUESKY_API_BASE}/app.bsky.feed.getAuthorFeed?actor={bsky_handle}&limit=10"
-        response = requests.get(url, timeout=8)
+        response = http_get(url, timeout=8)
         response.raise_for_status()
         data = response.json()
 
@@ -891,13 +2006,14 @@ def _fetch_via_bluesky(username: str) -> List[Dict]:
             if not text:
                 continue
             created_at = record.get("createdAt", "")
-            items.append({
-                "author": username,
-                "text": text[:300] + ("..." if len(text) > 300 else ""),
-                "timestamp": created_at,
-                "timestamp_display": format_timestamp(created_at),
-                "link": f"https://bsky.app/profile/{bsky_handle}",
-            })
+            items.append(FeedItem(
+                author=username,
+                text=text[:300] + ("..." if len(text) > 300 else ""),
+                timestamp=created_at,
+                timestamp_display=format_timestamp(created_at),
+                link=f"https://bsky.app/profile/{bsky_handle}",
+                feed_source="osint",
+            ))
         if items:
             logger.info(f"BlueSky got {len(items)} posts for @{username}")
         return items
@@ -906,21 +2022,35 @@ def _fetch_via_bluesky(username: str) -> List[Dict]:
         return []
 
 
-def _fetch_via_twstalker(username: str) -> List[Dict]:
+def _fetch_via_twstalker(username: str) -> List[FeedItem]:
     """Method 3: TwStalker HTML scraping (reliable, server-rendered).
 
     Uses curl subprocess because twstalker blocks Python requests via TLS fingerprinting.
     """
     url = f"{TWSTALKER_BASE}/{username}"
     try:
-        with _twstalker_semaphore:
-            result = subprocess.run(
-                ["curl", "-s", "--connect-timeout", "8", "--max-time", str(TWSTALKER_TIMEOUT),
-                 "-H", "User-Agent: Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-                 url],
-                capture_output=True, text=True, timeout=TWSTALKER_TIMEOUT + 5,
-            )
-        html = result.stdout
+        host = urlsplit(url).hostname or ""
+        with _twstalker_semaphore, tracing.span("http", host=host, via="curl") as sp:
+            start = time.perf_counter()
+            if _replayer:
+                entry = _replayer.entry(url)
+                stdout = f"{replay.Replayer.body(entry).decode()}\n{entry['status']:03d}" if entry else "\n000"
+            else:
+                budget = deadlines.timeout(TWSTALKER_TIMEOUT)
+                stdout = subprocess.run(
+                    ["curl", "-s", "--connect-timeout", f"{min(8, budget):.1f}", "--max-time", f"{budget:.1f}",
+                     "-H", "User-Agent: Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+                     "-w", "\n%{http_code}", url],
+                    capture_output=True, text=True, timeout=budget + 5,
+                ).stdout
+            # -w appends the status code on its own line ("000" when curl failed)
+            html, _, status = stdout.rpartition("\n")
+            latency = time.perf_counter() - start
+            _record_http(host, status if status.strip("0") else "error", len(html.encode()), latency)
+            if _recorder:
+                _recorder.record(url, int(status or 0), {}, html.encode(), latency)
+            if sp:
+                sp.set(status=status, bytes=len(html))
         if not html or len(html) < 1000:
             return []
         return parse_twstalker_profile(html, username)
@@ -949,77 +2079,118 @@ def _relative_to_iso(relative_str: str) -> str:
         "week": timedelta(weeks=amount),
         "month": timedelta(days=amount * 30),
     }
-    approx_time = datetime.now() - delta_map.get(unit, timedelta(0))
+    approx_time = datetime.now(timezone.utc) - delta_map.get(unit, timedelta(0))
     return approx_time.isoformat()
 
 
-def parse_twstalker_profile(html: str, username: str) -> List[Dict]:
-    """Parse TwStalker profile page for tweets."""
+# TwStalker scanner. Blocks start at every activity-group1 div. Within a block
+# one compiled pattern matches only text runs (">text", i.e. whatever follows a
+# tag) and script/style/svg bodies (so their contents never count as text);
+# the regex engine steps over ordinary tags itself. A body is deleted text, so
+# whatever starts right after its closing '>' (a text run or another body)
+# continues the current line. Any other gap between matches is a tag, i.e. a
+# line break.
+_TWSTALKER_BLOCK = '<div class="activity-group1">'
+_TWSTALKER_SCAN = re.compile(
+    r'<(?:script[^>]*>.*?</script|style[^>]*>.*?</style|svg[^>]*>.*?</svg)(?=>)|>[^<]+',
+    re.S,
+)
+_TWSTALKER_STATUS_LINK = re.compile(r'href="(/([^/]+)/status/(\d+))"')
+_TWSTALKER_RELATIVE_TIME = re.compile(r'(\d+ (?:seconds?|minutes?|hours?|days?|weeks?|months?) ago)')
+_TWSTALKER_NUMBER = re.compile(r'^[\d,\.]+$')
+
+
+def _tweet_text_lines(raw_text: str, out: List[str]) -> None:
+    """Append lines of `raw_text` that look like tweet content (not counters,
+    relative times or bare URLs) to `out`."""
+    for l in unescape(raw_text).split("\n"):
+        l = l.strip()
+        if (len(l) > 20 and 'ago' not in l.lower()
+                and not _TWSTALKER_NUMBER.match(l) and not l.startswith('http')):
+            out.append(l)
+
+
+def _scan_twstalker_text(html: str, pos: int, end: int) -> List[str]:
+    """Tweet text lines of the block html[pos:end], stopping after three."""
+    text_lines: List[str] = []
+    line = []  # text runs not separated by a tag
+    line_end = pos  # where the current line's next run must start to continue it
+    # From the block marker's closing '>', which starts the first text run
+    for token in _TWSTALKER_SCAN.finditer(html, pos - 1, end):
+        value = token.group()
+        is_text = value[0] == ">"
+        if token.start() + is_text != line_end and line:  # a text run's content starts after its '>'
+            raw = "".join(line)
+            if len(raw) > 20:  # shorter runs (names, counters) can't hold a content line
+                _tweet_text_lines(raw, text_lines)
+                if len(text_lines) >= 3:
+                    return text_lines
+            line = []
+        if is_text:
+            line.append(value[1:])
+            line_end = token.end()
+        else:
+            line_end = token.end() + 1  # past the body's closing '>'
+
+    if line:
+        _tweet_text_lines("".join(line), text_lines)
+    return text_lines
+
+
+@tracing.traced("parse")
+def parse_twstalker_profile(html: str, username: str, limit: int = 5) -> List[FeedItem]:
+    """Parse TwStalker profile page for the first `limit` tweets.
+
+    Jumps from block to block with str.find and stops as soon as `limit`
+    tweets are found, so the rest of the (~500KB) page is never scanned.
+    """
     items = []
-    # Split by activity-group1 blocks (each is a tweet)
-    blocks = re.split(r'<div class="activity-group1">', html)
+    pos = html.find(_TWSTALKER_BLOCK)
+    while pos != -1 and len(items) < limit:
+        pos += len(_TWSTALKER_BLOCK)
+        end = html.find(_TWSTALKER_BLOCK, pos)
+        block_end = len(html) if end == -1 else end
+        block_start, pos = pos, end
+
+        # Extract tweet link and ID
+        link_match = _TWSTALKER_STATUS_LINK.search(html, block_start, block_end)
+        if not link_match:
+            continue
+        original_author = link_match.group(2)
+        link = f"https://twitter.com{link_match.group(1)}"
 
-    for block in blocks[1:]:  # Skip pre-content
-        if len(items) >= 5:
-            break
-        try:
-            # Extract tweet link and ID
-            link_match = re.search(r'href="(/([^/]+)/status/(\d+))"', block)
-            if not link_match:
-                continue
-            original_author = link_match.group(2)
-            link = f"https://twitter.com{link_match.group(1)}"
+        text = ' '.join(_scan_twstalker_text(html, block_start, block_end)[:3]).strip()
+        if not text:
+            continue  # Skip media-only tweets
 
-            # Extract relative timestamp
-            time_match = re.search(
-                r'(\d+ (?:seconds?|minutes?|hours?|days?|weeks?|months?) ago)',
-                block,
-            )
-            timestamp_display = time_match.group(1) if time_match else ""
-
-            # Extract text: strip HTML tags, SVGs, scripts
-            clean = re.sub(r'<script[^>]*>.*?</script>', '', block, flags=re.S)
-            clean = re.sub(r'<style[^>]*>.*?</style>', '', clean, flags=re.S)
-            clean = re.sub(r'<svg[^>]*>.*?</svg>', '', clean, flags=re.S)
-            clean = re.sub(r'<[^>]+>', '\n', clean)
-            clean = unescape(clean)
-
-            # Filter to lines that look like tweet content
-            lines = [l.strip() for l in clean.split('\n') if l.strip()]
-            text_lines = [
-                l for l in lines
-                if len(l) > 20
-                and 'ago' not in l.lower()
-                and not re.match(r'^[\d,\.]+$', l)
-                and not l.startswith('http')
-            ]
-            text = ' '.join(text_lines[:3]).strip()
-            if not text:
-                continue  # Skip media-only tweets
+        # Extract relative timestamp
+        time_match = _TWSTALKER_RELATIVE_TIME.search(html, block_start, block_end)
+        timestamp_display = time_match.group(1) if time_match else ""
 
-            text = (lambda t: t[:300] + ("..." if len(t) > 300 else ""))(text)
+        text = (lambda t: t[:300] + ("..." if len(t) > 300 else ""))(text)
 
-            # Show original author if it's a retweet
-            author = username
-            if original_author.lower() != username.lower():
-                text = f"RT @{original_author}: {text}"
+        # Show original author if it's a retweet
+        author = username
+        if original_author.lower() != username.lower():
+            text = f"RT @{original_author}: {text}"
 
-            items.append({
-                "author": author,
-                "text": text,
-                "timestamp": _relative_to_iso(timestamp_display),  # Approximate ISO for sorting
-                "timestamp_display": timestamp_display,
-                "link": link,
-            })
-        except Exception:
-            continue
+        items.append(FeedItem(
+            author=author,
+            text=text,
+            timestamp=_relative_to_iso(timestamp_display),  # Approximate ISO for sorting
+            timestamp_display=timestamp_display,
+            link=link,
+            feed_source="osint",
+        ))
 
     return items
 
 
-def _fetch_via_nitter_html(username: str) -> List[Dict]:
+def _fetch_via_nitter_html(username: str) -> List[FeedItem]:
     """Method 5: Nitter HTML scraping (last resort)."""
     for instance in get_healthy_nitter_instances()[:4]:
+        if _out_of_time("nitter_instance"):
+            break
         # Respect xcancel backoff from RSS 429s
         if "xcancel" in instance and _xcancel_backoff_until and datetime.now() < _xcancel_backoff_until:
             continue
@@ -1039,7 +2210,7 @@ def _fetch_via_nitter_html(username: str) -> List[Dict]:
     return []
 
 
-def fetch_single_twitter_account(username: str) -> List[Dict]:
+def fetch_single_twitter_account(username: str) -> List[FeedItem]:
     """Fetch tweets from a single account via multiple fallback methods."""
     logger.info(f"Fetching @{username}...")
 
@@ -1057,41 +2228,51 @@ def fetch_single_twitter_account(username: str) -> List[Dict]:
     if last_ok:
         methods.sort(key=lambda m: 0 if m[0] == last_ok else 1)
 
-    for method_name, method_fn in methods:
-        try:
-            items = method_fn()
-            if items:
-                _twitter_method_cache[username] = method_name
-                logger.info(f"Got {len(items)} tweets from @{username} via {method_name}")
-                return items
-        except Exception as e:
-            logger.debug(f"{method_name} failed for @{username}: {e}")
-            continue
+    with tracing.span("account", account=username):
+        for method_name, method_fn in methods:
+            if _out_of_time("osint_method"):
+                break
+            try:
+                with tracing.span("method", method=method_name), OSINT_METHOD_DURATION.time(method=method_name):
+                    items = method_fn()
+                OSINT_METHOD_ATTEMPTS.inc(method=method_name, result="items" if items else "empty")
+                if items:
+                    _twitter_method_cache[username] = method_name
+                    logger.info(f"Got {len(items)} tweets from @{username} via {method_name}")
+                    return items
+            except Exception as e:
+                OSINT_METHOD_ATTEMPTS.inc(method=method_name, result="error")
+                logger.debug(f"{method_name} failed for @{username}: {e}")
+                continue
 
-    logger.warning(f"All methods failed for @{username}")
+        logger.warning(f"All methods failed for @{username}")
     return []
 
 
-def fetch_twitter_via_nitter_rss(username: str) -> List[Dict]:
+def fetch_twitter_via_nitter_rss(username: str) -> List[FeedItem]:
     """Try fetching tweets via Nitter RSS feeds (more reliable than HTML scraping)."""
     global _xcancel_backoff_until, _xcancel_backoff_minutes
 
     for instance in get_healthy_nitter_instances()[:3]:
+        if _out_of_time("nitter_instance"):
+            break
         try:
             rss_url = f"https://{instance}/{username}/rss"
             # xcancel.com requires "mistique" User-Agent for RSS access
             if "xcancel" in instance:
                 # Skip if in backoff period from a previous 429
                 if _xcancel_backoff_until and datetime.now() < _xcancel_backoff_until:
+                    BACKOFF_SKIPS.inc(feed="xcancel")
                     logger.debug(f"xcancel: skipping @{username}, backoff active")
                     continue
                 try:
-                    response = requests.get(
+                    response = http_get(
                         rss_url,
                         timeout=NITTER_TIMEOUT,
                         headers={"User-Agent": XCANCEL_USER_AGENT},
                     )
                     if response.status_code == 429:
+                        BACKOFFS.inc(feed="xcancel")
                         _xcancel_backoff_until = datetime.now() + timedelta(minutes=_xcancel_backoff_minutes)
                         logger.warning(f"xcancel rate-limited (429), backing off for {_xcancel_backoff_minutes}m")
                         _xcancel_backoff_minutes = min(_xcancel_backoff_minutes * 2, 30)
@@ -1112,7 +2293,7 @@ def fetch_twitter_via_nitter_rss(username: str) -> List[Dict]:
             else:
                 response = safe_request(rss_url, timeout=NITTER_TIMEOUT)
             if response:
-                feed = feedparser.parse(response.content)
+                feed = parse_feed(response.content)
                 if feed.entries:
                     # Check first entry for error content (e.g. "RSS reader not yet whitelisted")
                     first_text = clean_html(
@@ -1126,13 +2307,14 @@ def fetch_twitter_via_nitter_rss(username: str) -> List[Dict]:
                     record_nitter_success(instance)
                     items = []
                     for entry in feed.entries[:5]:
-                        items.append({
-                            "author": username,
-                            "text": (lambda t: t[:300] + ("..." if len(t) > 300 else ""))(clean_html(entry.get("title", "") or entry.get("description", ""))),
-                            "timestamp": entry.get("published", ""),
-                            "timestamp_display": format_timestamp(entry.get("published", "")),
-                            "link": entry.get("link", f"https://twitter.com/{username}"),
-                        })
+                        items.append(FeedItem(
+                            author=username,
+                            text=(lambda t: t[:300] + ("..." if len(t) > 300 else ""))(clean_html(entry.get("title", "") or entry.get("description", ""))),
+                            timestamp=entry.get("published", ""),
+                            timestamp_display=format_timestamp(entry.get("published", "")),
+                            link=entry.get("link", f"https://twitter.com/{username}"),
+                            feed_source="osint",
+                        ))
                     if items:
                         return items
             record_nitter_failure(instance)
@@ -1142,10 +2324,14 @@ def fetch_twitter_via_nitter_rss(username: str) -> List[Dict]:
     return []
 
 
-def parse_twitter_syndication(html: str, username: str) -> List[Dict]:
+_SYNDICATION_TWEETS = html_strainer(lambda name, attrs: "timeline-Tweet" in _class_tokens(attrs))
+
+
+@tracing.traced("parse")
+def parse_twitter_syndication(html: str, username: str) -> List[FeedItem]:
     """Parse Twitter's syndication timeline response."""
     items = []
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_html(html, _SYNDICATION_TWEETS)
 
     # Twitter syndication uses specific classes for tweets
     tweets = soup.select(".timeline-Tweet")
@@ -1156,23 +2342,28 @@ def parse_twitter_syndication(html: str, username: str) -> List[Dict]:
             time_elem = tweet.select_one("time")
 
             if text_elem:
-                items.append({
-                    "author": username,
-                    "text": (lambda t: t[:300] + ("..." if len(t) > 300 else ""))(text_elem.get_text(strip=True)),
-                    "timestamp": time_elem.get("datetime", "") if time_elem else "",
-                    "timestamp_display": time_elem.get_text(strip=True) if time_elem else "",
-                    "link": f"https://twitter.com/{username}",
-                })
+                items.append(FeedItem(
+                    author=username,
+                    text=(lambda t: t[:300] + ("..." if len(t) > 300 else ""))(text_elem.get_text(strip=True)),
+                    timestamp=time_elem.get("datetime", "") if time_elem else "",
+                    timestamp_display=time_elem.get_text(strip=True) if time_elem else "",
+                    link=f"https://twitter.com/{username}",
+                    feed_source="osint",
+                ))
         except Exception:
             continue
 
     return items
 
 
-def parse_nitter_profile(html: str, username: str) -> List[Dict]:
+_NITTER_TIMELINE_ITEMS = html_strainer(lambda name, attrs: "timeline-item" in _class_tokens(attrs))
+
+
+@tracing.traced("parse")
+def parse_nitter_profile(html: str, username: str) -> List[FeedItem]:
     """Parse Nitter profile page HTML."""
     items = []
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_html(html, _NITTER_TIMELINE_ITEMS)
 
     tweets = soup.select(".timeline-item")
 
@@ -1188,13 +2379,14 @@ def parse_nitter_profile(html: str, username: str) -> List[Dict]:
             time_elem = tweet.select_one(".tweet-date a")
 
             if content_elem:
-                items.append({
-                    "author": username,
-                    "text": content_elem.get_text(strip=True),
-                    "timestamp": time_elem.get("title", "") if time_elem else "",
-                    "timestamp_display": time_elem.get_text(strip=True) if time_elem else "",
-                    "link": f"https://twitter.com/{username}",
-                })
+                items.append(FeedItem(
+                    author=username,
+                    text=content_elem.get_text(strip=True),
+                    timestamp=time_elem.get("title", "") if time_elem else "",
+                    timestamp_display=time_elem.get_text(strip=True) if time_elem else "",
+                    link=f"https://twitter.com/{username}",
+                    feed_source="osint",
+                ))
         except Exception:
             continue
 
@@ -1209,6 +2401,7 @@ def fetch_trump() -> None:
 
     # Respect rate-limit backoff
     if _trump_backoff_until and datetime.now() < _trump_backoff_until:
+        BACKOFF_SKIPS.inc(feed="trump")
         remaining = (_trump_backoff_until - datetime.now()).total_seconds() / 60
         logger.info(f"Trump: skipping fetch, rate-limit backoff active ({remaining:.0f}m remaining)")
         return
@@ -1224,32 +2417,16 @@ def fetch_trump() -> None:
         got_rate_limited = True
 
     if response:
-        feed = feedparser.parse(response.content)
+        feed = parse_feed(response.content)
         if feed.entries:
             items = []
             for entry in feed.entries[:MAX_ITEMS_PER_FEED]:
-                # Get content - try multiple fields
-                content = entry.get("summary", "") or entry.get("description", "") or entry.get("title", "")
-                _raw = extract_text_with_links(content)
-                text = (_raw[:500] + ("..." if len(_raw) > 500 else "")).strip()
-
+                item = memo_entry("trump", entry, _TRUMP_RSS_FIELDS, lambda: _trump_rss_item(entry))
                 # Skip empty posts (media-only, retruths with no text)
-                if not text:
-                    continue
+                if item is not None:
+                    items.append(item)
 
-                items.append({
-                    "author": "realDonaldTrump",
-                    "text": text,
-                    "timestamp": entry.get("published", ""),
-                    "timestamp_display": format_timestamp(entry.get("published", "")),
-                    "link": entry.get("link", ""),
-                })
-
-            cache["trump"] = {
-                "items": items,
-                "last_updated": datetime.now(),
-                "error": None,
-            }
+            publish("trump", items=items, last_updated=datetime.now(), error=None)
             # Reset backoff on success
             _trump_backoff_until = None
             _trump_backoff_minutes = 5
@@ -1257,6 +2434,7 @@ def fetch_trump() -> None:
             return
 
     if got_rate_limited:
+        BACKOFFS.inc(feed="trump")
         _trump_backoff_until = datetime.now() + timedelta(minutes=_trump_backoff_minutes)
         logger.warning(f"Trump feed rate-limited, backing off for {_trump_backoff_minutes}m")
         _trump_backoff_minutes = min(_trump_backoff_minutes * 2, 30)
@@ -1265,10 +2443,12 @@ def fetch_trump() -> None:
     # (Nitter uses a different host, so Trump backoff doesn't block it)
     logger.info("Trying Twitter mirror fallback for Trump...")
     for instance in get_healthy_nitter_instances()[:4]:
+        if _out_of_time("trump_mirror"):
+            break
         url = f"https://{instance}/{TRUMP_TWITTER_MIRROR}/rss"
         response = safe_request(url, timeout=NITTER_TIMEOUT)
         if response:
-            feed = feedparser.parse(response.content)
+            feed = parse_feed(response.content)
             if feed.entries:
                 # Check for Nitter error content
                 first_text = clean_html(
@@ -1281,32 +2461,59 @@ def fetch_trump() -> None:
 
                 items = []
                 for entry in feed.entries[:MAX_ITEMS_PER_FEED]:
-                    title = entry.get("title", "")
-                    text = clean_html(title)[:400].strip()
-                    if not text:
-                        continue
-                    items.append({
-                        "author": "TrumpDailyPosts",
-                        "text": text,
-                        "timestamp": entry.get("published", ""),
-                        "timestamp_display": format_timestamp(entry.get("published", "")),
-                        "link": entry.get("link", ""),
-                    })
-
-                cache["trump"] = {
-                    "items": items,
-                    "last_updated": datetime.now(),
-                    "error": "Using Twitter mirror (Truth Social RSS unavailable)",
-                }
+                    item = memo_entry("trump_mirror", entry, _TRUMP_MIRROR_FIELDS,
+                                      lambda: _trump_mirror_item(entry))
+                    if item is not None:
+                        items.append(item)
+
+                publish("trump", items=items, last_updated=datetime.now(),
+                        error="Using Twitter mirror (Truth Social RSS unavailable)")
                 logger.info(f"Got {len(items)} Trump posts from Twitter mirror")
                 return
 
     # All methods failed
     if not cache["trump"]["items"]:
-        cache["trump"]["error"] = "Could not fetch Trump posts"
+        publish("trump", error="Could not fetch Trump posts")
     logger.warning("All methods failed for Trump feed")
 
 
+_TRUMP_RSS_FIELDS = ("summary", "description", "title", "published", "link")
+_TRUMP_MIRROR_FIELDS = ("title", "published", "link")
+
+
+def _trump_rss_item(entry) -> Optional[FeedItem]:
+    """Truth Social RSS entry → FeedItem (None for posts with no text)."""
+    # Get content - try multiple fields
+    content = entry.get("summary", "") or entry.get("description", "") or entry.get("title", "")
+    _raw = extract_text_with_links(content)
+    text = (_raw[:500] + ("..." if len(_raw) > 500 else "")).strip()
+    if not text:
+        return None
+    return FeedItem(
+        author="realDonaldTrump",
+        text=text,
+        timestamp=entry.get("published", ""),
+        timestamp_display=format_timestamp(entry.get("published", "")),
+        link=entry.get("link", ""),
+        feed_source="trump",
+    )
+
+
+def _trump_mirror_item(entry) -> Optional[FeedItem]:
+    """Nitter RSS entry from the Twitter mirror account → FeedItem (None if empty)."""
+    text = clean_html(entry.get("title", ""))[:400].strip()
+    if not text:
+        return None
+    return FeedItem(
+        author="TrumpDailyPosts",
+        text=text,
+        timestamp=entry.get("published", ""),
+        timestamp_display=format_timestamp(entry.get("published", "")),
+        link=entry.get("link", ""),
+        feed_source="trump",
+    )
+
+
 # ============ REUTERS MIDDLE EAST FETCHER ============
 
 def fetch_reuters() -> None:
@@ -1315,13 +2522,12 @@ def fetch_reuters() -> None:
 
     # Respect rate-limit backoff
     if _reuters_backoff_until and datetime.now() < _reuters_backoff_until:
+        BACKOFF_SKIPS.inc(feed="reuters")
         remaining = (_reuters_backoff_until - datetime.now()).total_seconds() / 60
         logger.info(f"Reuters: skipping fetch, rate-limit backoff active ({remaining:.0f}m remaining)")
         return
 
     logger.info("Fetching Middle East news...")
-    now = datetime.now(ZoneInfo("UTC"))
-    max_age = timedelta(hours=NEWS_FEED_MAX_AGE_HOURS)
 
     # Try sources in order: primary Google News, then BBC fallback
     sources = [
@@ -1330,45 +2536,33 @@ def fetch_reuters() -> None:
     ]
 
     for url, source_name in sources:
+        if _out_of_time("news_source"):
+            break
         try:
             response = safe_request(url, raise_on_429=True)
         except RateLimitError:
+            BACKOFFS.inc(feed="reuters")
             _reuters_backoff_until = datetime.now() + timedelta(minutes=_reuters_backoff_minutes)
             logger.warning(f"Reuters/{source_name} rate-limited, backing off for {_reuters_backoff_minutes}m")
             _reuters_backoff_minutes = min(_reuters_backoff_minutes * 2, 30)
             continue
 
         if response:
-            feed = feedparser.parse(response.content)
+            feed = parse_feed(response.content)
             if feed.entries:
                 items = []
+                cutoff = _age_cutoff(NEWS_FEED_MAX_AGE_HOURS)
                 for entry in feed.entries[:MAX_ITEMS_PER_FEED * 2]:  # Fetch extra to compensate for age filtering
-                    # Filter out stale entries
-                    published = entry.get("published", "")
-                    try:
-                        pub_dt = parsedate_to_datetime(published)
-                        if pub_dt.tzinfo is None:
-                            pub_dt = pub_dt.replace(tzinfo=ZoneInfo("UTC"))
-                        if (now - pub_dt) > max_age:
-                            continue
-                    except (ValueError, TypeError):
-                        pass  # Unparseable timestamps pass through
-                    items.append({
-                        "title": entry.get("title", ""),
-                        "summary": clean_html(entry.get("summary", ""))[:250],
-                        "timestamp": published,
-                        "timestamp_display": format_timestamp(published),
-                        "link": entry.get("link", ""),
-                    })
+                    item = memo_entry("reuters", entry, _NEWS_RSS_FIELDS, lambda: _news_rss_item(entry, 250))
+                    # Filter out stale entries (unparseable timestamps pass through)
+                    if item.epoch and item.epoch < cutoff:
+                        continue
+                    items.append(item)
                     if len(items) >= MAX_ITEMS_PER_FEED:
                         break
 
                 error_msg = None if source_name == "Google News" else f"Primary source unavailable — showing {source_name}"
-                cache["reuters"] = {
-                    "items": items,
-                    "last_updated": datetime.now(),
-                    "error": error_msg,
-                }
+                publish("reuters", items=items, last_updated=datetime.now(), error=error_msg)
                 # Reset backoff on success
                 _reuters_backoff_until = None
                 _reuters_backoff_minutes = 5
@@ -1377,10 +2571,26 @@ def fetch_reuters() -> None:
 
     # All sources failed
     if not cache["reuters"]["items"]:
-        cache["reuters"]["error"] = "Could not fetch news feed (all sources failed)"
+        publish("reuters", error="Could not fetch news feed (all sources failed)")
     logger.warning("All news sources failed for Middle East feed")
 
 
+_NEWS_RSS_FIELDS = ("title", "summary", "published", "link")
+
+
+def _news_rss_item(entry, summary_chars: int, source: str = "") -> FeedItem:
+    """News RSS entry (Reuters/BBC, TOI) → FeedItem with a plain-text summary."""
+    published = entry.get("published", "")
+    return FeedItem(
+        title=entry.get("title", ""),
+        summary=clean_html(entry.get("summary", ""))[:summary_chars],
+        timestamp=published,
+        timestamp_display=format_timestamp(published),
+        link=entry.get("link", ""),
+        source=source,
+    )
+
+
 # ============ TIMES OF ISRAEL FETCHER ============
 
 # Exponential backoff state for TOI rate limiting (429s)
@@ -1393,6 +2603,7 @@ def fetch_toi() -> None:
 
     # Skip if we're in a backoff period from a previous 429
     if _toi_backoff_until and datetime.now() < _toi_backoff_until:
+        BACKOFF_SKIPS.inc(feed="toi")
         remaining = (_toi_backoff_until - datetime.now()).total_seconds() / 60
         logger.info(f"TOI: skipping fetch, rate-limit backoff active ({remaining:.0f}m remaining)")
         return
@@ -1409,16 +2620,10 @@ def fetch_toi() -> None:
         response = None
         got_rate_limited = True
     if response:
-        feed = feedparser.parse(response.content)
+        feed = parse_feed(response.content)
         for entry in feed.entries[:10]:
-            rss_items.append({
-                "title": entry.get("title", ""),
-                "summary": clean_html(entry.get("summary", ""))[:200],
-                "timestamp": entry.get("published", ""),
-                "timestamp_display": format_timestamp(entry.get("published", "")),
-                "link": entry.get("link", ""),
-                "source": "rss",
-            })
+            rss_items.append(memo_entry("toi_rss", entry, _NEWS_RSS_FIELDS,
+                                        lambda: _news_rss_item(entry, 200, source="rss")))
         logger.info(f"Got {len(rss_items)} items from TOI RSS")
 
     # Build list of liveblog URLs to try — date-specific FIRST, base URL last.
@@ -1444,14 +2649,15 @@ def fetch_toi() -> None:
 
     # Try each liveblog URL until one works (stop on rate limit)
     for url in liveblog_urls:
+        if _out_of_time("toi_liveblog_url"):
+            break
         try:
             response = safe_request(url, raise_on_429=True)
         except RateLimitError:
             got_rate_limited = True
             break  # Stop trying more URLs — we're rate-limited
         if response:
-            soup = BeautifulSoup(response.content, "html.parser")
-            liveblog_items = parse_toi_liveblog(soup, url)
+            liveblog_items = parse_toi_liveblog(response.content, url)
             if liveblog_items:
                 logger.info(f"Got {len(liveblog_items)} liveblog items from {url}")
                 break
@@ -1461,6 +2667,7 @@ def fetch_toi() -> None:
 
     # Activate exponential backoff on 429
     if got_rate_limited:
+        BACKOFFS.inc(feed="toi")
         _toi_backoff_until = datetime.now() + timedelta(minutes=_toi_backoff_minutes)
         logger.warning(f"TOI rate-limited, backing off for {_toi_backoff_minutes}m")
         _toi_backoff_minutes = min(_toi_backoff_minutes * 2, 30)  # Double up to 30m cap
@@ -1469,11 +2676,8 @@ def fetch_toi() -> None:
     items = liveblog_items + rss_items
 
     if items:
-        cache["toi_liveblog"] = {
-            "items": items[:MAX_ITEMS_PER_FEED],
-            "last_updated": datetime.now(),
-            "error": None if liveblog_items else "Liveblog unavailable, showing RSS only",
-        }
+        publish("toi_liveblog", items=items[:MAX_ITEMS_PER_FEED], last_updated=datetime.now(),
+                error=None if liveblog_items else "Liveblog unavailable, showing RSS only")
         # Reset backoff on successful fetch
         if not got_rate_limited:
             _toi_backoff_until = None
@@ -1483,40 +2687,59 @@ def fetch_toi() -> None:
         # showing an empty column (stale data beats no data on Shabbos)
         old_items = cache["toi_liveblog"].get("items", [])
         if old_items:
-            cache["toi_liveblog"]["error"] = "Showing cached content (fetch failed)"
+            publish("toi_liveblog", error="Showing cached content (fetch failed)")
             logger.warning("TOI fetch failed, preserving %d cached items", len(old_items))
         else:
-            cache["toi_liveblog"]["error"] = "Could not fetch TOI content"
-
-
-def parse_toi_liveblog(soup, source_url: str = "") -> List[Dict]:
-    """Parse Times of Israel liveblog page."""
-    items = []
+            publish("toi_liveblog", error="Could not fetch TOI content")
+
+
+# Selectors for liveblog entries, in priority order
+_TOI_ENTRY_SELECTORS = [
+    ".liveblog-entry",
+    ".live-update",
+    "article.update",
+    ".lb-item",
+    "[data-liveblog-entry]",
+    ".timeline-entry",
+    # Additional selectors for potential TOI redesigns
+    ".liveblog__entry",
+    ".live-blog-entry",
+    "[data-entry-id]",
+    ".blog-entry",
+]
+_TOI_ENTRY_CLASSES = {"liveblog-entry", "live-update", "update", "lb-item", "timeline-entry",
+                      "liveblog__entry", "live-blog-entry", "blog-entry"}
+_TOI_ENTRIES = html_strainer(
+    lambda name, attrs: bool(_TOI_ENTRY_CLASSES & _class_tokens(attrs))
+    or "data-liveblog-entry" in attrs or "data-entry-id" in attrs
+)
 
-    # Try various selectors for liveblog entries
-    selectors = [
-        ".liveblog-entry",
-        ".live-update",
-        "article.update",
-        ".lb-item",
-        "[data-liveblog-entry]",
-        ".timeline-entry",
-        # Additional selectors for potential TOI redesigns
-        ".liveblog__entry",
-        ".live-blog-entry",
-        "[data-entry-id]",
-        ".blog-entry",
-    ]
 
-    entries = []
-    for selector in selectors:
+def _select_toi_entries(soup) -> tuple:
+    """Return (selector, entries) for the first selector that matches."""
+    for selector in _TOI_ENTRY_SELECTORS:
         entries = soup.select(selector)
         if entries:
-            logger.info(f"TOI liveblog matched selector '{selector}' ({len(entries)} entries)")
-            break
+            return selector, entries
+    return None, []
+
+
+@tracing.traced("parse")
+def parse_toi_liveblog(html, source_url: str = "") -> List[FeedItem]:
+    """Parse Times of Israel liveblog page.
+
+    Only entry subtrees are built; the whole page is parsed only when no
+    selector matches (structural fallback and diagnostics need it).
+    """
+    items = []
+
+    selector, entries = _select_toi_entries(parse_html(html, _TOI_ENTRIES))
+    if entries:
+        logger.info(f"TOI liveblog matched selector '{selector}' ({len(entries)} entries)")
 
     # Structural fallback: find containers holding liveblog_entry links
     if not entries:
+        soup = parse_html(html)
         entry_links = soup.select('a[href*="liveblog_entry"], a[href*="liveblog-entry"]')
         if entry_links:
             seen_parents = set()
@@ -1546,14 +2769,15 @@ def parse_toi_liveblog(soup, source_url: str = "") -> List[Dict]:
 
             if content_elem or title_elem:
                 raw_dt = time_elem.get("datetime", "") if time_elem else ""
-                items.append({
-                    "title": title_elem.get_text(strip=True) if title_elem else "",
-                    "summary": content_elem.get_text(strip=True)[:250] if content_elem else "",
-                    "timestamp": raw_dt,
-                    "timestamp_display": format_timestamp(raw_dt, source_tz="Asia/Jerusalem") if raw_dt else "LIVE",
-                    "link": source_url or TOI_LIVEBLOG_URL,
-                    "source": "liveblog",
-                })
+                items.append(FeedItem(
+                    title=title_elem.get_text(strip=True) if title_elem else "",
+                    summary=content_elem.get_text(strip=True)[:250] if content_elem else "",
+                    timestamp=raw_dt,
+                    timestamp_display=format_timestamp(raw_dt, source_tz="Asia/Jerusalem") if raw_dt else "LIVE",
+                    link=source_url or TOI_LIVEBLOG_URL,
+                    source="liveblog",
+                    source_tz="Asia/Jerusalem",
+                ))
         except Exception as e:
             logger.debug(f"Error parsing liveblog entry: {e}")
             continue
@@ -1573,6 +2797,9 @@ def fetch_prediction_markets() -> None:
     errors = []
 
     for market_def in PREDICTION_MARKETS:
+        if _out_of_time("prediction_market"):
+            errors.append("deadline reached")
+            break
         try:
             url = f"{POLYMARKET_API_BASE}/events?slug={market_def['event_slug']}"
             resp = safe_request(url, timeout=POLYMARKET_TIMEOUT)
@@ -1637,12 +2864,10 @@ def fetch_prediction_markets() -> None:
             errors.append(f"{market_def['name']}: {str(e)[:60]}")
 
     if new_items:
-        cache["prediction_markets"]["items"] = new_items
-        cache["prediction_markets"]["last_updated"] = datetime.now()
-        cache["prediction_markets"]["error"] = None
+        publish("prediction_markets", items=new_items, last_updated=datetime.now(), error=None)
         logger.info(f"Prediction markets: " + ", ".join(f"{m['name']} {m['probability']}%" for m in new_items))
     elif errors:
-        cache["prediction_markets"]["error"] = "; ".join(errors[:3])
+        publish("prediction_markets", error="; ".join(errors[:3]))
         logger.warning(f"Prediction markets: all failed — {'; '.join(errors[:3])}")
 
 
@@ -1736,8 +2961,47 @@ def _build_oil_context() -> str:
 # ============ THINK TANK FETCHER ============
 
 # Cache for AI-generated article summaries (keyed by article URL)
-# Persists in memory across refresh cycles so we don't re-summarize
-_article_summary_cache: Dict[str, str] = {}
+# Persists in memory across refresh cycles so we don't re-summarize.
+# LRU-bounded at ARTICLE_SUMMARY_CACHE_MAX (a multi-day run sees many articles).
+_article_summary_cache: "OrderedDict[str, str]" = OrderedDict()
+
+
+def _remember_article_summary(url: str, summary: str) -> None:
+    _article_summary_cache[url] = summary
+    _article_summary_cache.move_to_end(url)
+    while len(_article_summary_cache) > ARTICLE_SUMMARY_CACHE_MAX:
+        _article_summary_cache.popitem(last=False)
+
+
+_ARTICLE_BODY = html_strainer(lambda name, attrs: name == "article")
+_ARTICLE_NOISE = ["nav", "header", "footer", "script", "style", "aside", "form"]
+
+
+@tracing.traced("parse")
+def parse_article_text(html) -> str:
+    """Extract readable text from an article page (first ~3000 chars).
+
+    Most article pages have an <article>, so only that subtree is built; other
+    layouts fall back to parsing the whole page.
+    """
+    soup = parse_html(html, _ARTICLE_BODY)
+    if not soup.find("article"):
+        soup = parse_html(html)
+    # Remove nav, header, footer, script, style elements
+    for tag in soup.find_all(_ARTICLE_NOISE):
+        tag.decompose()
+    # Try common article body selectors
+    article = (
+        soup.find("article")
+        or soup.find("div", class_=re.compile(r"article|post|entry|content", re.I))
+        or soup.find("main")
+        or soup.body
+    )
+    if not article:
+        return ""
+    text = article.get_text(separator="\n", strip=True)
+    # Take first ~3000 chars (enough for a good summary, not too much for the LLM)
+    return text[:3000]
 
 
 def _fetch_article_text(url: str) -> str:
@@ -1746,22 +3010,7 @@ def _fetch_article_text(url: str) -> str:
         response = safe_request(url)
         if not response:
             return ""
-        soup = BeautifulSoup(response.content, "html.parser")
-        # Remove nav, header, footer, script, style elements
-        for tag in soup.find_all(["nav", "header", "footer", "script", "style", "aside", "form"]):
-            tag.decompose()
-        # Try common article body selectors
-        article = (
-            soup.find("article")
-            or soup.find("div", class_=re.compile(r"article|post|entry|content", re.I))
-            or soup.find("main")
-            or soup.body
-        )
-        if not article:
-            return ""
-        text = article.get_text(separator="\n", strip=True)
-        # Take first ~3000 chars (enough for a good summary, not too much for the LLM)
-        return text[:3000]
+        return parse_article_text(response.content)
     except Exception as e:
         logger.debug(f"Failed to fetch article text from {url}: {e}")
         return ""
@@ -1773,7 +3022,9 @@ def _summarize_article(title: str, text: str, api_key: str) -> str:
         return ""
     try:
         client = anthropic.Anthropic(api_key=api_key)
-        message = client.messages.create(
+        message = create_ai_message(
+            client,
+            summary_type="article",
             model=AI_SUMMARY_REGULAR_MODEL,  # Haiku — fast and cheap
             max_tokens=300,
             system="You are a concise analyst. Summarize the following article in 1-2 short paragraphs. Focus on the key argument, findings, or implications. No preamble.",
@@ -1792,40 +3043,68 @@ def _summarize_article(title: str, text: str, api_key: str) -> str:
         return ""
 
 
+@tracing.traced("parse")
+def parse_think_tank_links(html, feed_def: dict) -> list:
+    """Extract article links and titles from a think tank listing page.
+
+    Only <a> subtrees whose href contains the feed's link_pattern are built.
+    """
+    items = []
+    link_pattern = feed_def.get("link_pattern", "/")
+    base_url = feed_def.get("base_url", "")
+    seen_urls = set()
+    only = html_strainer(lambda name, attrs: name == "a" and link_pattern in (attrs.get("href") or ""))
+
+    for a in parse_html(html, only).find_all("a", href=True):
+        href = a["href"]
+        title = a.get_text().strip()
+        if not title or len(title) < 15:
+            continue
+        if link_pattern not in href:
+            continue
+        if not href.startswith("http"):
+            href = base_url + href
+        if href in seen_urls:
+            continue
+        seen_urls.add(href)
+        items.append({
+            "title": title,
+            "link": href,
+            "source": feed_def["name"],
+        })
+        if len(items) >= feed_def["max_items"]:
+            break
+    return items
+
+
 def _scrape_think_tank_page(feed_def: dict) -> list:
     """Scrape a think tank website for article links and titles."""
-    items = []
     try:
         response = safe_request(feed_def["url"])
         if not response:
-            return items
-        soup = BeautifulSoup(response.content, "html.parser")
-        link_pattern = feed_def.get("link_pattern", "/")
-        base_url = feed_def.get("base_url", "")
-        seen_urls = set()
-
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            title = a.get_text().strip()
-            if not title or len(title) < 15:
-                continue
-            if link_pattern not in href:
-                continue
-            if not href.startswith("http"):
-                href = base_url + href
-            if href in seen_urls:
-                continue
-            seen_urls.add(href)
-            items.append({
-                "title": title,
-                "link": href,
-                "source": feed_def["name"],
-            })
-            if len(items) >= feed_def["max_items"]:
-                break
+            return []
+        return parse_think_tank_links(response.content, feed_def)
     except Exception as e:
         logger.warning(f"Scrape failed for {feed_def['name']}: {e}")
-    return items
+        return []
+
+
+_THINK_TANK_RSS_FIELDS = ("title", "published", "link", "author", "dc_creator", "content")
+
+
+def _think_tank_rss_item(entry, source: str) -> tuple:
+    """Think tank RSS entry → (FeedItem, article body text from content:encoded)."""
+    published = entry.get("published", "")
+    item = FeedItem(
+        title=entry.get("title", "").strip(),
+        timestamp=published,
+        timestamp_display=format_timestamp(published),
+        link=entry.get("link", ""),
+        source=source,
+        author=entry.get("author", entry.get("dc_creator", "")),
+    )
+    body = clean_html(entry["content"][0].get("value", ""))[:3000] if entry.get("content") else ""
+    return item, body
 
 
 def fetch_think_tanks() -> None:
@@ -1840,11 +3119,15 @@ def fetch_think_tanks() -> None:
     """
     logger.info("Fetching think tank articles...")
     all_items = []
+    raw_content: Dict[str, str] = {}  # link → article body from RSS content:encoded
     errors = []
     now = datetime.now(ZoneInfo("UTC"))
-    max_age = timedelta(hours=THINK_TANK_MAX_AGE_HOURS)
+    cutoff = _age_cutoff(THINK_TANK_MAX_AGE_HOURS)
 
     for feed_def in THINK_TANK_FEEDS:
+        if _out_of_time("think_tank_source"):
+            errors.append("deadline reached")
+            break
         if feed_def["type"] == "scrape":
             # Direct website scraping (CSIS, ISW)
             scraped = _scrape_think_tank_page(feed_def)
@@ -1853,16 +3136,13 @@ def fetch_think_tanks() -> None:
             for item in scraped:
                 # Use fetch time as fallback timestamp so age filtering works
                 ts = item.get("timestamp", "") or now.isoformat()
-                all_items.append({
-                    "title": item["title"],
-                    "summary": "",
-                    "raw_content": "",
-                    "timestamp": ts,
-                    "timestamp_display": format_timestamp(ts),
-                    "link": item["link"],
-                    "source": item["source"],
-                    "author": "",
-                })
+                all_items.append(FeedItem(
+                    title=item["title"],
+                    timestamp=ts,
+                    timestamp_display=format_timestamp(ts),
+                    link=item["link"],
+                    source=item["source"],
+                ))
             continue
 
         # RSS feed (FDD)
@@ -1877,44 +3157,25 @@ def fetch_think_tanks() -> None:
             continue
 
         try:
-            feed = feedparser.parse(response.content)
+            feed = parse_feed(response.content)
         except Exception as e:
             errors.append(f"{feed_def['name']}: parse error: {e}")
             continue
 
         for entry in feed.entries[:feed_def["max_items"]]:
-            # Parse timestamp and filter by recency
-            published = entry.get("published", "")
-            try:
-                from email.utils import parsedate_to_datetime
-                pub_dt = parsedate_to_datetime(published)
-                if pub_dt.tzinfo is None:
-                    pub_dt = pub_dt.replace(tzinfo=ZoneInfo("UTC"))
-                if (now - pub_dt) > max_age:
-                    continue
-            except (ValueError, TypeError):
-                pass
-
-            title = entry.get("title", "")
-            raw_content = ""
-            if entry.get("content"):
-                raw_content = clean_html(entry["content"][0].get("value", ""))[:3000]
-
-            all_items.append({
-                "title": title.strip(),
-                "summary": "",
-                "raw_content": raw_content,
-                "timestamp": published,
-                "timestamp_display": format_timestamp(published),
-                "link": entry.get("link", ""),
-                "source": feed_def["name"],
-                "author": entry.get("author", entry.get("dc_creator", "")),
-            })
+            item, body = memo_entry("think_tanks", entry, _THINK_TANK_RSS_FIELDS,
+                                    lambda: _think_tank_rss_item(entry, feed_def["name"]))
+            # Filter by recency
+            if item.epoch and item.epoch < cutoff:
+                continue
+            if body:
+                raw_content[item.link] = body
+            all_items.append(item)
 
     if not all_items:
         if errors:
             if not cache["think_tanks"]["items"]:
-                cache["think_tanks"]["error"] = "; ".join(errors)
+                publish("think_tanks", error="; ".join(errors))
             logger.warning(f"Think tanks: all sources failed: {'; '.join(errors)}")
         return
 
@@ -1924,44 +3185,43 @@ def fetch_think_tanks() -> None:
     api_key = os.environ.get("ANTHROPIC_API_KEY") if THINK_TANK_SUMMARIZE else None
     new_summaries = 0
 
-    for item in all_items:
-        url = item["link"]
+    # Items may be shared with the published snapshot (entry memo), so summaries
+    # go on copies rather than being written into them
+    for i, item in enumerate(all_items):
+        url = item.link
 
         # Check cache first
         if url in _article_summary_cache:
-            item["summary"] = _article_summary_cache[url]
+            _article_summary_cache.move_to_end(url)
+            all_items[i] = item.replace(summary=_article_summary_cache[url])
             continue
 
-        # Rate limit: only summarize N new articles per cycle
-        if api_key and new_summaries < THINK_TANK_SUMMARY_MAX_NEW:
-            article_text = item.get("raw_content", "")
+        # Rate limit: only summarize N new articles per cycle (none once out of time)
+        if api_key and new_summaries < THINK_TANK_SUMMARY_MAX_NEW and not _out_of_time("article_summary"):
+            article_text = raw_content.get(url, "")
             if not article_text:
                 article_text = _fetch_article_text(url)
 
             if article_text:
-                summary = _summarize_article(item["title"], article_text, api_key)
+                summary = _summarize_article(item.title, article_text, api_key)
                 if summary:
-                    item["summary"] = summary
-                    _article_summary_cache[url] = summary
+                    all_items[i] = item.replace(summary=summary)
+                    _remember_article_summary(url, summary)
                     new_summaries += 1
-                    continue
-
-        if not item["summary"]:
-            item["summary"] = ""
 
-    # Clean up raw_content from items
-    for item in all_items:
-        item.pop("raw_content", None)
-
-    cache["think_tanks"] = {
-        "items": all_items,
-        "last_updated": datetime.now(),
-        "error": "; ".join(errors) if errors else None,
-    }
+    publish("think_tanks", items=all_items, last_updated=datetime.now(),
+            error="; ".join(errors) if errors else None)
     logger.info(f"Think tanks: {len(all_items)} articles, {new_summaries} newly summarized, {len(_article_summary_cache)} cached")
 
 
 # ============ AI SUMMARY FETCHER ============
+# Summaries are per profile: each is generated from that profile's view of
+# the feeds, with its prompts, and published to its own AI feed.
+
+
+def _ai_feed() -> str:
+    """The active profile's AI feed ("ai_summary" for the default dashboard)."""
+    return profiles.current().ai_feed
 
 
 def _parse_ai_bullets(summary_text: str) -> list:
@@ -2027,12 +3287,14 @@ def _prune_old_summaries() -> None:
 
     Called at startup, before generation, and on dashboard load to ensure
     stale entries beyond the retention window never accumulate or display.
-    Retention is dynamic: 1 day normally, auto-extended during Yom Tov via Hebcal.
+    Retention is dynamic: 1 day normally, auto-extended during Yom Tov via the local calendar.
     """
     retention = _effective_retention_days()
     today_et = datetime.now(ZoneInfo("America/New_York")).date()
+    ai = cache[_ai_feed()]
+    changes = {}
 
-    summaries = cache["ai_summary"].get("summaries", [])
+    summaries = ai.get("summaries", ())
     if summaries:
         filtered = []
         for entry in summaries:
@@ -2047,22 +3309,26 @@ def _prune_old_summaries() -> None:
 
         if len(filtered) < len(summaries):
             logger.info(f"Pruned {len(summaries) - len(filtered)} old AI summaries (keeping {len(filtered)} within {retention}-day window)")
-            cache["ai_summary"]["summaries"] = filtered
+            changes["summaries"] = filtered
 
     # Clear morning summary if outside retention window
-    morning = cache["ai_summary"].get("morning_summary")
+    morning = ai.get("morning_summary")
     if morning:
         try:
             gen_dt = datetime.fromisoformat(morning.get("generated_at", ""))
             if (today_et - gen_dt.date()).days >= retention:
-                cache["ai_summary"]["morning_summary"] = None
+                changes["morning_summary"] = None
                 logger.info(f"Cleared stale morning summary from {gen_dt.date()}")
         except (ValueError, TypeError):
             pass
 
     # Clear items array if no summaries remain
-    if not cache["ai_summary"].get("summaries"):
-        cache["ai_summary"]["items"] = []
+    if not changes.get("summaries", summaries) and ai["items"]:
+        changes["items"] = []
+
+    # Only publish when something was dropped (called on every dashboard render)
+    if changes:
+        publish(_ai_feed(), **changes)
 
 
 def _build_feed_digest() -> str:
@@ -2075,8 +3341,8 @@ def _build_feed_digest() -> str:
         f"{now_israel.strftime('%H:%M')} Israel time"
     ]
 
-    for feed_name, feed_data in cache.items():
-        if feed_name in ("ai_summary", "prediction_markets"):
+    for feed_name, feed_data in profile_view(cache).items():
+        if profiles.is_ai_feed(feed_name) or feed_name == "prediction_markets":
             continue
         items = feed_data.get("items", [])
         if not items:
@@ -2121,7 +3387,7 @@ def _generate_morning_summary(api_key: str) -> None:
     feed_digest = _build_feed_digest()
     market_digest = _build_market_digest()
     if not feed_digest:
-        cache["ai_summary"]["error"] = "No feed data available to summarize"
+        publish(_ai_feed(), error="No feed data available to summarize")
         return
 
     full_digest = feed_digest
@@ -2135,10 +3401,13 @@ def _generate_morning_summary(api_key: str) -> None:
     for attempt in range(max_retries):
         try:
             client = anthropic.Anthropic(api_key=api_key)
-            message = client.messages.create(
+            message = create_ai_message(
+                client,
+                summary_type="morning",
+                attempt=attempt,
                 model=AI_SUMMARY_MORNING_MODEL,
                 max_tokens=AI_SUMMARY_MAX_TOKENS,
-                system=AI_SUMMARY_MORNING_PROMPT,
+                system=profiles.current().morning_prompt,
                 messages=[{
                     "role": "user",
                     "content": f"Here is the current feed data. Summarize overnight developments:\n\n{full_digest}",
@@ -2158,24 +3427,24 @@ def _generate_morning_summary(api_key: str) -> None:
                 "bullets": [],
             }
 
-            # Store as morning summary (displayed specially in template)
-            cache["ai_summary"]["morning_summary"] = morning_entry
-
-            # Also prepend to summaries list for history
-            summaries = cache["ai_summary"].get("summaries", [])
-            summaries.insert(0, morning_entry)
-            cache["ai_summary"]["summaries"] = summaries[:_effective_max_entries()]
-
-            cache["ai_summary"]["items"] = []
-            cache["ai_summary"]["last_updated"] = gen_time
-            cache["ai_summary"]["error"] = None
+            # Store as morning summary (displayed specially in template),
+            # and prepend to summaries list for history
+            summaries = [morning_entry, *cache[_ai_feed()].get("summaries", ())]
+            publish(
+                _ai_feed(),
+                morning_summary=morning_entry,
+                summaries=summaries[:_effective_max_entries()],
+                items=[],
+                last_updated=gen_time,
+                error=None,
+            )
 
             logger.info("Morning AI summary generated (Opus)")
             return  # Success
 
         except anthropic.AuthenticationError as e:
             logger.error(f"AI summary: authentication error — check API key: {e}")
-            cache["ai_summary"]["error"] = "API key invalid — check .env file"
+            publish(_ai_feed(), error="API key invalid — check .env file")
             return  # Don't retry auth errors
 
         except (anthropic.APIConnectionError, anthropic.InternalServerError, anthropic.RateLimitError) as e:
@@ -2184,13 +3453,13 @@ def _generate_morning_summary(api_key: str) -> None:
                 time.sleep(30)
             else:
                 logger.warning(f"Morning AI summary error after {max_retries} attempts: {e}")
-                if not cache["ai_summary"].get("summaries") and not cache["ai_summary"]["items"]:
-                    cache["ai_summary"]["error"] = f"Summary unavailable: {str(e)[:80]}"
+                if not cache[_ai_feed()].get("summaries") and not cache[_ai_feed()]["items"]:
+                    publish(_ai_feed(), error=f"Summary unavailable: {str(e)[:80]}")
 
         except Exception as e:
             logger.warning(f"Morning AI summary error: {e}")
-            if not cache["ai_summary"].get("summaries") and not cache["ai_summary"]["items"]:
-                cache["ai_summary"]["error"] = f"Summary unavailable: {str(e)[:80]}"
+            if not cache[_ai_feed()].get("summaries") and not cache[_ai_feed()]["items"]:
+                publish(_ai_feed(), error=f"Summary unavailable: {str(e)[:80]}")
             return  # Unknown error — don't retry
 
 
@@ -2204,7 +3473,7 @@ def _generate_regular_summary(api_key: str) -> None:
 
     feed_digest = _build_feed_digest()
     if not feed_digest:
-        cache["ai_summary"]["error"] = "No feed data available to summarize"
+        publish(_ai_feed(), error="No feed data available to summarize")
         return
 
     full_digest = feed_digest
@@ -2216,10 +3485,13 @@ def _generate_regular_summary(api_key: str) -> None:
     for attempt in range(max_retries):
         try:
             client = anthropic.Anthropic(api_key=api_key)
-            message = client.messages.create(
+            message = create_ai_message(
+                client,
+                summary_type="regular",
+                attempt=attempt,
                 model=AI_SUMMARY_REGULAR_MODEL,
                 max_tokens=AI_SUMMARY_MAX_TOKENS,
-                system=AI_SUMMARY_REGULAR_PROMPT,
+                system=profiles.current().regular_prompt,
                 messages=[{
                     "role": "user",
                     "content": f"Here are the current feed items. Summarize the key developments:\n\n{full_digest}",
@@ -2242,20 +3514,21 @@ def _generate_regular_summary(api_key: str) -> None:
                 "bullets": bullets,
             }
 
-            summaries = cache["ai_summary"].get("summaries", [])
-            summaries.insert(0, summary_entry)
-            cache["ai_summary"]["summaries"] = summaries[:_effective_max_entries()]
-
-            cache["ai_summary"]["items"] = bullets
-            cache["ai_summary"]["last_updated"] = gen_time
-            cache["ai_summary"]["error"] = None
+            summaries = [summary_entry, *cache[_ai_feed()].get("summaries", ())]
+            publish(
+                _ai_feed(),
+                summaries=summaries[:_effective_max_entries()],
+                items=bullets,
+                last_updated=gen_time,
+                error=None,
+            )
 
             logger.info(f"2-hour AI summary: {len(bullets)} bullets, {len(summaries)} total in history")
             return  # Success
 
         except anthropic.AuthenticationError as e:
             logger.error(f"AI summary: authentication error — check API key: {e}")
-            cache["ai_summary"]["error"] = "API key invalid — check .env file"
+            publish(_ai_feed(), error="API key invalid — check .env file")
             return  # Don't retry auth errors
 
         except (anthropic.APIConnectionError, anthropic.InternalServerError, anthropic.RateLimitError) as e:
@@ -2264,20 +3537,20 @@ def _generate_regular_summary(api_key: str) -> None:
                 time.sleep(30)
             else:
                 logger.warning(f"AI summary error after {max_retries} attempts: {e}")
-                if not cache["ai_summary"].get("summaries") and not cache["ai_summary"]["items"]:
-                    cache["ai_summary"]["error"] = f"Summary unavailable: {str(e)[:80]}"
+                if not cache[_ai_feed()].get("summaries") and not cache[_ai_feed()]["items"]:
+                    publish(_ai_feed(), error=f"Summary unavailable: {str(e)[:80]}")
 
         except Exception as e:
             logger.warning(f"AI summary error: {e}")
-            if not cache["ai_summary"].get("summaries") and not cache["ai_summary"]["items"]:
-                cache["ai_summary"]["error"] = f"Summary unavailable: {str(e)[:80]}"
+            if not cache[_ai_feed()].get("summaries") and not cache[_ai_feed()]["items"]:
+                publish(_ai_feed(), error=f"Summary unavailable: {str(e)[:80]}")
             return  # Unknown error — don't retry
 
 
 def _effective_retention_days() -> int:
     """Return the effective AI summary retention days.
 
-    Uses config value, but also checks Hebcal for active or upcoming Yom Tov —
+    Uses config value, but also checks the calendar for active or upcoming Yom Tov —
     if we're in a multi-day holiday (or one starts within 24h), automatically
     extends retention to prevent premature pruning on erev Yom Tov.
     """
@@ -2322,7 +3595,7 @@ def fetch_ai_summary(force: bool = False) -> None:
     global ai_summary_enabled
 
     if not ai_summary_enabled:
-        cache["ai_summary"]["error"] = "AI summary paused (toggle on dashboard)"
+        publish(_ai_feed(), error="AI summary paused (toggle on dashboard)")
         return
 
     # Auto-pause if nobody has viewed the dashboard recently
@@ -2344,17 +3617,17 @@ def fetch_ai_summary(force: bool = False) -> None:
         idle_seconds = (datetime.now() - _last_dashboard_view).total_seconds()
         if idle_seconds > AI_INACTIVITY_TIMEOUT:
             ai_summary_enabled = False
-            cache["ai_summary"]["error"] = "AI summary auto-paused (no viewers for 30 min). Toggle on to resume."
+            publish(_ai_feed(), error="AI summary auto-paused (no viewers for 30 min). Toggle on to resume.")
             logger.info(f"AI summary auto-paused: no dashboard views for {idle_seconds / 60:.0f} min")
             return
 
     if not HAS_ANTHROPIC:
-        cache["ai_summary"]["error"] = "anthropic package not installed"
+        publish(_ai_feed(), error="anthropic package not installed")
         return
 
     api_key = os.environ.get("ANTHROPIC_API_KEY")
     if not api_key:
-        cache["ai_summary"]["error"] = "ANTHROPIC_API_KEY not set — add key to .env file"
+        publish(_ai_feed(), error="ANTHROPIC_API_KEY not set — add key to .env file")
         logger.warning("AI summary skipped: ANTHROPIC_API_KEY not set")
         return
 
@@ -2369,8 +3642,8 @@ def fetch_ai_summary(force: bool = False) -> None:
     if not force and current_hour in AI_SUMMARY_QUIET_HOURS:
         logger.info(f"AI summary: quiet hours ({current_hour}:00 ET), skipping")
         # Set an informational message so the UI explains the pause
-        if not cache["ai_summary"].get("summaries"):
-            cache["ai_summary"]["error"] = "Quiet hours (1\u20137 AM ET) \u2014 next update at 8 AM"
+        if not cache[_ai_feed()].get("summaries"):
+            publish(_ai_feed(), error="Quiet hours (1\u20137 AM ET) \u2014 next update at 8 AM")
         return
 
     # Determine summary type
@@ -2393,7 +3666,7 @@ def _generate_candle_lighting_summary(api_key: str) -> None:
     market_digest = _build_market_digest()
 
     if not feed_digest:
-        cache["ai_summary"]["error"] = "No feed data available to summarize"
+        publish(_ai_feed(), error="No feed data available to summarize")
         return
 
     full_digest = feed_digest
@@ -2407,10 +3680,13 @@ def _generate_candle_lighting_summary(api_key: str) -> None:
     for attempt in range(max_retries):
         try:
             client = anthropic.Anthropic(api_key=api_key)
-            message = client.messages.create(
+            message = create_ai_message(
+                client,
+                summary_type="candle_lighting",
+                attempt=attempt,
                 model=AI_SUMMARY_MORNING_MODEL,  # Opus for quality
                 max_tokens=AI_SUMMARY_MAX_TOKENS,
-                system=AI_SUMMARY_CANDLE_LIGHTING_PROMPT,
+                system=profiles.current().candle_lighting_prompt,
                 messages=[{
                     "role": "user",
                     "content": f"Here is the current situation as Shabbos begins:\n\n{full_digest}",
@@ -2430,20 +3706,21 @@ def _generate_candle_lighting_summary(api_key: str) -> None:
                 "bullets": [],
             }
 
-            summaries = cache["ai_summary"].get("summaries", [])
-            summaries.insert(0, candle_entry)
-            cache["ai_summary"]["summaries"] = summaries[:_effective_max_entries()]
-
-            cache["ai_summary"]["items"] = []
-            cache["ai_summary"]["last_updated"] = gen_time
-            cache["ai_summary"]["error"] = None
+            summaries = [candle_entry, *cache[_ai_feed()].get("summaries", ())]
+            publish(
+                _ai_feed(),
+                summaries=summaries[:_effective_max_entries()],
+                items=[],
+                last_updated=gen_time,
+                error=None,
+            )
 
             logger.info("Candle-lighting AI summary generated (Opus)")
             return
 
         except anthropic.AuthenticationError as e:
             logger.error(f"Candle-lighting summary: auth error — {e}")
-            cache["ai_summary"]["error"] = "API key invalid — check .env file"
+            publish(_ai_feed(), error="API key invalid — check .env file")
             return
 
         except (anthropic.APIConnectionError, anthropic.InternalServerError, anthropic.RateLimitError) as e:
@@ -2461,41 +3738,37 @@ def _generate_candle_lighting_summary(api_key: str) -> None:
 def _check_candle_lighting_summary() -> None:
     """Check if it's time to generate the candle-lighting AI summary.
 
-    Runs every 5 minutes on Fridays (and Yom Tov eves) via APScheduler.
-    Generates a summary within 10 minutes after candle lighting time.
+    Runs every 5 minutes via APScheduler, for the active profile: on Fridays
+    (and Yom Tov eves) at its location, generates a summary within 10 minutes
+    after its candle lighting time.
     """
-    global _last_candle_lighting_summary_date
-
     if not ai_summary_enabled:
         return
 
-    now_et = datetime.now(ZoneInfo("America/New_York"))
+    profile = profiles.current()
+    now = datetime.now(profile.tzinfo)
+    today = now.date()
+    if _last_candle_lighting_summary_date.get(profile.name) == today:
+        return
 
     # Check regular Shabbos (Fridays)
-    if now_et.weekday() == 4:  # Friday
-        today = now_et.date()
-        if _last_candle_lighting_summary_date == today:
-            return
-
+    if now.weekday() == 4:  # Friday
         shabbos_times = get_shabbos_times()
         candle_time = shabbos_times["candle_lighting"]
-        minutes_since = (now_et - candle_time).total_seconds() / 60
+        minutes_since = (now - candle_time).total_seconds() / 60
         if not (0 <= minutes_since <= 10):
             return
 
         logger.info(f"Candle lighting detected ({candle_time.strftime('%-I:%M %p')}), generating summary...")
     else:
-        # Check Yom Tov candle lighting via Hebcal
+        # Check Yom Tov candle lighting via the local calendar
         yt = get_yom_tov_info()
         if not yt or yt.get("active"):
             return  # Already in Yom Tov or no Yom Tov upcoming
         candle_time = yt["candle_lighting"]
-        today = now_et.date()
-        if _last_candle_lighting_summary_date == today:
-            return
         if candle_time.date() != today:
             return
-        minutes_since = (now_et - candle_time).total_seconds() / 60
+        minutes_since = (now - candle_time).total_seconds() / 60
         if not (0 <= minutes_since <= 10):
             return
 
@@ -2509,18 +3782,47 @@ def _check_candle_lighting_summary() -> None:
         return
 
     _generate_candle_lighting_summary(api_key)
-    _last_candle_lighting_summary_date = now_et.date()
+    _last_candle_lighting_summary_date[profile.name] = today
+
+
+def for_each_profile(job: Callable[[], None]) -> Callable[[], None]:
+    """A scheduler job that runs `job` once per profile, each with that profile active."""
+    @wraps(job)
+    def run():
+        for profile in profiles.all_profiles():
+            with profiles.use(profile):
+                try:
+                    job()
+                except Exception as e:
+                    logger.error(f"{job.__name__} failed for profile {profile.name}: {e}")
+    return run
 
 
 # ============ MAIN UPDATE FUNCTION ============
 
-def update_all_feeds() -> None:
-    """Update all feeds concurrently - called by scheduler."""
-    logger.info("=" * 50)
-    logger.info("Starting feed update cycle")
-    start = datetime.now()
+# Feed each fetcher publishes to (an error there marks the run as "error")
+_FETCHER_FEEDS = {
+    "twitter": "twitter_list",
+    "trump": "trump",
+    "reuters": "reuters",
+    "toi": "toi_liveblog",
+    "think_tanks": "think_tanks",
+    "prediction_markets": "prediction_markets",
+}
+
+
+# Fetcher runs in progress (name → (start, thread id)) and when each last finished
+_fetcher_running: Dict[str, tuple] = {}
+_fetcher_finished: Dict[str, float] = {}
+_fetcher_state_lock = threading.Lock()
+
+
+_PUBLISH_MARGIN = 5  # seconds
+
 
-    fetchers = {
+def _fetchers() -> Dict[str, Callable[[], None]]:
+    """Every fetcher by name (looked up at call time, so tests can swap them)."""
+    return {
         "twitter": fetch_twitter_accounts,
         "trump": fetch_trump,
         "reuters": fetch_reuters,
@@ -2530,14 +3832,74 @@ def update_all_feeds() -> None:
         "oil_price": fetch_oil_price,
     }
 
-    with ThreadPoolExecutor(max_workers=7) as executor:
+
+def _run_fetcher(name: str, fn: Callable[[], None]) -> None:
+    """Run one fetcher, recording its duration and outcome."""
+    outcome = "exception"
+    with _fetcher_state_lock:
+        _fetcher_running[name] = (time.monotonic(), threading.get_ident())
+    try:
+        with tracing.span("fetcher", fetcher=name), FETCHER_DURATION.time(fetcher=name):
+            fn()
+        feed = _FETCHER_FEEDS.get(name)
+        outcome = "error" if feed and cache[feed]["error"] else "ok"
+    finally:
+        FETCHER_RUNS.inc(fetcher=name, outcome=outcome)
+        with _fetcher_state_lock:
+            _fetcher_running.pop(name, None)
+            _fetcher_finished[name] = time.monotonic()
+
+
+def _start_fetcher(name: str, fn: Callable[[], None]) -> Future:
+    """Run a fetcher on its own daemon thread, in the caller's trace context.
+
+    Not a ThreadPoolExecutor: leaving an executor's `with` block (or exiting
+    the interpreter) waits for its threads, so one wedged request would stall
+    the cycle, the scheduler and shutdown. A daemon thread can be abandoned.
+    """
+    future: Future = Future()
+    context = copy_context()
+
+    def run():
+        try:
+            future.set_result(context.run(_run_fetcher, name, fn))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True, name=f"fetcher-{name}").start()
+    return future
+
+
+def running_fetchers() -> Dict[str, float]:
+    """Fetchers running now → seconds since they started."""
+    now = time.monotonic()
+    with _fetcher_state_lock:
+        return {name: now - start for name, (start, _) in _fetcher_running.items()}
+
+
+def update_all_feeds() -> None:
+    """Update all feeds concurrently - called by scheduler."""
+    logger.info("=" * 50)
+    logger.info("Starting feed update cycle")
+    start = datetime.now()
+
+    if _replayer:
+        _replayer.rewind()
+
+    # Fetchers get the cycle's budget less a margin, so they can publish what
+    # they collected before the cycle stops waiting
+    with tracing.trace("cycle"), deadlines.deadline(CYCLE_TIMEOUT - _PUBLISH_MARGIN):
+        # A fetcher still running from an earlier cycle (hung) isn't started twice
+        still_running = running_fetchers()
+        for name, seconds in still_running.items():
+            logger.warning(f"Fetcher {name} still running after {seconds:.0f}s — not starting another")
         futures = {
-            executor.submit(fn): name
-            for name, fn in fetchers.items()
+            _start_fetcher(name, fn): name
+            for name, fn in _fetchers().items() if name not in still_running
         }
         completed_names = set()
         try:
-            for future in as_completed(futures, timeout=120):
+            for future in as_completed(futures, timeout=CYCLE_TIMEOUT):
                 name = futures[future]
                 completed_names.add(name)
                 try:
@@ -2545,17 +3907,23 @@ def update_all_feeds() -> None:
                 except Exception as e:
                     logger.error(f"Fetcher {name} raised exception: {e}")
         except TimeoutError:
+            # Abandon the rest: their threads finish (or hang) in the background,
+            # and the watchdog reports any that stay stuck
             timed_out = [name for f, name in futures.items() if name not in completed_names]
-            logger.error(f"Feed update timed out after 120s. Timed-out fetchers: {', '.join(timed_out)}")
-            # Cancel remaining futures (best-effort — running threads can't be interrupted)
-            for f in futures:
-                f.cancel()
+            for name in timed_out:
+                FETCHER_TIMEOUTS.inc(fetcher=name)
+            logger.error(f"Feed update timed out after {CYCLE_TIMEOUT}s. Timed-out fetchers: {', '.join(timed_out)}")
 
-    elapsed = (datetime.now() - start).total_seconds()
-    logger.info(f"Feed update cycle complete in {elapsed:.1f}s")
+        elapsed = (datetime.now() - start).total_seconds()
+        CYCLE_DURATION.observe(elapsed)
+        logger.info(f"Feed update cycle complete in {elapsed:.1f}s")
 
-    # Persist cache to disk after every update cycle
-    save_cache_to_disk()
+        # Persist cache to disk after every update cycle
+        with tracing.span("save_cache"):
+            save_cache_to_disk()
+        if _recorder:
+            _recorder.store.save()
+            logger.info(f"Recorded {len(_recorder.store)} upstream responses to {_recorder.store.path}")
 
     # Dynamically adjust refresh interval: 15 min during Yom Tov, 10 min otherwise
     try:
@@ -2572,22 +3940,377 @@ def update_all_feeds() -> None:
     logger.info("=" * 50)
 
 
+# ============ MEMORY WATCH ============
+# Snapshots every MEMORY_SNAPSHOT_INTERVAL (see memwatch.py), checked against
+# the soft and hard RSS ceilings in config.py.
+
+MEMORY_TRIMS = metrics.Counter(
+    "shabbos_memory_trims_total", "Cache trims after RSS passed the soft ceiling")
+
+
+def trim_caches() -> Dict[str, int]:
+    """Drop what can be rebuilt cheaply; return entries dropped per cache.
+
+    Article summaries are kept for articles still shown (the rest would cost
+    API calls to regenerate only if they came back); memos and section
+    history refill on the next cycle or render.
+    """
+    shown = {item.link for item in cache["think_tanks"]["items"]}
+    stale = [url for url in list(_article_summary_cache) if url not in shown]
+    for url in stale:
+        _article_summary_cache.pop(url, None)
+    dropped = {"article_summaries": len(stale)}
+    with _text_memo_lock:
+        dropped["text_memo"] = len(_text_memo)
+        _text_memo.clear()
+    with _entry_memo_lock:
+        dropped["entry_memo"] = sum(len(memo) for memo in _entry_memo.values())
+        _entry_memo.clear()
+    with _sections_lock:
+        dropped["section_history"] = max(0, len(_section_history) - len(_sections))
+        while len(_section_history) > len(_sections):
+            _section_history.popitem(last=False)
+    with _dashboard_lock:
+        for page in _dashboard_pages.values():
+            page["gzip"] = None
+    gc.collect()
+    _release_free_heap()
+    MEMORY_TRIMS.inc()
+    return dropped
+
+
+def _release_free_heap() -> None:
+    """Ask glibc to return freed heap pages to the OS, so RSS actually falls."""
+    try:
+        import ctypes
+        ctypes.CDLL("libc.so.6").malloc_trim(0)
+    except (OSError, AttributeError):
+        pass  # not glibc (e.g. macOS): freed memory is reused, RSS falls later or not at all
+
+
+def check_memory(soft_mib: float = MEMORY_SOFT_LIMIT_MIB, hard_mib: float = MEMORY_HARD_LIMIT_MIB) -> None:
+    """Take a snapshot; trim caches above the soft ceiling, restart above the hard one."""
+    snap = memwatch.take()
+    rss = snap.rss_mib
+    if rss is None or rss <= soft_mib:
+        return
+    dropped = trim_caches()
+    after = memwatch.rss_mib()
+    logger.warning(f"MEMORY: RSS {rss:.0f} MiB over soft ceiling {soft_mib:.0f} MiB — "
+                   f"trimmed caches {dropped}, RSS now {after if after is not None else '?'} MiB")
+    if after is not None and after > hard_mib:
+        _restart_for_memory(after, hard_mib)
+
+
+def _restart_for_memory(rss: float, hard_mib: float) -> None:
+    """Save state and exit with memwatch.RESTART_EXIT_CODE; start.sh restarts the server.
+
+    Runs on a scheduler thread, so it ends the process with os._exit rather
+    than sys.exit (which would only end this thread).
+    """
+    logger.error(f"MEMORY: RSS {rss:.0f} MiB still over hard ceiling {hard_mib:.0f} MiB after trimming — "
+                 f"saving cache and restarting (exit code {memwatch.RESTART_EXIT_CODE})")
+    if ROLE != "follower":  # a follower's state is its last good snapshot
+        save_cache_to_disk()
+    logpipe.flush()
+    os._exit(memwatch.RESTART_EXIT_CODE)
+
+
+# ============ STATIC ASSETS & COMPRESSION ============
+# The dashboard's CSS/JS live in static/ and are served from /assets/ under
+# content-fingerprinted names, so browsers can cache them indefinitely; each
+# is compressed once at startup. HTML and JSON responses are gzipped per
+# request when the client accepts it.
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+ASSET_MAX_AGE = 365 * 24 * 3600
+COMPRESS_MIN_BYTES = 512
+_COMPRESSIBLE_TYPES = {"text/html", "application/json"}
+
+_assets: Dict[str, Dict] = {}    # fingerprinted name → {"body", "gzip", "br", "mimetype"}
+_asset_names: Dict[str, str] = {}  # source name → fingerprinted name
+
+
+def _load_assets() -> None:
+    """Read, fingerprint and precompress every file in static/."""
+    _assets.clear()
+    _asset_names.clear()
+    for name in sorted(os.listdir(STATIC_DIR)):
+        with open(os.path.join(STATIC_DIR, name), "rb") as f:
+            body = f.read()
+        stem, ext = os.path.splitext(name)
+        fingerprinted = f"{stem}.{hashlib.blake2b(body, digest_size=6).hexdigest()}{ext}"
+        _assets[fingerprinted] = {
+            "body": body,
+            "gzip": gzip.compress(body, compresslevel=9, mtime=0),
+            "br": brotli.compress(body) if HAS_BROTLI else None,
+            "mimetype": {".css": "text/css", ".js": "text/javascript"}.get(ext, "application/octet-stream"),
+        }
+        _asset_names[name] = fingerprinted
+
+
+@app.template_global()
+def asset_url(name: str) -> str:
+    return f"/assets/{_asset_names[name]}"
+
+
+def _accepts(encoding: str) -> bool:
+    return request.accept_encodings[encoding] > 0
+
+
+@app.route("/assets/<name>")
+def asset(name):
+    """A fingerprinted static asset, in the best encoding the client accepts."""
+    entry = _assets.get(name)
+    if entry is None:
+        return "Not found", 404
+    if entry["br"] is not None and _accepts("br"):
+        body, encoding = entry["br"], "br"
+    elif _accepts("gzip"):
+        body, encoding = entry["gzip"], "gzip"
+    else:
+        body, encoding = entry["body"], None
+    response = app.response_class(body, mimetype=entry["mimetype"])
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    response.headers["Vary"] = "Accept-Encoding"
+    response.headers["Cache-Control"] = f"public, max-age={ASSET_MAX_AGE}, immutable"
+    return response
+
+
+@app.after_request
+def _compress_response(response):
+    """gzip HTML/JSON bodies for clients that accept it (streams are left alone)."""
+    if (response.status_code != 200 or response.is_streamed or response.direct_passthrough
+            or "Content-Encoding" in response.headers
+            or response.mimetype not in _COMPRESSIBLE_TYPES):
+        return response
+    response.vary.add("Accept-Encoding")
+    if not _accepts("gzip"):
+        return response
+    body = response.get_data()
+    if len(body) < COMPRESS_MIN_BYTES:
+        return response
+    response.set_data(gzip.compress(body, compresslevel=6))
+    response.headers["Content-Encoding"] = "gzip"
+    return response
+
+
+_load_assets()
+
+
 # ============ FLASK ROUTES ============
 
+# Routes under /p/<profile>/ serve that profile's dashboard (see profiles.py)
+@app.url_value_preprocessor
+def _select_profile(endpoint, values):
+    name = values.pop("profile", None) if values else None
+    if name is None:
+        return
+    profile = profiles.get(name)
+    if profile is None or name == profiles.DEFAULT:
+        abort(404)
+    g.profile_token = profiles.activate(profile)
+
+
+@app.teardown_request
+def _release_profile(exc):
+    token = g.pop("profile_token", None)
+    if token is not None:
+        profiles.deactivate(token)
+
+
+# Rendered dashboard per profile, reused until the cache generation or the minute changes
+_dashboard_pages: Dict[str, Dict] = {}
+_dashboard_stats = {"renders": 0, "hits": 0, "not_modified": 0}
+_dashboard_lock = threading.Lock()
+
+# Page sections pushed over /events: element id → template block
+_DASHBOARD_SECTIONS = {
+    "status": "status",
+    "col-think-tanks": "think_tanks_column",
+    "col-reuters": "reuters_column",
+    "col-toi": "toi_column",
+    "col-raw-feeds": "raw_feeds_column",
+    "col-ai": "ai_column",
+    "health-footer": "health_footer",
+}
+_SECTION_HISTORY = 64  # versions whose section digests are kept, to diff reconnecting clients
+_SSE_HEARTBEAT = 15    # seconds between keep-alive comments on an idle stream
+_SSE_RETRY_MS = 15000  # client reconnect delay when the server is down
+_sections: Dict[str, Dict] = {}  # profile name → {"version", "html", "digests"}
+_section_history: "OrderedDict[tuple, Dict[str, bytes]]" = OrderedDict()  # (profile, version) → digests
+_sections_lock = threading.Lock()
+_event_stats = {"section_renders": 0, "clients": 0, "pushes": 0}
+
+
+def _dashboard_version(snap: Snapshot = None) -> str:
+    """(cache generation, minute) — the minute keeps clocks, stale badges and
+    Shabbos/Yom Tov state current."""
+    return f"{(snap or cache).generation}-{int(time.time() // 60)}"
+
+
+def _render_snapshot(version: str) -> tuple:
+    """(snapshot, version) to render when `version` isn't rendered yet.
+
+    Old AI summaries are pruned first; if that publishes, the version moves on
+    with it. Everything is then rendered from the one snapshot.
+    """
+    _prune_old_summaries()
+    snap = cache
+    return snap, _dashboard_version(snap)
+
+
 @app.route("/")
+@app.route("/p/<profile>/")
 def dashboard():
-    """Main dashboard page."""
+    """Main dashboard page (of the default profile, or the one in the path).
+
+    Rendered at most once per version (see _dashboard_version). The version is
+    the ETag (with "-gz" for the gzip-encoded body, a different representation),
+    so a reload with nothing new gets a 304 without rendering.
+    """
     global _last_dashboard_view
     _last_dashboard_view = datetime.now()
-    _prune_old_summaries()
 
+    _dashboard_page = _dashboard_pages.setdefault(profiles.current().name,
+                                                  {"version": None, "html": "", "gzip": None})
+    version = _dashboard_version()
+    gzipped = _accepts("gzip")
+    if request.if_none_match.contains(f"{version}-gz" if gzipped else version):
+        with _dashboard_lock:
+            _dashboard_stats["not_modified"] += 1
+        response = app.response_class(status=304)
+    else:
+        with _dashboard_lock:
+            if _dashboard_page["version"] == version:
+                _dashboard_stats["hits"] += 1
+            else:
+                with RENDER_DURATION.time(kind="page"):
+                    snap, version = _render_snapshot(version)
+                    _dashboard_page["html"] = render_template("index.html", **_dashboard_context(version, snap))
+                _dashboard_page["gzip"] = None
+                _dashboard_page["version"] = version
+                _dashboard_stats["renders"] += 1
+            if gzipped:
+                # Compressed once per version rather than per request
+                if _dashboard_page["gzip"] is None:
+                    _dashboard_page["gzip"] = gzip.compress(_dashboard_page["html"].encode(), compresslevel=6)
+                response = app.make_response(_dashboard_page["gzip"])
+                response.headers["Content-Encoding"] = "gzip"
+            else:
+                response = app.make_response(_dashboard_page["html"])
+    response.vary.add("Accept-Encoding")
+    response.set_etag(f"{version}-gz" if gzipped else version)
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
+def _dashboard_health() -> Dict:
+    served = sum(_dashboard_stats.values())
+    reused = _dashboard_stats["hits"] + _dashboard_stats["not_modified"]
+    return {
+        "generation": cache.generation,
+        **_dashboard_stats,
+        "hit_rate": round(reused / served, 3) if served else None,
+        **_event_stats,
+    }
+
+
+def _dashboard_sections() -> tuple:
+    """(version, {element id: HTML}, {element id: digest}) for the current version.
+
+    Rendered once per version (and profile) and shared by every connected
+    client; digests of recent versions are kept so a client can be sent only
+    what differs.
+    """
+    profile = profiles.current()
+    with _sections_lock:
+        version = _dashboard_version()
+        sections = _sections.setdefault(profile.name, {"version": None, "html": {}, "digests": {}})
+        if sections["version"] != version:
+            render_start = time.perf_counter()
+            snap, version = _render_snapshot(version)
+            template = app.jinja_env.get_template("index.html")
+            macros = app.jinja_env.get_template("_macros.html").module
+            context = template.new_context({
+                **{name: value for name, value in vars(macros).items() if not name.startswith("_")},
+                **_dashboard_context(version, snap),
+            })
+            html = {element_id: "".join(template.blocks[block](context))
+                    for element_id, block in _DASHBOARD_SECTIONS.items()}
+            RENDER_DURATION.observe(time.perf_counter() - render_start, kind="sections")
+            digests = {element_id: hashlib.blake2b(part.encode(), digest_size=16).digest()
+                       for element_id, part in html.items()}
+            sections.update(version=version, html=html, digests=digests)
+            _section_history[(profile.name, version)] = digests
+            if len(_section_history) > _SECTION_HISTORY * len(_sections):
+                _section_history.popitem(last=False)
+            _event_stats["section_renders"] += 1
+        return sections["version"], sections["html"], sections["digests"]
+
+
+@app.route("/events")
+@app.route("/p/<profile>/events")
+def events():
+    """Server-sent events: the HTML of each page section that changed.
+
+    The client names the version it has (`since` from the page, or
+    Last-Event-ID when EventSource reconnects). Sections that differ from it
+    are sent at once, then again whenever a fetcher publishes or the minute
+    turns — only the ones that changed.
+    """
+    since = request.headers.get("Last-Event-ID") or request.args.get("since", "")
+    since = since.removesuffix("-gz")  # the page's ETag when it was sent gzip-encoded
+    profile = profiles.current()  # the stream outlives the request that selected it
+
+    def stream():
+        with _sections_lock:  # streams start and end on many threads
+            _event_stats["clients"] += 1
+        try:
+            yield from _section_events(profile, since)
+        finally:
+            with _sections_lock:
+                _event_stats["clients"] -= 1
+
+    return app.response_class(stream(), mimetype="text/event-stream",
+                              headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+def _section_events(profile: "profiles.Profile", since: str):
+    """The /events stream of `profile`'s dashboard, from version `since` on."""
+    with profiles.use(profile):
+        _dashboard_sections()  # records the current version's digests
+        with _sections_lock:
+            sent = _section_history.get((profile.name, since), {})
+        yield f"retry: {_SSE_RETRY_MS}\n\n"
+        while True:
+            version, html, digests = _dashboard_sections()
+            changed = {element_id: part for element_id, part in html.items()
+                       if sent.get(element_id) != digests[element_id]}
+            if changed:
+                sent = digests
+                with _sections_lock:
+                    _event_stats["pushes"] += 1
+                yield f"id: {version}\nevent: sections\ndata: {json.dumps(changed)}\n\n"
+            else:
+                yield ": keep-alive\n\n"
+            until_next_minute = 60 - time.time() % 60 + 0.1
+            wait_for_generation(int(version.split("-")[0]), min(_SSE_HEARTBEAT, until_next_minute))
+
+
+def _dashboard_context(version: str, snap: Snapshot) -> Dict:
+    """Template variables for the page and its sections, all from one snapshot
+    (as the active profile sees it)."""
+    profile = profiles.current()
+    snap = profile_view(snap)
     shabbos_times = None
     try:
         shabbos_times = get_shabbos_times()
     except Exception as e:
         logger.debug(f"Shabbos times computation failed: {e}")
 
-    # Detect Yom Tov from Hebcal API (or use manual override from config)
+    # Detect Yom Tov from the local calendar (or use manual override from config)
     yom_tov_info = None
     yom_tov_end_display = None
     if YOM_TOV_END:
@@ -2599,7 +4322,7 @@ def dashboard():
         except (ValueError, TypeError):
             yom_tov_end_display = YOM_TOV_END
     else:
-        # Auto-detect from Hebcal
+        # Auto-detect from the local calendar
         try:
             yom_tov_info = get_yom_tov_info()
             if yom_tov_info:
@@ -2607,32 +4330,32 @@ def dashboard():
         except Exception as e:
             logger.debug(f"Yom Tov detection failed: {e}")
 
-    # Merge OSINT + Trump feeds into a single "Raw Feeds" list, sorted by timestamp
-    raw_items = []
-    for item in cache["twitter_list"]["items"][:10]:
-        raw_items.append({**item, "feed_source": "osint"})
-    for item in cache["trump"]["items"][:8]:
-        raw_items.append({**item, "feed_source": "trump"})
-    # Sort by parsed epoch (handles mixed formats: ISO, RFC 2822, BlueSky display)
-    raw_items.sort(key=lambda x: _parse_timestamp_to_epoch(x.get("timestamp", "")), reverse=True)
+    # Merge OSINT + Trump feeds into a single "Raw Feeds" list, sorted by timestamp.
+    # Items carry their own feed_source, so the merge shares them — no copies.
+    raw_items = _sort_newest_first([*snap["twitter_list"]["items"][:10], *snap["trump"]["items"][:8]])
 
     # Today's date in ET for collapsing older AI summary day groups
     today_et = datetime.now(ZoneInfo("America/New_York")).strftime('%Y-%m-%d')
+    has_anthropic, has_api_key = _ai_availability()
 
-    return render_template(
-        "index.html",
-        cache=cache,
+    return dict(
+        cache=snap,
         merged_raw_feeds=raw_items,
         generated_at=datetime.now(),
         refresh_interval=REFRESH_INTERVAL,
         shabbos_times=shabbos_times,
         ai_summary_enabled=ai_summary_enabled,
-        has_anthropic=HAS_ANTHROPIC,
-        has_api_key=bool(os.environ.get("ANTHROPIC_API_KEY")),
+        has_anthropic=has_anthropic,
+        has_api_key=has_api_key,
         yom_tov_end=YOM_TOV_END or (yom_tov_info is not None),
         yom_tov_info=yom_tov_info,
         yom_tov_end_display=yom_tov_end_display,
         today_et=today_et,
+        page_version=version,
+        follower=ROLE == "follower",
+        base_path=profile.base_path,
+        dashboard_title=profile.title,
+        page_title="Shabbos Monitor" if profile.name == profiles.DEFAULT else profile.title,
     )
 
 
@@ -2641,6 +4364,8 @@ def health():
     """Health check endpoint."""
     return {
         "status": "ok",
+        "role": ROLE,
+        **({"sync": _follower.status()} if _follower is not None else {}),
         "feeds": {
             name: {
                 "items_count": len(data["items"]),
@@ -2648,22 +4373,131 @@ def health():
                 "error": data["error"],
             }
             for name, data in cache.items()
-        }
+        },
+        "entry_memo": entry_memo_hit_rates(),
+        "dashboard": _dashboard_health(),
+        "profiles": {profile.name: profile.base_path + "/" for profile in profiles.all_profiles()},
     }
 
 
+def _feed_gauge(read: Callable[[Mapping], Optional[float]]) -> Callable[[], Dict]:
+    def values():
+        snap = cache
+        return {(name,): value for name in snap if (value := read(snap[name])) is not None}
+    return values
+
+
+def _backoff_remaining() -> Dict:
+    now = datetime.now()
+    until = {"xcancel": _xcancel_backoff_until, "trump": _trump_backoff_until,
+             "reuters": _reuters_backoff_until, "toi": _toi_backoff_until}
+    return {(feed,): max((u - now).total_seconds(), 0) if u else 0 for feed, u in until.items()}
+
+
+metrics.Gauge("shabbos_feed_items", "Items currently published per feed",
+              _feed_gauge(lambda data: len(data["items"])), ["feed"])
+metrics.Gauge("shabbos_feed_age_seconds", "Seconds since each feed last updated",
+              _feed_gauge(lambda data: (datetime.now() - data["last_updated"]).total_seconds()
+                          if data["last_updated"] else None), ["feed"])
+metrics.Gauge("shabbos_cache_generation", "Current cache snapshot generation",
+              lambda: {(): cache.generation})
+metrics.Gauge("shabbos_backoff_remaining_seconds", "Seconds left in each rate-limit backoff",
+              _backoff_remaining, ["feed"])
+metrics.Gauge("shabbos_sse_clients", "Connected /events streams",
+              lambda: {(): _event_stats["clients"]})
+metrics.Gauge("shabbos_process_resident_memory_bytes", "Resident set size of the server process",
+              lambda: {(): rss * 2**20} if (rss := memwatch.rss_mib()) is not None else {})
+
+
+@app.route("/metrics")
+def metrics_endpoint():
+    """Prometheus text-format metrics (curl-readable; no exporter needed)."""
+    return app.response_class(metrics.render(), mimetype="text/plain; version=0.0.4")
+
+
+@app.route("/debug/cycles")
+def debug_cycles():
+    """Recent update cycles (newest first): id, start time, duration, fetcher times."""
+    return jsonify([
+        {
+            "trace_id": root.attrs["trace_id"],
+            "started": datetime.fromtimestamp(root.start).isoformat(),
+            "duration": root.duration,
+            "fetchers": {child.attrs.get("fetcher", child.name): child.duration for child in root.children},
+        }
+        for root in reversed(tracing.recent())
+    ])
+
+
+@app.route("/debug/cycles/latest")
+@app.route("/debug/cycles/<int:trace_id>")
+def debug_cycle(trace_id=None):
+    """One cycle's span tree as indented text (`?format=json` for the raw spans).
+
+    The hot path (slowest child at each level, from the root down) is starred.
+    """
+    if trace_id is None:
+        roots = tracing.recent()
+        root = roots[-1] if roots else None
+    else:
+        root = tracing.find(trace_id)
+    if root is None:
+        return "No traced cycle yet\n" if trace_id is None else "Unknown cycle\n", 404
+    if request.args.get("format") == "json":
+        return jsonify(root.to_dict())
+    return app.response_class(tracing.render_tree(root), mimetype="text/plain")
+
+
+@app.route("/debug/memory")
+def debug_memory():
+    """Diff two memory snapshots: `?a=<id>&b=<id>` (default: oldest kept vs. newest).
+
+    `?take=1` records a fresh snapshot first, so `/debug/memory?take=1`
+    compares now with the oldest one kept.
+    """
+    if request.args.get("take"):
+        memwatch.take()
+    snapshots = memwatch.recent()
+    if not snapshots:
+        return jsonify({"error": "No memory snapshots yet (try ?take=1)"}), 404
+    older = memwatch.find(request.args.get("a", snapshots[0].id, type=int))
+    newer = memwatch.find(request.args.get("b", snapshots[-1].id, type=int))
+    if older is None or newer is None:
+        return jsonify({"error": "Unknown snapshot",
+                        "snapshots": [snap.to_dict(top=0) for snap in snapshots]}), 404
+    return jsonify({
+        **memwatch.diff(older, newer),
+        "snapshots": [snap.to_dict(top=0) for snap in snapshots],
+    })
+
+
+def _leader_only():
+    """409 for actions a follower leaves to its leader; None elsewhere."""
+    if ROLE == "follower":
+        return jsonify({"error": f"This dashboard follows {LEADER_URL}; do this on the leader"}), 409
+    return None
+
+
 @app.route("/refresh")
 def manual_refresh():
     """Manually trigger a feed refresh."""
+    refused = _leader_only()
+    if refused:
+        return refused
     update_all_feeds()
     return {"status": "refreshed", "time": datetime.now().isoformat()}
 
 
 @app.route("/api/toggle-ai", methods=["POST"])
+@app.route("/p/<profile>/api/toggle-ai", methods=["POST"])
 def toggle_ai():
     """Toggle AI summary on/off at runtime (no restart needed)."""
     global ai_summary_enabled, _last_dashboard_view
+    refused = _leader_only()
+    if refused:
+        return refused
     ai_summary_enabled = not ai_summary_enabled
+    bump_generation()
     if ai_summary_enabled:
         _last_dashboard_view = datetime.now()  # Reset inactivity timer on enable
     status = "enabled" if ai_summary_enabled else "disabled"
@@ -2672,82 +4506,179 @@ def toggle_ai():
 
 
 @app.route("/api/ai-status")
+@app.route("/p/<profile>/api/ai-status")
 def ai_status():
     """Get current AI summary status for the dashboard toggle."""
-    has_key = bool(os.environ.get("ANTHROPIC_API_KEY"))
+    has_anthropic, has_key = _ai_availability()
+    ai = cache[_ai_feed()]
     return jsonify({
         "ai_enabled": ai_summary_enabled,
-        "has_anthropic": HAS_ANTHROPIC,
+        "has_anthropic": has_anthropic,
         "has_api_key": has_key,
-        "last_updated": cache["ai_summary"]["last_updated"].isoformat() if cache["ai_summary"]["last_updated"] else None,
-        "error": cache["ai_summary"]["error"],
-        "item_count": len(cache["ai_summary"]["items"]),
+        "last_updated": ai["last_updated"].isoformat() if ai["last_updated"] else None,
+        "error": ai["error"],
+        "item_count": len(ai["items"]),
     })
 
 
+@app.route("/api/ai-usage")
+def ai_usage():
+    """AI calls, tokens, latency and estimated cost per day (`?days=N`, default 7),
+    each day broken down by summary type and model."""
+    days = max(1, min(request.args.get("days", 7, type=int), AI_USAGE_RETENTION_DAYS))
+    return jsonify({"prices_per_mtok": AI_MODEL_PRICES, **ai_usage_report(days)})
+
+
 @app.route("/api/refresh-ai", methods=["POST"])
+@app.route("/p/<profile>/api/refresh-ai", methods=["POST"])
 def refresh_ai():
     """Manually trigger an AI summary refresh (bypasses schedule)."""
+    refused = _leader_only()
+    if refused:
+        return refused
     if not ai_summary_enabled:
         return jsonify({"error": "AI summary is disabled"}), 400
     fetch_ai_summary(force=True)
+    ai = cache[_ai_feed()]
     return jsonify({
         "status": "refreshed",
-        "item_count": len(cache["ai_summary"]["items"]),
-        "error": cache["ai_summary"]["error"],
+        "item_count": len(ai["items"]),
+        "error": ai["error"],
     })
 
 
+@app.route(sync.PATH)
+def snapshot():
+    """The whole cache as a versioned, gzip-compressed snapshot for followers
+    (leader only). The version is the ETag; a follower that has it gets a 304."""
+    if ROLE != "leader":
+        abort(404)
+    _note_follower_view(request.headers.get("X-Last-View-Age", type=float))
+    version, blob = snapshot_blob()
+    if request.if_none_match.contains(version):
+        SNAPSHOT_SERVED.inc(status="not_modified")
+        response = app.response_class(status=304)
+    else:
+        SNAPSHOT_SERVED.inc(status="ok")
+        response = app.response_class(blob, mimetype="application/gzip")
+    response.set_etag(version)
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
 # ============ MAIN ============
 
-def _watchdog_loop():
-    """Background watchdog that detects stale feeds and forces recovery.
+# Feed → the fetcher that publishes it (for targeted recovery)
+_FEED_FETCHERS = {feed: name for name, feed in _FETCHER_FEEDS.items()}
+_WATCHDOG_EXCLUDED = {"ai_summary"}  # Schedule-based, not interval-based
+_hung_reported: set = set()  # (fetcher, start) already logged as hung
+
+
+def _feed_cadence(feed: str) -> float:
+    """Seconds between expected updates of `feed` (the longer refresh interval
+    unless config.py gives the feed its own)."""
+    return WATCHDOG_FEED_CADENCE.get(feed, max(REFRESH_INTERVAL, REFRESH_INTERVAL_YOM_TOV))
+
 
-    Runs every 2x the refresh interval. Checks EACH feed individually
-    (not just the freshest one) so a single healthy feed can't mask
-    dead ones. The ai_summary feed is excluded since it updates on
-    a schedule, not every interval.
+def _thread_stack(thread_id: int) -> str:
+    frame = sys._current_frames().get(thread_id)
+    return "".join(traceback.format_stack(frame, limit=8)) if frame else "(thread gone)\n"
+
+
+def watchdog_check() -> Dict[str, List[str]]:
+    """One watchdog pass: report hung fetchers, re-run fetchers of stale feeds.
+
+    A feed is stale after WATCHDOG_STALE_FACTOR × its cadence without an
+    update. Only its own fetcher is re-run, and only if that fetcher hasn't
+    finished a run within the same window — a fetcher that runs on schedule
+    but keeps failing is backing off, and re-running it early won't help.
+    A fetcher running longer than FETCHER_HUNG_AFTER is logged once with its
+    stack; it is never started a second time while the first run is alive.
     """
-    stale_threshold = REFRESH_INTERVAL * 3  # seconds
-    WATCHDOG_EXCLUDED = {"ai_summary"}  # Schedule-based, not interval-based
+    now = datetime.now()
+    hung = []
+    with _fetcher_state_lock:
+        running = dict(_fetcher_running)
+        finished = dict(_fetcher_finished)
+    for name, (started, thread_id) in running.items():
+        seconds = time.monotonic() - started
+        if seconds > FETCHER_HUNG_AFTER:
+            hung.append(name)
+            if (name, started) not in _hung_reported:
+                _hung_reported.add((name, started))
+                FETCHER_HUNG.inc(fetcher=name)
+                logger.error(f"WATCHDOG: Fetcher {name} hung for {seconds:.0f}s, at:\n{_thread_stack(thread_id)}")
+    _hung_reported.intersection_update((name, started) for name, (started, _) in running.items())
+
+    stale, recover = [], []
+    for feed, data in cache.items():
+        fetcher = _FEED_FETCHERS.get(feed)
+        if feed in _WATCHDOG_EXCLUDED or fetcher is None:
+            continue
+        window = _feed_cadence(feed) * WATCHDOG_STALE_FACTOR
+        lu = data["last_updated"]
+        if lu is not None and (now - lu).total_seconds() <= window:
+            continue
+        stale.append(f"{feed}({'never' if lu is None else f'{(now - lu).total_seconds() / 60:.0f}m'})")
+        ran_recently = fetcher in finished and time.monotonic() - finished[fetcher] <= window
+        if fetcher not in running and not ran_recently:
+            recover.append(fetcher)
+
+    if stale:
+        logger.warning(f"WATCHDOG: Stale feeds: {', '.join(stale)}; "
+                       f"recovering: {', '.join(recover) or 'none (fetchers running or ran recently)'}")
+    else:
+        logger.debug("WATCHDOG: All monitored feeds healthy")
+    fetchers = _fetchers()
+    for name in recover:
+        WATCHDOG_RECOVERIES.inc(fetcher=name)
+        with deadlines.deadline(CYCLE_TIMEOUT - _PUBLISH_MARGIN):
+            _start_fetcher(name, fetchers[name]).add_done_callback(lambda _: save_cache_to_disk())
+    return {"stale": stale, "recovering": recover, "hung": hung}
+
+
+def port_path(path: str, port: int) -> str:
+    """`path` for the instance on `port`: server.log → server-8081.log,
+    snapshot_cache.json.gz → snapshot_cache-8081.json.gz."""
+    head, tail = os.path.split(path)
+    name, dot, ext = tail.partition(".")
+    return os.path.join(head, f"{name}-{port}{dot}{ext}")
+
+
+def _watchdog_loop():
+    """Background watchdog: runs watchdog_check() every WATCHDOG_INTERVAL."""
     while True:
-        time.sleep(REFRESH_INTERVAL * 2)
+        time.sleep(WATCHDOG_INTERVAL)
         try:
-            now = datetime.now()
-            stale_feeds = []
-            any_updated = False
-
-            for feed_name, data in cache.items():
-                if feed_name in WATCHDOG_EXCLUDED:
-                    continue
-                lu = data["last_updated"]
-                if lu is None:
-                    stale_feeds.append(f"{feed_name}(never)")
-                else:
-                    age = (now - lu).total_seconds()
-                    if age > stale_threshold:
-                        stale_feeds.append(f"{feed_name}({age/60:.0f}m)")
-                    else:
-                        any_updated = True
-
-            if stale_feeds:
-                logger.error(
-                    f"WATCHDOG: Stale feeds detected: {', '.join(stale_feeds)}. Forcing update."
-                )
-                update_all_feeds()
-            elif not any_updated:
-                logger.warning("WATCHDOG: No feeds have ever been updated, forcing fetch")
-                update_all_feeds()
-            else:
-                logger.debug("WATCHDOG: All monitored feeds healthy")
+            watchdog_check()
         except Exception as e:
             logger.error(f"WATCHDOG: Error in watchdog loop: {e}")
 
 
 if __name__ == "__main__":
+    import argparse
     import socket
     import sys
 
+    # Role overrides, so a leader and a follower can run side by side on one machine
+    parser = argparse.ArgumentParser(description="Shabbos Situation Monitor")
+    parser.add_argument("--role", choices=("standalone", "leader", "follower"), default=ROLE)
+    parser.add_argument("--leader", default=LEADER_URL, help="leader URL, e.g. http://192.168.1.20:8080 (follower)")
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--snapshot-file", default=SNAPSHOT_FILE, help="follower's last good snapshot")
+    args = parser.parse_args()
+    if args.role == "follower" and not args.leader:
+        parser.error("a follower needs --leader (or LEADER_URL in config.py)")
+    if args.port != PORT:
+        # Another instance on this machine: its own logs and state files, since
+        # two processes rotating (or replacing) the same file clobber each other
+        configure_logging(port_path('server.log', args.port))
+        MEMORY_LOG = MEMORY_LOG and port_path(MEMORY_LOG, args.port)
+        CACHE_FILE = port_path(CACHE_FILE, args.port)
+        if args.snapshot_file == SNAPSHOT_FILE:
+            args.snapshot_file = port_path(SNAPSHOT_FILE, args.port)
+    ROLE, LEADER_URL, PORT = args.role, args.leader, args.port
+
     # Fail fast if port is already in use — prevents doomed instances from
     # wasting 30+ HTTP requests on update_all_feeds() before discovering
     # they can't bind the port (root cause of Shabbos #2 failure)
@@ -2762,73 +4693,115 @@ if __name__ == "__main__":
         _test_sock.close()
         sys.exit(1)
 
-    # Load cached data from disk (instant dashboard on restart)
-    if load_cache_from_disk():
-        logger.info("Dashboard will show cached data while feeds refresh")
+    # Offline/benchmark modes: capture or serve recorded upstream responses
+    if (UPSTREAM_RECORD or UPSTREAM_REPLAY) and ROLE != "follower":
+        set_upstream_mode(UPSTREAM_RECORD, UPSTREAM_REPLAY, UPSTREAM_LATENCY_SCALE)
+
+    # Memory snapshots (RSS + tracemalloc) for multi-day runs, at /debug/memory
+    memwatch.configure(MEMORY_SNAPSHOT_RING, MEMORY_LOG, MEMORY_LOG_MAX_BYTES, MEMORY_TRACEMALLOC_FRAMES)
 
-    # Setup scheduler for background updates
     scheduler = BackgroundScheduler()
+    # Memory watch: snapshot, trim caches over the soft ceiling, restart over the hard one
     scheduler.add_job(
-        update_all_feeds,
+        check_memory,
         "interval",
-        seconds=REFRESH_INTERVAL,
-        id="feed_updater"
+        seconds=MEMORY_SNAPSHOT_INTERVAL,
+        id="memory_watch",
     )
-    scheduler.start()
 
-    # Start watchdog thread (detects stale feeds / dead scheduler)
-    watchdog = threading.Thread(target=_watchdog_loop, daemon=True, name="watchdog")
-    watchdog.start()
-    logger.info("Watchdog thread started")
+    if ROLE == "follower":
+        # Render the leader's snapshots only: no fetchers, watchdog, AI jobs or cache file
+        scheduler.start()
+        memwatch.take()  # baseline for /debug/memory
+        start_following(LEADER_URL, args.snapshot_file)
+        logger.info(f"Following {LEADER_URL} (pulling every {SNAPSHOT_POLL_INTERVAL}s)")
+    else:
+        # Load cached data from disk (instant dashboard on restart)
+        if load_cache_from_disk():
+            logger.info("Dashboard will show cached data while feeds refresh")
 
-    # AI summary scheduler (always registered — respects runtime toggle)
-    # The fetch_ai_summary() function itself checks ai_summary_enabled + API key
-    if HAS_ANTHROPIC:
-        scheduler.add_job(
-            fetch_ai_summary,
-            "cron",
-            minute=5,
-            id="ai_summary_updater",
-            timezone="America/New_York",
-        )
-        # Candle-lighting summary: every 5 min, 4-8 PM ET daily
-        # Checks internally if it's Friday or Yom Tov eve
+        # Setup scheduler for background updates
         scheduler.add_job(
-            _check_candle_lighting_summary,
-            "cron",
-            hour="16-20",
-            minute="*/5",
-            id="candle_lighting_summary",
-            timezone="America/New_York",
+            update_all_feeds,
+            "interval",
+            seconds=REFRESH_INTERVAL,
+            id="feed_updater"
         )
-        logger.info("AI summary scheduler registered (hourly at :05, schedule-aware)")
-        logger.info("Candle-lighting summary scheduler registered (daily 4-8 PM ET, checks for Shabbos/Yom Tov)")
-        if os.environ.get("ANTHROPIC_API_KEY"):
-            logger.info("AI summary ready: API key found")
+        # Optional daily sanity check of the offline calendar against Hebcal
+        if HEBCAL_CROSS_CHECK:
+            scheduler.add_job(
+                hebcal_cross_check,
+                "cron",
+                hour=3,
+                id="hebcal_cross_check",
+                timezone=LOCATION_TZ,
+            )
+        scheduler.start()
+        memwatch.take()  # baseline for /debug/memory
+
+        # Start watchdog thread (detects stale feeds / dead scheduler)
+        watchdog = threading.Thread(target=_watchdog_loop, daemon=True, name="watchdog")
+        watchdog.start()
+        logger.info("Watchdog thread started")
+
+        # AI summary scheduler (always registered — respects runtime toggle)
+        # The fetch_ai_summary() function itself checks ai_summary_enabled + API key
+        if HAS_ANTHROPIC:
+            scheduler.add_job(
+                for_each_profile(fetch_ai_summary),
+                "cron",
+                minute=5,
+                id="ai_summary_updater",
+                timezone="America/New_York",
+            )
+            # Candle-lighting summary: every 5 min, 4-8 PM ET daily (all day when
+            # other profiles' candle lighting may fall outside that window).
+            # Checks internally if it's Friday or Yom Tov eve at each profile's location
+            scheduler.add_job(
+                for_each_profile(_check_candle_lighting_summary),
+                "cron",
+                hour="*" if profiles.extra_profiles() else "16-20",
+                minute="*/5",
+                id="candle_lighting_summary",
+                timezone="America/New_York",
+            )
+            logger.info("AI summary scheduler registered (hourly at :05, schedule-aware)")
+            logger.info("Candle-lighting summary scheduler registered (daily 4-8 PM ET, checks for Shabbos/Yom Tov)")
+            if os.environ.get("ANTHROPIC_API_KEY"):
+                logger.info("AI summary ready: API key found")
+            else:
+                logger.info("AI summary: no API key yet (add to .env or toggle will prompt)")
         else:
-            logger.info("AI summary: no API key yet (add to .env or toggle will prompt)")
-    else:
-        logger.info("AI summary unavailable: anthropic package not installed")
+            logger.info("AI summary unavailable: anthropic package not installed")
 
-    # Initial fetch on startup
-    logger.info("Performing initial feed fetch...")
-    update_all_feeds()
+        # Initial fetch on startup
+        logger.info("Performing initial feed fetch...")
+        update_all_feeds()
 
     # AI summary starts OFF — no initial API call. User toggles on via dashboard.
     # (Previous behavior: auto-called on startup, wasting credits if nobody was watching)
 
     # AI status for startup message
     _ai_status = "off (toggle on dashboard)" if (HAS_ANTHROPIC and os.environ.get("ANTHROPIC_API_KEY")) else "no API key" if HAS_ANTHROPIC else "no package"
+    if ROLE == "follower":
+        _ai_status = "from the leader"
 
     # Print startup info
     print("\n" + "=" * 50)
     print("  SHABBOS SITUATION MONITOR")
     print("=" * 50)
     print(f"\n  Dashboard: http://localhost:{PORT}")
-    print(f"  Refresh interval: {REFRESH_INTERVAL // 60} minutes")
+    for _profile in profiles.extra_profiles():
+        print(f"  Dashboard ({_profile.name}): http://localhost:{PORT}{_profile.base_path}/")
+    if ROLE == "follower":
+        print(f"  Following: {LEADER_URL} (every {SNAPSHOT_POLL_INTERVAL}s)")
+    else:
+        print(f"  Refresh interval: {REFRESH_INTERVAL // 60} minutes")
+    if ROLE == "leader":
+        print(f"  Snapshots for followers: http://localhost:{PORT}{sync.PATH}")
     print(f"  AI summary: {_ai_status}")
     print(f"  Auto-restart: via start.sh")
-    print(f"  Watchdog: active")
+    print(f"  Watchdog: {'off (follower)' if ROLE == 'follower' else 'active'}")
     print(f"\n  Press Ctrl+C to stop\n")
     print("=" * 50 + "\n")
 
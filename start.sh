@@ -49,11 +49,31 @@ if [ ! -f "venv/.deps_installed" ]; then
     fi
 fi
 
+# Port of this instance: --port N / --port=N (passed on to server.py), else $PORT, else 8080.
+# A leader and a follower on one machine: ./start.sh --role leader, then
+# ./start.sh --role follower --port 8081 --leader http://localhost:8080
+SERVER_PORT=${PORT:-8080}
+ARGS=("$@")
+for ((i = 0; i < ${#ARGS[@]}; i++)); do
+    case "${ARGS[$i]}" in
+        --port) SERVER_PORT="${ARGS[$((i + 1))]}" ;;
+        --port=*) SERVER_PORT="${ARGS[$i]#--port=}" ;;
+    esac
+done
+if [ "$SERVER_PORT" != "8080" ] && [[ ! " $* " =~ " --port" ]]; then
+    set -- "$@" --port "$SERVER_PORT"  # $PORT set: tell server.py too
+fi
+# On another port the server keeps its own logs and state files (server-8081.log, ...)
+LOG_FILE=server.log
+if [ "$SERVER_PORT" != "8080" ]; then
+    LOG_FILE="server-$SERVER_PORT.log"
+fi
+
 # ---- Duplicate-instance guard ----
 # Prevent multiple start.sh from running concurrently (root cause of Shabbos #2 failure)
-EXISTING_PID=$(lsof -i :8080 -t 2>/dev/null)
+EXISTING_PID=$(lsof -i :$SERVER_PORT -t 2>/dev/null)
 if [ -n "$EXISTING_PID" ]; then
-    echo -e "${RED}ERROR: Port 8080 already in use by PID $EXISTING_PID${NC}"
+    echo -e "${RED}ERROR: Port $SERVER_PORT already in use by PID $EXISTING_PID${NC}"
     echo -e "${YELLOW}Another instance is already running.${NC}"
     echo ""
     echo "To kill all existing instances and start fresh:"
@@ -69,13 +89,13 @@ echo ""
 echo -e "${GREEN}Starting server...${NC}"
 echo ""
 echo "Access the monitor at:"
-echo "  Local:   http://localhost:8080"
+echo "  Local:   http://localhost:$SERVER_PORT"
 if [ -n "$LOCAL_IP" ]; then
-    echo "  Network: http://${LOCAL_IP}:8080"
+    echo "  Network: http://${LOCAL_IP}:$SERVER_PORT"
 fi
 echo ""
 echo "Press Ctrl+C to stop the server"
-echo "Server will auto-restart on crash (max 10 rapid restarts)."
+echo "Server will auto-restart on crash (max 10 rapid restarts) or memory ceiling (max 3 an hour)."
 echo "========================================"
 echo ""
 
@@ -93,15 +113,48 @@ trap 'echo -e "\n${YELLOW}Shutting down...${NC}"; kill $CAFFEINATE_PID 2>/dev/nu
 MAX_RAPID_RESTARTS=10
 RAPID_WINDOW=600  # seconds
 RESTART_TIMES=()
+# Memory-ceiling restarts (exit code 75) are planned, but a server that is over
+# the ceiling again right after starting (e.g. MEMORY_HARD_LIMIT_MIB set too low)
+# would restart forever: max 3 within an hour
+MAX_MEMORY_RESTARTS=3
+MEMORY_WINDOW=3600  # seconds
+MEMORY_RESTART_TIMES=()
 
 while true; do
-    python3 server.py
+    python3 server.py "$@"
     EXIT_CODE=$?
     if [ $EXIT_CODE -eq 0 ]; then
         echo -e "${GREEN}Server stopped cleanly.${NC}"
         break
     fi
 
+    # Exit code 75: the server restarted itself (memory hard ceiling, see
+    # $LOG_FILE) after saving its cache — planned, so not counted as a crash,
+    # but limited on its own
+    if [ $EXIT_CODE -eq 75 ]; then
+        NOW=$(date +%s)
+        MEMORY_RESTART_TIMES+=("$NOW")
+        CUTOFF=$((NOW - MEMORY_WINDOW))
+        RECENT=()
+        for T in "${MEMORY_RESTART_TIMES[@]}"; do
+            if [ "$T" -ge "$CUTOFF" ]; then
+                RECENT+=("$T")
+            fi
+        done
+        MEMORY_RESTART_TIMES=("${RECENT[@]}")
+
+        if [ ${#MEMORY_RESTART_TIMES[@]} -gt $MAX_MEMORY_RESTARTS ]; then
+            echo ""
+            echo -e "${RED}MEMORY RESTART LOOP: ${#MEMORY_RESTART_TIMES[@]} memory-ceiling exits in ${MEMORY_WINDOW}s. Stopping.${NC}"
+            echo -e "${RED}Check MEMORY_HARD_LIMIT_MIB in config.py and /debug/memory, then restart manually.${NC}"
+            kill $CAFFEINATE_PID 2>/dev/null
+            exit 1
+        fi
+        echo -e "${YELLOW}Server requested a restart (memory ceiling). Restarting... (${#MEMORY_RESTART_TIMES[@]}/$MAX_MEMORY_RESTARTS in ${MEMORY_WINDOW}s)${NC}"
+        sleep 2
+        continue
+    fi
+
     # Track restart timestamps for crash-loop detection
     NOW=$(date +%s)
     RESTART_TIMES+=("$NOW")
@@ -118,7 +171,7 @@ while true; do
     if [ ${#RESTART_TIMES[@]} -ge $MAX_RAPID_RESTARTS ]; then
         echo ""
         echo -e "${RED}CRASH LOOP DETECTED: ${#RESTART_TIMES[@]} restarts in ${RAPID_WINDOW}s. Stopping.${NC}"
-        echo -e "${RED}Check server.log for the root cause, then restart manually.${NC}"
+        echo -e "${RED}Check $LOG_FILE for the root cause, then restart manually.${NC}"
         kill $CAFFEINATE_PID 2>/dev/null
         exit 1
     fi
@@ -128,9 +181,9 @@ while true; do
     echo -e "${YELLOW}(Press Ctrl+C to stop)${NC}"
     sleep 5
     # Re-check port before restarting (another instance may have claimed it)
-    EXISTING_PID=$(lsof -i :8080 -t 2>/dev/null)
+    EXISTING_PID=$(lsof -i :$SERVER_PORT -t 2>/dev/null)
     if [ -n "$EXISTING_PID" ]; then
-        echo -e "${RED}Port 8080 now in use by PID $EXISTING_PID. Exiting restart loop.${NC}"
+        echo -e "${RED}Port $SERVER_PORT now in use by PID $EXISTING_PID. Exiting restart loop.${NC}"
         kill $CAFFEINATE_PID 2>/dev/null
         exit 1
     fi
@@ -0,0 +1,224 @@
+// Shabbos Situation Monitor dashboard — served fingerprinted from /assets/
+
+// ===== Live updates (server-sent events) =====
+// The server pushes the HTML of each section (status bar, a column,
+// footer) that changed since this page was rendered; only those are
+// patched. EventSource reconnects by itself, resuming from the last
+// version it saw, and the server then sends whatever changed meanwhile.
+// Routes are relative to the dashboard's profile ('' or '/p/<name>')
+const basePath = document.body.dataset.base || '';
+
+function patchSection(id, html) {
+    var el = document.getElementById(id);
+    if (!el) return;
+    var fresh = document.createElement('div');
+    fresh.innerHTML = html;
+    var header = el.querySelector('.feed-header');
+    var content = el.querySelector('.feed-content');
+    var freshHeader = fresh.querySelector('.feed-header');
+    var freshContent = fresh.querySelector('.feed-content');
+    if (header && content && freshHeader && freshContent) {
+        // Keep the scrolling element itself so its scroll position survives
+        header.replaceWith(freshHeader);
+        content.innerHTML = freshContent.innerHTML;
+    } else {
+        el.innerHTML = html;
+    }
+}
+
+(function() {
+    const banner = document.getElementById('reconnecting-banner');
+    let failCount = 0;
+    const source = new EventSource(basePath + '/events?since=' + encodeURIComponent(document.body.dataset.version));
+
+    source.addEventListener('sections', function(e) {
+        const sections = JSON.parse(e.data);
+        Object.keys(sections).forEach(function(id) {
+            patchSection(id, sections[id]);
+        });
+    });
+    source.onopen = function() {
+        failCount = 0;
+        banner.classList.remove('visible');
+    };
+    source.onerror = function() {
+        failCount++;
+        banner.classList.add('visible');
+        banner.textContent = 'Server unreachable — retrying... attempt ' + failCount +
+            ' (data below is from last successful update)';
+    };
+})();
+
+// ===== AI Summary toggle and refresh =====
+function toggleAI() {
+    fetch(basePath + '/api/toggle-ai', { method: 'POST' })
+        .then(function(r) { return r.json(); })
+        .then(function(data) {
+            // The AI column is pushed over /events with the new state
+        })
+        .catch(function(err) {
+            console.error('Toggle failed:', err);
+        });
+}
+
+function refreshAI() {
+    var btn = document.getElementById('ai-refresh-btn');
+    if (btn) {
+        btn.disabled = true;
+        btn.textContent = '...';
+    }
+    fetch(basePath + '/api/refresh-ai', { method: 'POST' })
+        .then(function(r) { return r.json(); })
+        .then(function(data) {
+            // The new summary arrives over /events; this button is replaced with it
+            if (btn) {
+                btn.disabled = false;
+                btn.textContent = '↻';
+            }
+        })
+        .catch(function(err) {
+            console.error('Refresh failed:', err);
+            if (btn) {
+                btn.disabled = false;
+                btn.textContent = '↻';
+            }
+        });
+}
+
+// ===== Collapsible day groups in AI summary =====
+document.addEventListener('click', function(e) {
+    if (e.target.classList.contains('day-separator')) {
+        e.target.classList.toggle('collapsed');
+        var group = e.target.nextElementSibling;
+        if (group && group.classList.contains('day-group')) {
+            group.classList.toggle('collapsed');
+        }
+    }
+});
+
+// ===== Auto-scroll for feed columns =====
+// One scheduler drives every column: each sweeps down, then back up, over
+// SWEEP_MS per direction, eased at the turnarounds. Position is computed from
+// elapsed (visible) time, so dropped or late frames never make it drift. The
+// page is only touched when a column's whole-pixel position changes: between
+// those moments the scheduler sleeps, and a requestAnimationFrame does the
+// write. It stops while the tab is hidden, and a column's bounds are re-read
+// whenever its content or size changes.
+const autoScroll = (function() {
+    const SWEEP_MS = Number(document.body.dataset.refreshInterval) * 0.8 * 1000;
+    const MAX_SLEEP_MS = 1000;
+    const columns = [];
+    let clock = 0;         // visible milliseconds elapsed
+    let lastFrame = null;  // timestamp of the previous tick
+    let timer = null;
+    let frame = null;
+
+    function ease(x) {
+        return (1 - Math.cos(Math.PI * x)) / 2;
+    }
+
+    // Place the column's phase so the sweep continues from where it is now
+    function anchor(col) {
+        col.max = col.el.scrollHeight - col.el.clientHeight;
+        col.dirty = false;
+        if (col.max <= 0) return;
+        const fraction = Math.min(1, col.el.scrollTop / col.max);
+        const x = Math.acos(1 - 2 * fraction) / Math.PI;
+        col.phase = col.down ? x : 1 - x;
+        col.clock = clock;  // time spent unscrollable (or before this change) doesn't count
+        col.top = Math.round(col.el.scrollTop);
+    }
+
+    function tick(now) {
+        frame = null;
+        if (lastFrame !== null) clock += Math.min(now - lastFrame, MAX_SLEEP_MS * 2);
+        lastFrame = now;
+        let sleep = Infinity;
+        columns.forEach(function(col) {
+            if (col.dirty) anchor(col);
+            if (col.max <= 0) return;
+            let phase = col.phase + (clock - col.clock) / SWEEP_MS;
+            while (phase >= 1) {
+                phase -= 1;
+                col.down = !col.down;
+            }
+            col.phase = phase;
+            col.clock = clock;
+            const top = Math.round(col.max * ease(col.down ? phase : 1 - phase));
+            if (top !== col.top) {
+                col.el.scrollTop = top;
+                col.top = top;
+            }
+            // Time until this column moves by another pixel (slow near the turnarounds)
+            const speed = col.max * Math.PI / 2 * Math.sin(Math.PI * phase) / SWEEP_MS;
+            sleep = Math.min(sleep, speed > 0 ? 1 / speed : MAX_SLEEP_MS, MAX_SLEEP_MS);
+        });
+        // Nothing to scroll: sleep until an observer reports a change
+        if (sleep !== Infinity) schedule(sleep);
+    }
+
+    function schedule(sleep) {
+        if (document.hidden || timer !== null || frame !== null) return;
+        if (sleep < 20) {
+            frame = requestAnimationFrame(tick);
+        } else {
+            timer = setTimeout(function() {
+                timer = null;
+                frame = requestAnimationFrame(tick);
+            }, sleep);
+        }
+    }
+
+    // Run the next tick now, e.g. after a column changed
+    function wake() {
+        clearTimeout(timer);
+        timer = null;
+        schedule(0);
+    }
+
+    function stop() {
+        clearTimeout(timer);
+        cancelAnimationFrame(frame);
+        timer = frame = null;
+        lastFrame = null;  // hidden time doesn't count
+    }
+
+    document.addEventListener('visibilitychange', function() {
+        if (document.hidden) {
+            stop();
+        } else {
+            schedule(0);
+        }
+    });
+
+    const resized = new ResizeObserver(function(entries) {
+        entries.forEach(function(entry) { entry.target.autoScrollColumn.dirty = true; });
+        wake();
+    });
+    const mutated = new MutationObserver(function(records) {
+        records.forEach(function(record) {
+            const el = record.target.closest('.feed-content');
+            if (el && el.autoScrollColumn) el.autoScrollColumn.dirty = true;
+        });
+        wake();
+    });
+
+    return {
+        add: function(elementId) {
+            const el = document.getElementById(elementId);
+            if (!el) return;
+            const col = {el: el, max: 0, phase: 0, down: true, top: 0, clock: clock, dirty: true};
+            el.autoScrollColumn = col;
+            columns.push(col);
+            resized.observe(el);
+            mutated.observe(el, {childList: true, subtree: true, characterData: true});
+            wake();
+        },
+    };
+})();
+
+autoScroll.add('think-tanks-scroll');
+autoScroll.add('reuters-scroll');
+autoScroll.add('toi-scroll');
+autoScroll.add('raw-feeds-scroll');
+autoScroll.add('ai-scroll');
@@ -0,0 +1,140 @@
+"""
+Shabbos Situation Monitor - Leader/Follower Sync
+
+Several displays in one building need only one instance doing the work. The
+leader fetches every source and generates the AI summaries, and serves the
+whole feed cache as a versioned snapshot at /api/snapshot: gzip-compressed
+JSON, encoded once per cache generation, with the version as its ETag. A
+follower pulls it every SNAPSHOT_POLL_INTERVAL with If-None-Match (an
+unchanged snapshot costs a 304) and only renders it. It makes no upstream
+requests and needs no API key.
+
+Each snapshot a follower applies is also written, as received, to
+SNAPSHOT_FILE (atomically). On startup, and whenever the leader is
+unreachable, the follower keeps showing the last good snapshot.
+
+This module handles the wire format and the pulling. The server turns its
+cache into a payload and back (snapshot_payload / apply_snapshot).
+"""
+
+import gzip
+import json
+import os
+import tempfile
+import time
+from typing import Callable, Dict, Optional
+
+import requests
+
+SCHEMA_VERSION = 1
+PATH = "/api/snapshot"
+
+
+class SnapshotError(ValueError):
+    """A snapshot that can't be used (corrupt, or from an incompatible leader)."""
+
+
+def encode(payload: Dict) -> bytes:
+    return gzip.compress(json.dumps(payload, separators=(",", ":")).encode(), compresslevel=6)
+
+
+def decode(blob: bytes) -> Dict:
+    """The payload in `blob`; SnapshotError unless it is a complete snapshot of this schema."""
+    try:
+        payload = json.loads(gzip.decompress(blob))
+    except (OSError, EOFError, ValueError) as e:
+        raise SnapshotError(f"unreadable snapshot: {e}") from e
+    if not isinstance(payload, dict) or payload.get("snapshot_schema") != SCHEMA_VERSION:
+        raise SnapshotError(f"snapshot schema {payload.get('snapshot_schema') if isinstance(payload, dict) else '?'}, "
+                            f"expected {SCHEMA_VERSION}")
+    if not payload.get("version") or not isinstance(payload.get("feeds"), dict):
+        raise SnapshotError("snapshot without version or feeds")
+    return payload
+
+
+def save_last_good(path: str, blob: bytes) -> None:
+    """Write `blob` to `path` atomically (a crash leaves the previous snapshot)."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(blob)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def load_last_good(path: str) -> Optional[Dict]:
+    """The snapshot saved at `path`, or None if there is none (or it is unusable)."""
+    try:
+        with open(path, "rb") as f:
+            return decode(f.read())
+    except (OSError, SnapshotError):
+        return None
+
+
+class Follower:
+    """Pulls snapshots from a leader and hands each new one to `apply`."""
+
+    def __init__(self, leader_url: str, apply: Callable[[Dict], None], last_good_path: Optional[str],
+                 timeout: float = 10, headers: Optional[Callable[[], Dict[str, str]]] = None):
+        self.url = leader_url.rstrip("/") + PATH
+        self.apply = apply
+        self.last_good_path = last_good_path
+        self.timeout = timeout
+        self.headers = headers or dict
+        self.version: Optional[str] = None
+        self.applied_at: Optional[float] = None   # time.time() the current snapshot was applied
+        self.checked_at: Optional[float] = None   # last successful contact with the leader
+        self.error: Optional[str] = None
+
+    def restore(self) -> bool:
+        """Apply the last good snapshot from disk, if there is one."""
+        if not self.last_good_path:
+            return False
+        payload = load_last_good(self.last_good_path)
+        if payload is None:
+            return False
+        self.apply(payload)
+        self.version = payload["version"]
+        self.applied_at = time.time()
+        return True
+
+    def pull(self) -> str:
+        """One pull: "updated", "unchanged" or "error" (the current snapshot stays)."""
+        headers = dict(self.headers())
+        if self.version:
+            headers["If-None-Match"] = f'"{self.version}"'
+        try:
+            response = requests.get(self.url, headers=headers, timeout=self.timeout)
+            if response.status_code == 304:
+                self.checked_at, self.error = time.time(), None
+                return "unchanged"
+            response.raise_for_status()
+            payload = decode(response.content)
+            self.apply(payload)
+        except (requests.RequestException, SnapshotError) as e:
+            self.error = str(e)[:200]
+            return "error"
+        self.version = payload["version"]
+        self.applied_at = self.checked_at = time.time()
+        self.error = None
+        if self.last_good_path:
+            try:
+                save_last_good(self.last_good_path, response.content)
+            except OSError as e:
+                self.error = f"saving last good snapshot: {e}"
+        return "updated"
+
+    def status(self) -> Dict:
+        now = time.time()
+        return {
+            "leader": self.url,
+            "version": self.version,
+            "snapshot_age_s": round(now - self.applied_at, 1) if self.applied_at else None,
+            "leader_seen_s": round(now - self.checked_at, 1) if self.checked_at else None,
+            "error": self.error,
+        }
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Tests for how the dashboard is served: fingerprinted static assets and
+response compression.
+
+Runs offline — no fetchers are called.
+
+Usage:
+    python test_dashboard.py
+    python -m pytest test_dashboard.py
+"""
+
+import gzip
+import os
+import re
+import sys
+import tempfile
+
+sys.path.insert(0, '.')
+
+import server
+
+GZIP = {"Accept-Encoding": "gzip, deflate"}
+
+
+def _asset_urls(html: str) -> list:
+    return re.findall(r'/assets/[\w.-]+', html)
+
+
+def test_page_references_fingerprinted_assets():
+    client = server.app.test_client()
+    html = client.get("/").get_data(as_text=True)
+    urls = _asset_urls(html)
+    assert sorted(u.rsplit(".", 1)[1] for u in urls) == ["css", "js"]
+    assert "<style>" not in html and "<script>" not in html
+
+    for url in urls:
+        plain = client.get(url)
+        assert plain.status_code == 200 and "Content-Encoding" not in plain.headers
+        assert plain.headers["Cache-Control"] == f"public, max-age={server.ASSET_MAX_AGE}, immutable"
+        packed = client.get(url, headers=GZIP)
+        assert packed.headers["Content-Encoding"] == "gzip"
+        assert gzip.decompress(packed.data) == plain.data
+        assert "Accept-Encoding" in packed.headers["Vary"]
+
+    assert client.get("/assets/dashboard.000000000000.css").status_code == 404
+
+
+def test_fingerprint_follows_content():
+    saved = dict(server._assets), dict(server._asset_names), server.STATIC_DIR
+    try:
+        with tempfile.TemporaryDirectory() as static_dir:
+            server.STATIC_DIR = static_dir
+            path = os.path.join(static_dir, "dashboard.css")
+            names = []
+            for css in ("body { color: red }", "body { color: red }", "body { color: blue }"):
+                with open(path, "w") as f:
+                    f.write(css)
+                server._load_assets()
+                names.append(server._asset_names["dashboard.css"])
+        assert names[0] == names[1] != names[2]
+    finally:
+        server._assets.clear()
+        server._asset_names.clear()
+        server._assets.update(saved[0])
+        server._asset_names.update(saved[1])
+        server.STATIC_DIR = saved[2]
+
+
+def test_html_and_json_are_gzipped_when_accepted():
+    client = server.app.test_client()
+    server.bump_generation()
+    plain = client.get("/")
+    packed = client.get("/", headers=GZIP)
+    assert "Content-Encoding" not in plain.headers
+    assert packed.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(packed.data) == plain.data
+    # Each encoding is its own representation, with its own strong ETag
+    assert packed.headers["ETag"] == plain.headers["ETag"][:-1] + '-gz"'
+    assert client.get("/", headers={**GZIP, "If-None-Match": packed.headers["ETag"]}).status_code == 304
+    assert client.get("/", headers={**GZIP, "If-None-Match": plain.headers["ETag"]}).status_code == 200
+
+    health = client.get("/health", headers=GZIP)
+    assert health.headers["Content-Encoding"] == "gzip"
+    assert b'"feeds"' in gzip.decompress(health.data)
+
+    # Small bodies aren't worth it; event streams are never buffered
+    assert "Content-Encoding" not in client.post("/api/toggle-ai", headers=GZIP).headers
+    client.post("/api/toggle-ai")
+    stream = client.get("/events", headers=GZIP, buffered=False)
+    assert "Content-Encoding" not in stream.headers
+    stream.close()
+
+
+if __name__ == "__main__":
+    import testrunner
+    testrunner.run("Testing dashboard serving", globals())
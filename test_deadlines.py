@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Tests for deadline propagation and partial-result salvage.
+
+Runs offline — requests and per-account fetches are replaced with stubs.
+
+Usage:
+    python test_deadlines.py
+    python -m pytest test_deadlines.py
+"""
+
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+sys.path.insert(0, '.')
+
+import deadlines
+import server
+import tracing
+
+
+def test_deadlines_nest_and_follow_submitted_work():
+    assert deadlines.remaining() is None and deadlines.timeout(15) == 15
+    with deadlines.deadline(2):
+        with deadlines.deadline(60):  # an inner deadline never extends the outer one
+            assert deadlines.remaining() <= 2
+            assert deadlines.timeout(15) <= 2 and deadlines.timeout(1) == 1
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert tracing.submit(executor, deadlines.remaining).result() <= 2
+    assert deadlines.remaining() is None
+    with deadlines.deadline(0):
+        assert deadlines.expired()
+        try:
+            deadlines.timeout(15)
+        except deadlines.DeadlineExceeded:
+            pass
+        else:
+            raise AssertionError("no budget left, but a timeout was handed out")
+
+
+def test_requests_take_their_timeout_from_the_deadline():
+    timeouts = []
+    saved = server.requests.get
+
+    def fake_get(url, **kwargs):
+        timeouts.append(kwargs["timeout"])
+        response = server.requests.Response()
+        response.status_code, response._content = 200, b"ok"
+        return response
+
+    server.requests.get = fake_get
+    try:
+        with deadlines.deadline(3):
+            assert server.safe_request("https://deadline.example/a", timeout=15)
+        with deadlines.deadline(0):
+            assert server.safe_request("https://deadline.example/b") is None  # not even attempted
+    finally:
+        server.requests.get = saved
+    assert len(timeouts) == 1 and 0 < timeouts[0] <= 3
+
+
+def test_twitter_keeps_accounts_that_finished_before_the_deadline():
+    release = threading.Event()
+    now = datetime.now(timezone.utc).isoformat()
+
+    def fetch_account(username):
+        if username == "stuck":
+            release.wait(10)
+            return []
+        return [server.FeedItem(author=f"@{username}", text=f"post from {username}", timestamp=now,
+                                link=f"https://x.com/{username}/1", feed_source="osint")]
+
+    saved = (server.fetch_single_twitter_account, server.TWITTER_ACCOUNTS, server.TWITTER_ACCOUNT_TIMEOUT)
+    server.fetch_single_twitter_account = fetch_account
+    server.TWITTER_ACCOUNTS, server.TWITTER_ACCOUNT_TIMEOUT = ["fast1", "stuck", "fast2"], 0.2
+    try:
+        start = time.monotonic()
+        server.fetch_twitter_accounts()
+        assert time.monotonic() - start < 5, "waited for the stuck account"
+    finally:
+        release.set()
+        server.fetch_single_twitter_account, server.TWITTER_ACCOUNTS, server.TWITTER_ACCOUNT_TIMEOUT = saved
+    feed = server.cache["twitter_list"]
+    assert sorted(item.author for item in feed["items"]) == ["@fast1", "@fast2"]
+    assert feed["account_status"] == {"fast1": True, "stuck": False, "fast2": True}
+    assert feed["source"] == "twitter" and feed["error"] is None
+
+
+if __name__ == "__main__":
+    import testrunner
+    testrunner.run("Testing deadlines", globals())
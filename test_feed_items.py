@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""Tests for the FeedItem model: cache persistence (both schemas), rendering and
+the per-entry memo.
+
+Runs offline — fetchers are only given canned responses.
+
+Usage:
+    python test_feed_items.py
+    python -m pytest test_feed_items.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime, timezone
+
+sys.path.insert(0, '.')
+
+import server
+from server import FeedItem
+
+_FEEDS = ("twitter_list", "trump", "reuters", "toi_liveblog", "think_tanks")
+
+
+def _load(payload: dict) -> bool:
+    """Write `payload` as the cache file and run load_cache_from_disk() on it."""
+    fd, path = tempfile.mkstemp(suffix=".json")
+    with os.fdopen(fd, "w") as f:
+        json.dump(payload, f)
+    saved_file = server.CACHE_FILE
+    server.CACHE_FILE = path
+    try:
+        server.publish_feeds({name: {"items": []} for name in _FEEDS})
+        return server.load_cache_from_disk()
+    finally:
+        server.CACHE_FILE = saved_file
+        os.unlink(path)
+
+
+def _payload(schema_version: int, feeds: dict, **extra) -> dict:
+    return {"saved_at": datetime.now().isoformat(), "schema_version": schema_version,
+            "feeds": feeds, **extra}
+
+
+def test_load_schema_1_dicts():
+    """Caches written before FeedItem stored plain dicts, with or without `epoch`."""
+    feeds = {
+        "trump": {"items": [{"author": "Donald J. Trump", "text": "post",
+                             "timestamp": "2026-03-01T12:00:00Z", "link": "https://t/1"}],
+                  "last_updated": None, "error": None},
+        "twitter_list": {"items": [{"author": "@a", "text": "tweet", "timestamp": "2026-03-01T12:00:00+00:00",
+                                    "epoch": 1772366400.0, "feed_source": "osint", "unknown_key": 1},
+                                   {"author": "@b", "text": "undated", "timestamp": "yesterday-ish"}],
+                         "last_updated": None, "error": None},
+    }
+    assert _load(_payload(1, feeds))
+
+    trump = server.cache["trump"]["items"][0]
+    assert isinstance(trump, FeedItem)
+    assert trump.epoch == 1772366400.0 and trump.timestamp == "2026-03-01T12:00:00+00:00"
+    dated, undated = server.cache["twitter_list"]["items"]
+    assert dated.feed_source == "osint" and dated["text"] == "tweet"
+    assert undated.epoch == 0.0 and undated.timestamp == "yesterday-ish"
+
+
+def test_load_schema_2_rows():
+    items = [FeedItem(title="Think tank piece", summary="Summary text", timestamp="2026-03-01T12:00:00Z",
+                      link="https://fdd.example/a", source="FDD")]
+    rows = [item.to_row() for item in items]
+    feeds = {"think_tanks": {"items": rows, "last_updated": None, "error": None}}
+
+    assert _load(_payload(2, feeds, item_fields=list(FeedItem.FIELDS)))
+    loaded = server.cache["think_tanks"]["items"]
+    assert [i.to_row() for i in loaded] == rows
+    assert server._article_summary_cache["https://fdd.example/a"] == "Summary text"
+
+    # Rows without a recorded field order are read in the current order
+    assert _load(_payload(2, feeds))
+    assert [i.to_row() for i in server.cache["think_tanks"]["items"]] == rows
+
+    # A different recorded order is mapped by name
+    reordered = list(reversed(FeedItem.FIELDS))
+    assert _load(_payload(2, {"think_tanks": {"items": [list(reversed(r)) for r in rows]}},
+                          item_fields=reordered))
+    assert [i.to_row() for i in server.cache["think_tanks"]["items"]] == rows
+
+
+def test_save_load_round_trip():
+    server.publish("reuters", items=[FeedItem(title="R", summary="s", link="https://r/1",
+                                              timestamp=datetime.now(timezone.utc).isoformat())])
+    before = [i.to_row() for i in server.cache["reuters"]["items"]]
+    fd, path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    saved_file = server.CACHE_FILE
+    server.CACHE_FILE = path
+    try:
+        server.save_cache_to_disk()
+        with open(path) as f:
+            data = json.load(f)
+        assert data["schema_version"] == 2 and data["feeds"]["reuters"]["items"] == before
+        server.publish("reuters", items=[])
+        assert server.load_cache_from_disk()
+    finally:
+        server.CACHE_FILE = saved_file
+        os.unlink(path)
+    assert [i.to_row() for i in server.cache["reuters"]["items"]] == before
+
+
+def test_dashboard_renders_feed_items():
+    now = datetime.now(timezone.utc).isoformat()
+    server.publish_feeds({
+        "twitter_list": {"items": [FeedItem(author="@sentdefender", text="osint-tweet-text",
+                                            timestamp=now, link="https://x/1", feed_source="osint")]},
+        "trump": {"items": [FeedItem(author="Donald J. Trump", text="truth-post-text",
+                                     timestamp=now, link="https://t/1", feed_source="trump")]},
+        "reuters": {"items": [FeedItem(title="reuters-headline", timestamp=now, link="https://r/1")]},
+        "think_tanks": {"items": [FeedItem(title="think-tank-title", summary="think-tank-summary",
+                                           timestamp=now, link="https://f/1", source="FDD")]},
+    })
+
+    response = server.app.test_client().get("/")
+    assert response.status_code == 200
+    for text in (b"osint-tweet-text", b"truth-post-text", b"reuters-headline", b"think-tank-summary"):
+        assert text in response.data, text
+
+
+def test_dashboard_render_cache_and_etag():
+    client = server.app.test_client()
+    server.bump_generation()
+    renders = server._dashboard_stats["renders"]
+
+    first = client.get("/")
+    etag = first.headers["ETag"]
+    assert first.status_code == 200 and first.headers["Cache-Control"] == "no-cache"
+    again = client.get("/")
+    assert again.data == first.data and again.headers["ETag"] == etag
+    assert client.get("/", headers={"If-None-Match": etag}).status_code == 304
+    if server._dashboard_pages["default"]["version"] == server._dashboard_version():  # same minute: one render
+        assert server._dashboard_stats["renders"] == renders + 1
+
+    # New data → new generation → new ETag and a fresh render
+    server.publish("reuters", items=[FeedItem(title="fresh-headline", link="https://r/2",
+                                              timestamp=datetime.now(timezone.utc).isoformat())])
+    changed = client.get("/", headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and b"fresh-headline" in changed.data
+    assert changed.headers["ETag"] != etag
+
+    health = client.get("/health").get_json()["dashboard"]
+    assert health["generation"] == server.cache.generation and health["not_modified"] >= 1
+
+
+def test_published_snapshots_are_immutable():
+    old = server.cache
+    item = FeedItem(title="snapshot-headline", link="https://r/4")
+    new = server.publish("reuters", items=[item], error=None)
+
+    assert server.cache is new and new.generation == old.generation + 1
+    assert new["reuters"]["items"] == (item,)
+    # Other feeds are shared, not copied; the old snapshot is untouched
+    assert new["trump"] is old["trump"] and item not in old["reuters"]["items"]
+    for write in (lambda: new["reuters"].__setitem__("items", []),
+                  lambda: new["reuters"]["items"].append(item)):
+        try:
+            write()
+        except (TypeError, AttributeError):
+            continue
+        raise AssertionError("published state was modified in place")
+
+
+def _next_event(stream) -> str:
+    """Next non-comment SSE message from a streamed response."""
+    for chunk in stream:
+        text = chunk.decode()
+        if not text.startswith(":"):
+            return text
+
+
+def test_events_push_only_changed_sections():
+    client = server.app.test_client()
+    server.bump_generation()
+    page = client.get("/")
+    response = client.get(f"/events?since={page.headers['ETag'].strip(chr(34))}", buffered=False)
+    stream = iter(response.response)
+    try:
+        assert _next_event(stream).startswith("retry:")
+        # The page is current: nothing to send until the data changes
+        assert next(stream).decode().startswith(":")
+
+        server.publish("reuters", items=[FeedItem(title="pushed-headline", link="https://r/3",
+                                                  timestamp=datetime.now(timezone.utc).isoformat())])
+        message = _next_event(stream)
+        assert message.startswith(f"id: {server._dashboard_version()}\nevent: sections\n")
+        sections = json.loads(message.split("data: ", 1)[1])
+        assert "pushed-headline" in sections["col-reuters"]
+        assert "col-think-tanks" not in sections and "col-ai" not in sections
+    finally:
+        response.close()
+
+    # A client whose version is unknown gets every section
+    response = client.get("/events?since=unknown", buffered=False)
+    stream = iter(response.response)
+    try:
+        _next_event(stream)
+        sections = json.loads(_next_event(stream).split("data: ", 1)[1])
+        assert set(sections) == set(server._DASHBOARD_SECTIONS)
+    finally:
+        response.close()
+
+
+_RSS = """<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>
+<item><guid>g1</guid><title>First headline</title><link>https://n/1</link>
+<pubDate>{now}</pubDate><description>&lt;p&gt;First &lt;b&gt;summary&lt;/b&gt;&lt;/p&gt;</description></item>
+<item><guid>g2</guid><title>{second}</title><link>https://n/2</link>
+<pubDate>{now}</pubDate><description>Second summary</description></item>
+</channel></rss>"""
+
+
+class _Response:
+    def __init__(self, content: str):
+        self.content = content.encode()
+
+
+def _fetch_reuters(second_title: str) -> list:
+    now = datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S +0000")
+    body = _RSS.format(now=now, second=second_title)
+    saved = server.safe_request
+    server.safe_request = lambda url, **kwargs: _Response(body)
+    try:
+        server.fetch_reuters()
+    finally:
+        server.safe_request = saved
+    return server.cache["reuters"]["items"]
+
+
+def test_entry_memo_reuses_unchanged_entries():
+    server._entry_memo.clear()
+    server._entry_memo_stats.clear()
+    first = _fetch_reuters("Second headline")
+    assert [i.summary for i in first] == ["First summary", "Second summary"]
+
+    second = _fetch_reuters("Second headline")
+    assert second[0] is first[0] and second[1] is first[1]
+    assert server.entry_memo_hit_rates()["reuters"] == {"hits": 2, "misses": 2, "hit_rate": 0.5}
+
+    # An edited entry (same guid, new title) is rebuilt; the other is reused
+    third = _fetch_reuters("Second headline, updated")
+    assert third[0] is first[0] and third[1] is not first[1]
+    assert third[1].title == "Second headline, updated"
+    assert server.entry_memo_hit_rates()["reuters"]["misses"] == 3
+
+
+if __name__ == "__main__":
+    import testrunner
+    testrunner.run("Testing FeedItem model", globals())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Tests for the offline Hebrew calendar engine (hebrew_calendar.py).
+
+Runs offline. The engine is checked against the Yom Tov dates of six years
+(5783-5788) as published in Hebrew calendars, hard-coded below; there is no
+comparison against recorded Hebcal API output. At runtime, HEBCAL_CROSS_CHECK
+compares the local calendar with Hebcal daily and logs any mismatch.
+
+Usage:
+    python test_hebrew_calendar.py
+    python -m pytest test_hebrew_calendar.py
+"""
+
+import sys
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+sys.path.insert(0, '.')
+
+import hebrew_calendar as hc
+
+# First day of each Yom Tov (diaspora), from published calendars
+REFERENCE_YOM_TOV = {
+    5783: {"Rosh Hashana": "2022-09-26", "Yom Kippur": "2022-10-05", "Sukkot I": "2022-10-10",
+           "Shmini Atzeret": "2022-10-17", "Pesach I": "2023-04-06", "Pesach VII": "2023-04-12",
+           "Shavuot I": "2023-05-26"},
+    5784: {"Rosh Hashana": "2023-09-16", "Yom Kippur": "2023-09-25", "Sukkot I": "2023-09-30",
+           "Shmini Atzeret": "2023-10-07", "Pesach I": "2024-04-23", "Pesach VII": "2024-04-29",
+           "Shavuot I": "2024-06-12"},
+    5785: {"Rosh Hashana": "2024-10-03", "Yom Kippur": "2024-10-12", "Sukkot I": "2024-10-17",
+           "Shmini Atzeret": "2024-10-24", "Pesach I": "2025-04-13", "Pesach VII": "2025-04-19",
+           "Shavuot I": "2025-06-02"},
+    5786: {"Rosh Hashana": "2025-09-23", "Yom Kippur": "2025-10-02", "Sukkot I": "2025-10-07",
+           "Shmini Atzeret": "2025-10-14", "Pesach I": "2026-04-02", "Pesach VII": "2026-04-08",
+           "Shavuot I": "2026-05-22"},
+    5787: {"Rosh Hashana": "2026-09-12", "Yom Kippur": "2026-09-21", "Sukkot I": "2026-09-26",
+           "Shmini Atzeret": "2026-10-03", "Pesach I": "2027-04-22", "Pesach VII": "2027-04-28",
+           "Shavuot I": "2027-06-11"},
+    5788: {"Rosh Hashana": "2027-10-02", "Yom Kippur": "2027-10-11", "Sukkot I": "2027-10-16",
+           "Shmini Atzeret": "2027-10-23", "Pesach I": "2028-04-11", "Pesach VII": "2028-04-17",
+           "Shavuot I": "2028-05-31"},
+}
+
+# Havdalah/candle offsets used for event tests (config defaults)
+CANDLE_OFFSET = 18
+HAVDALAH_OFFSET = 50
+_NY = ZoneInfo("America/New_York")
+
+
+def _fixed_sunset(d: date) -> datetime:
+    """Deterministic stand-in for astral: sunset at 19:00 local."""
+    return datetime(d.year, d.month, d.day, 19, 0, tzinfo=_NY)
+
+
+def test_round_trip():
+    d = date(1900, 1, 1)
+    while d < date(2100, 1, 1):
+        y, m, day = hc.from_gregorian(d)
+        assert hc.to_gregorian(y, m, day) == d, d
+        d += timedelta(days=13)
+
+
+def test_year_lengths_are_valid():
+    for year in range(5700, 5900):
+        assert hc.days_in_year(year) in (353, 354, 355, 383, 384, 385), year
+        assert (hc.days_in_year(year) > 355) == hc.is_leap_year(year), year
+
+
+def test_known_hebrew_dates():
+    assert hc.format_hebrew_date(date(2026, 4, 2)) == "15 Nisan 5786"
+    assert hc.format_hebrew_date(date(2025, 9, 23)) == "1 Tishrei 5786"
+    assert hc.format_hebrew_date(date(2024, 3, 24)) == "14 Adar II 5784"
+
+
+def test_reference_yom_tov_dates():
+    for year, expected in REFERENCE_YOM_TOV.items():
+        by_title = {title.split(" 5")[0]: d.isoformat() for d, title in hc.yom_tov_days(year).items()}
+        for title, iso in expected.items():
+            assert by_title.get(title) == iso, f"{year} {title}: {by_title.get(title)} != {iso}"
+
+
+def test_israel_has_no_second_days():
+    diaspora, israel = hc.yom_tov_days(5786), hc.yom_tov_days(5786, israel=True)
+    assert len(diaspora) == 13 and len(israel) == 8
+    assert set(israel) <= set(diaspora)
+    assert date(2026, 4, 3) not in israel  # Pesach II
+
+
+def test_pesach_2026_candles_and_havdalah():
+    """Pesach I on Thursday: erev Wed, 2nd night Thu after nightfall,
+    Fri before sunset into Shabbos, havdalah Sat night."""
+    events = hc.calendar_events(date(2026, 3, 31), date(2026, 4, 5), _fixed_sunset,
+                                CANDLE_OFFSET, HAVDALAH_OFFSET)
+    timed = [(e["category"], e["date"]) for e in events if e["category"] != "holiday"]
+    assert timed == [
+        ("candles", "2026-04-01T18:42:00-04:00"),
+        ("candles", "2026-04-02T19:50:00-04:00"),
+        ("candles", "2026-04-03T18:42:00-04:00"),
+        ("havdalah", "2026-04-04T19:50:00-04:00"),
+    ], timed
+
+
+if __name__ == "__main__":
+    import testrunner
+    testrunner.run("Testing offline Hebrew calendar", globals())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Tests for the queued log pipeline: non-blocking handlers, JSON records
+with cycle/span ids, and rate-limiting of repetitive messages.
+
+Usage:
+    python test_logpipe.py
+    python -m pytest test_logpipe.py
+"""
+
+import json
+import logging
+import logging.handlers
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, '.')
+
+import logpipe
+import server
+import tracing
+
+
+class _SlowHandler(logging.Handler):
+    """A handler as slow as a stalled disk or terminal."""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        time.sleep(0.05)
+        self.messages.append(self.format(record))
+
+
+def _test_logger(name):
+    log = logging.getLogger(f"test_logpipe.{name}")
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    return log
+
+
+def test_slow_handler_does_not_block_the_caller():
+    log, slow = _test_logger("slow"), _SlowHandler()
+    logpipe.configure(log, console=slow, file=None)
+    start = time.monotonic()
+    for n in range(20):
+        log.info(f"Got {n} tweets")
+    assert time.monotonic() - start < 0.5, "logging waited for the handler"
+    logpipe.flush()
+    assert len(slow.messages) == 20 and slow.messages[-1].endswith("Got 19 tweets")
+    assert server.logger.handlers and isinstance(server.logger.handlers[0], logging.handlers.QueueHandler)
+
+
+def test_json_records_carry_cycle_and_span_ids():
+    fd, path = tempfile.mkstemp(suffix=".log")
+    os.close(fd)
+    log = _test_logger("json")
+    file_handler = logging.FileHandler(path)
+    try:
+        logpipe.configure(log, console=None, file=file_handler, json_format=True)
+        with tracing.trace("cycle") as root:
+            with tracing.span("fetch_trump") as span:
+                log.info("Fetching %s", "trump")
+        log.warning("outside")
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            log.exception("failed")
+        logpipe.flush()
+        with open(path) as f:
+            inside, outside, failed = [json.loads(line) for line in f]
+    finally:
+        file_handler.close()
+        os.unlink(path)
+    assert inside["message"] == "Fetching trump" and inside["level"] == "INFO"
+    assert inside["cycle"] == root.attrs["trace_id"] and inside["span"] == span.id
+    assert outside["cycle"] is None and outside["span"] is None
+    assert failed["message"] == "failed" and "ValueError: boom" in failed["exception"]
+
+
+def test_reconfiguring_closes_replaced_handlers():
+    fd, path = tempfile.mkstemp(suffix=".log")
+    os.close(fd)
+    log = _test_logger("reconfigure")
+    first = logging.FileHandler(path)
+    try:
+        logpipe.configure(log, console=None, file=first)
+        log.info("to the first file")
+        logpipe.configure(log, console=None, file=None)
+        assert first.stream is None  # closed, not leaked
+        with open(path) as f:
+            assert f.read().endswith("to the first file\n")  # written out before closing
+    finally:
+        first.close()
+        os.unlink(path)
+
+
+def test_repetitive_messages_are_rate_limited():
+    limiter = logpipe.RateLimitFilter(limit=2, window=0.2)
+
+    def record(message, level=logging.INFO):
+        return logging.LogRecord("server", level, __file__, 1, message, None, None)
+
+    sent = [limiter.filter(record(f"Fetching @{name}...")) for name in ("a", "b", "c", "d")]
+    assert sent == [True, True, False, False]
+    assert limiter.filter(record("Cache saved"))  # a different message has its own budget
+    assert limiter.filter(record("All methods failed for @c", logging.WARNING))  # warnings always pass
+    time.sleep(0.25)
+    later = record("Fetching @e...")
+    assert limiter.filter(later)
+    assert later.getMessage() == "Fetching @e..." and later.suppressed == 2  # other handlers see it as logged
+    queued = logpipe._QueueHandler(None).prepare(later)
+    assert queued.getMessage() == "Fetching @e... (+2 similar suppressed)"
+    assert logpipe.RateLimitFilter(limit=0, window=60).filter(record("Fetching @a..."))
+
+
+if __name__ == "__main__":
+    import testrunner
+    testrunner.run("Testing log pipeline", globals())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Tests for memory snapshots, /debug/memory and the memory ceilings.
+
+Usage:
+    python test_memwatch.py
+    python -m pytest test_memwatch.py
+"""
+
+import os
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, '.')
+
+import memwatch
+import server
+
+
+def test_snapshot_diff_finds_growing_line():
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start(1)
+    try:
+        before = memwatch.take()
+        kept = [bytearray(1024) for _ in range(2000)]  # ~2 MiB from this line
+        after = memwatch.take()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    grown = memwatch.diff(before, after)
+    assert after.rss_mib and before.rss_mib
+    top = grown["lines"][0]
+    assert top["line"].startswith("test_memwatch.py:")
+    assert top["kib_delta"] > 1900 and top["count_delta"] >= 2000
+    assert grown["traced_mib_delta"] >= 1.8
+    del kept
+
+    client = server.app.test_client()
+    body = client.get(f"/debug/memory?a={before.id}&b={after.id}").get_json()
+    assert body["lines"][0]["line"] == top["line"] and body["from"]["id"] == before.id
+    assert any(s["id"] == after.id for s in body["snapshots"])
+    assert client.get("/debug/memory?a=0").status_code == 404
+
+
+def test_snapshot_log_is_bounded():
+    fd, path = tempfile.mkstemp(suffix=".log")
+    os.close(fd)
+    try:
+        memwatch.configure(3, path, log_max_bytes=2000, trace_frames=0)
+        for _ in range(30):
+            memwatch.take()
+        assert len(memwatch.recent()) == 3
+        assert os.path.getsize(path) <= 2000 and os.path.exists(path + ".1")
+    finally:
+        memwatch.configure(96, None, 0, trace_frames=0)
+        for name in (path, path + ".1"):
+            if os.path.exists(name):
+                os.unlink(name)
+
+
+def test_soft_ceiling_trims_and_hard_ceiling_restarts():
+    shown = server.FeedItem(title="Shown", link="https://think.example/shown", summary="s")
+    server.publish("think_tanks", items=[shown])
+    server._article_summary_cache.clear()
+    for n in range(server.ARTICLE_SUMMARY_CACHE_MAX + 5):
+        server._remember_article_summary(f"https://think.example/{n}", "old")
+    server._remember_article_summary(shown.link, shown.summary)
+    assert len(server._article_summary_cache) == server.ARTICLE_SUMMARY_CACHE_MAX  # LRU-bounded
+
+    server.check_memory(soft_mib=1e9, hard_mib=1e9)  # under both: nothing dropped
+    assert len(server._article_summary_cache) == server.ARTICLE_SUMMARY_CACHE_MAX
+
+    exits = []
+    saved = (server.os._exit, server.save_cache_to_disk)
+    server.os._exit = exits.append
+    server.save_cache_to_disk = lambda: exits.append("saved")
+    try:
+        server.check_memory(soft_mib=1, hard_mib=1e9)  # soft only: trim, keep running
+        assert list(server._article_summary_cache) == [shown.link] and not exits
+        server.check_memory(soft_mib=1, hard_mib=1)
+    finally:
+        server.os._exit, server.save_cache_to_disk = saved
+    assert exits == ["saved", memwatch.RESTART_EXIT_CODE]
+
+
+if __name__ == "__main__":
+    import testrunner
+    testrunner.run("Testing memory watch", globals())
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""Tests for the metrics registry and /metrics, and for cycle tracing and
+/debug/cycles.
+
+Runs offline — upstream requests and API calls are replaced with stubs.
+
+Usage:
+    python test_metrics.py
+    python -m pytest test_metrics.py
+"""
+
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+
+sys.path.insert(0, '.')
+
+import metrics
+import server
+
+
+def _sample(text: str, line_start: str) -> float:
+    """Value of the exposition line starting with `line_start`."""
+    for line in text.splitlines():
+        if line.startswith(line_start + " "):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"no sample {line_start}")
+
+
+def test_histogram_buckets_are_cumulative():
+    hist = metrics.Histogram("test_latency_seconds", "test", ["op"], buckets=(0.1, 1))
+    for value in (0.05, 0.5, 0.7, 3):
+        hist.observe(value, op="read")
+    text = hist.render()
+    assert "# TYPE test_latency_seconds histogram" in text
+    assert _sample(text, 'test_latency_seconds_bucket{op="read",le="0.1"}') == 1
+    assert _sample(text, 'test_latency_seconds_bucket{op="read",le="1"}') == 3
+    assert _sample(text, 'test_latency_seconds_bucket{op="read",le="+Inf"}') == 4
+    assert _sample(text, 'test_latency_seconds_sum{op="read"}') == 4.25
+    assert _sample(text, 'test_latency_seconds_count{op="read"}') == 4
+    try:
+        hist.observe(1, wrong="label")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown label accepted")
+    metrics._registry.remove(hist)
+
+
+class _Response:
+    def __init__(self, status: int, content: bytes):
+        self.status_code = status
+        self.content = content
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise server.requests.exceptions.HTTPError(str(self.status_code))
+
+
+def test_requests_fetchers_and_ai_calls_are_recorded():
+    saved = server.requests.get
+    responses = iter([_Response(200, b"x" * 300), _Response(429, b"")])
+    server.requests.get = lambda url, **kwargs: next(responses)
+    try:
+        assert server.safe_request("https://metrics.example/a")
+        try:
+            server.safe_request("https://metrics.example/b", raise_on_429=True)
+        except server.RateLimitError:
+            pass
+    finally:
+        server.requests.get = saved
+
+    def failing_fetcher():
+        raise RuntimeError("boom")
+
+    server._run_fetcher("oil_price", lambda: None)
+    try:
+        server._run_fetcher("oil_price", failing_fetcher)
+    except RuntimeError:
+        pass
+
+    usage = SimpleNamespace(input_tokens=120, output_tokens=30)
+    client = SimpleNamespace(messages=SimpleNamespace(create=lambda **kwargs: SimpleNamespace(usage=usage)))
+    server.create_ai_message(client, model="test-model", max_tokens=10, messages=[])
+
+    response = server.app.test_client().get("/metrics")
+    assert response.status_code == 200 and response.mimetype == "text/plain"
+    text = response.get_data(as_text=True)
+    assert _sample(text, 'shabbos_http_requests_total{host="metrics.example",status="200"}') >= 1
+    assert _sample(text, 'shabbos_http_response_bytes_total{host="metrics.example"}') >= 300
+    assert _sample(text, 'shabbos_rate_limited_total{host="metrics.example"}') >= 1
+    assert _sample(text, 'shabbos_fetcher_runs_total{fetcher="oil_price",outcome="ok"}') >= 1
+    assert _sample(text, 'shabbos_fetcher_runs_total{fetcher="oil_price",outcome="exception"}') >= 1
+    assert _sample(text, 'shabbos_fetcher_duration_seconds_count{fetcher="oil_price"}') >= 2
+    assert _sample(text, 'shabbos_ai_tokens_total{model="test-model",direction="input"}') >= 120
+    assert _sample(text, 'shabbos_ai_requests_total{model="test-model",outcome="ok"}') >= 1
+    assert _sample(text, "shabbos_cache_generation") == server.cache.generation
+    assert 'shabbos_feed_items{feed="reuters"}' in text
+
+
+def test_ai_usage_accounting():
+    server._ai_usage.clear()
+    usage = SimpleNamespace(input_tokens=1000, output_tokens=200, cache_read_input_tokens=500,
+                            cache_creation_input_tokens=0)
+    client = SimpleNamespace(messages=SimpleNamespace(create=lambda **kwargs: SimpleNamespace(usage=usage)))
+
+    def failing(**kwargs):
+        raise RuntimeError("overloaded")
+
+    model = server.AI_SUMMARY_REGULAR_MODEL
+    try:
+        server.create_ai_message(SimpleNamespace(messages=SimpleNamespace(create=failing)),
+                                 summary_type="regular", model=model, messages=[])
+    except RuntimeError:
+        pass
+    server.create_ai_message(client, summary_type="regular", attempt=1, model=model, messages=[])
+    server.create_ai_message(client, summary_type="article", model="unpriced-model", messages=[])
+
+    report = server.app.test_client().get("/api/ai-usage?days=3").get_json()
+    today = report["days"][0]
+    regular = today["by_type"]["regular"]
+    assert (regular["calls"], regular["errors"], regular["retries"]) == (2, 1, 1)
+    assert regular["input_tokens"] == 1000 and regular["cache_read_tokens"] == 500
+    assert regular["mean_output_tokens"] == 200 and regular["mean_latency_s"] is not None
+    prices = server.AI_MODEL_PRICES[model]
+    expected = (1000 * prices["input"] + 200 * prices["output"] + 500 * prices["cache_read"]) / 1e6
+    assert abs(regular["models"][model]["cost_usd"] - expected) < 1e-4
+    assert today["by_type"]["article"]["cost_usd"] is None  # no price configured
+    assert today["calls"] == report["totals"]["calls"] == 3
+
+    # Persisted with the cache and restored on startup
+    fd, path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    saved, server.CACHE_FILE = server.CACHE_FILE, path
+    try:
+        server.save_cache_to_disk()
+        before = server._ai_usage_copy()
+        server._ai_usage.clear()
+        server.load_cache_from_disk()
+        assert server._ai_usage_copy() == before
+    finally:
+        server.CACHE_FILE = saved
+        os.unlink(path)
+
+
+def test_cycle_trace_tree():
+    feed = b"<rss><channel><item><title>t</title></item></channel></rss>"
+    saved = {name: getattr(server, name) for name in
+             ("fetch_twitter_accounts", "fetch_trump", "fetch_reuters", "fetch_toi", "fetch_think_tanks",
+              "fetch_prediction_markets", "fetch_oil_price", "CACHE_FILE")}
+    saved_get = server.requests.get
+
+    def fetch_one():
+        response = server.safe_request("https://trace.example/rss")
+        server.parse_feed(response.content)
+
+    for name in saved:
+        setattr(server, name, lambda: None)
+    server.fetch_reuters = fetch_one
+    server.requests.get = lambda url, **kwargs: _Response(200, feed)
+    fd, server.CACHE_FILE = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    try:
+        server.update_all_feeds()
+    finally:
+        os.unlink(server.CACHE_FILE)
+        server.requests.get = saved_get
+        for name, value in saved.items():
+            setattr(server, name, value)
+
+    client = server.app.test_client()
+    tree = client.get("/debug/cycles/latest?format=json").get_json()
+    assert tree["name"] == "cycle" and tree["duration"] > 0
+    fetchers = {child["attrs"]["fetcher"]: child for child in tree["children"] if child["name"] == "fetcher"}
+    assert len(fetchers) == 7
+    http, parse = fetchers["reuters"]["children"]
+    assert http["name"] == "http" and http["attrs"] == {"host": "trace.example", "status": 200, "bytes": len(feed)}
+    assert parse["name"] == "parse" and parse["attrs"]["fn"] == "parse_feed"
+
+    text = client.get("/debug/cycles/latest").get_data(as_text=True)
+    assert text.splitlines()[0].split()[2] == "*"  # root is on the hot path
+    assert "fetcher  fetcher=reuters" in text and "http  host=trace.example" in text
+    listing = client.get("/debug/cycles").get_json()
+    assert listing[0]["trace_id"] == tree["attrs"]["trace_id"] and "reuters" in listing[0]["fetchers"]
+    assert client.get("/debug/cycles/0").status_code == 404
+
+
+if __name__ == "__main__":
+    import testrunner
+    testrunner.run("Testing metrics", globals())
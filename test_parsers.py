@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""Tests for the HTML scrapers in server.py against the page fixtures.
+
+Strained parsing (only the subtrees each parser declares) must produce the
+same output as building the whole page with html.parser.
+
+Usage:
+    python test_parsers.py
+    python -m pytest test_parsers.py
+"""
+
+import json
+import os
+import random
+import re
+import sys
+from html import unescape
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, '.')
+
+import server
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "html")
+
+
+def _fixture(name: str) -> bytes:
+    with open(os.path.join(FIXTURE_DIR, name), "rb") as f:
+        return f.read()
+
+
+def _rows(items):
+    return [item.to_row() for item in items]
+
+
+def _full_tree(parse):
+    """Run `parse` with strainers disabled (whole page, html.parser)."""
+    original = server.parse_html
+    server.parse_html = lambda markup, only=None: BeautifulSoup(markup, "html.parser")
+    try:
+        return parse()
+    finally:
+        server.parse_html = original
+
+
+def test_twitter_syndication_matches_full_tree():
+    html = _fixture("twitter_syndication.html")
+    parse = lambda: _rows(server.parse_twitter_syndication(html, "sentdefender"))
+    items = parse()
+    assert len(items) == 5 and items[0][1]  # text
+    assert items == _full_tree(parse)
+
+
+def test_nitter_profile_matches_full_tree():
+    html = _fixture("nitter_profile.html")
+    parse = lambda: _rows(server.parse_nitter_profile(html, "sentdefender"))
+    items = parse()
+    assert len(items) == 5 and items[0][4]  # timestamp from the tweet-date title
+    assert items == _full_tree(parse)
+
+
+def test_toi_liveblog_matches_full_tree():
+    html = _fixture("toi_liveblog.html")
+    parse = lambda: _rows(server.parse_toi_liveblog(html, server.TOI_LIVEBLOG_URL))
+    items = parse()
+    assert len(items) == 10 and items[0][3]  # summary
+    assert items == _full_tree(parse)
+
+
+def test_toi_liveblog_structural_fallback():
+    """No known entry class: entries are found via liveblog_entry links on a full parse."""
+    html = ("<html><body><nav><a href='/'>Home</a></nav>"
+            "<div class='x'><a href='/liveblog_entry/a/'><h3>First headline</h3></a><p>First body</p></div>"
+            "<div class='x'><a href='/liveblog_entry/b/'><h3>Second headline</h3></a><p>Second body</p></div>"
+            "</body></html>")
+    items = server.parse_toi_liveblog(html, "https://example/liveblog")
+    assert [(i.title, i.summary) for i in items] == [("First headline", "First body"),
+                                                     ("Second headline", "Second body")]
+
+
+def test_think_tank_links_match_full_tree():
+    html = _fixture("think_tank_listing.html")
+    for feed_def in server.THINK_TANK_FEEDS:
+        if feed_def["type"] != "scrape":
+            continue
+        parse = lambda: server.parse_think_tank_links(html, feed_def)
+        links = parse()
+        assert links and all(feed_def["link_pattern"] in l["link"] for l in links)
+        assert links == _full_tree(parse)
+
+
+def test_article_text_matches_full_tree():
+    html = _fixture("think_tank_article.html")
+    text = server.parse_article_text(html)
+    assert len(text) == 3000 and "inlineAd" not in text and "Menu" not in text
+    assert text == _full_tree(lambda: server.parse_article_text(html))
+    # No <article>: falls back to the whole page
+    page = "<html><body><nav>Menu</nav><div class='post-body'>Body text here</div></body></html>"
+    assert server.parse_article_text(page) == "Body text here"
+
+
+def test_twstalker_matches_recorded_output():
+    """Every tweet on the page matches what the regex-cascade parser produced
+    (recorded in twstalker_profile.expected.json); the default stops at 5."""
+    html = _fixture("twstalker_profile.html").decode()
+    with open(os.path.join(FIXTURE_DIR, "twstalker_profile.expected.json")) as f:
+        expected = json.load(f)
+    fields = lambda items: [{"author": i.author, "text": i.text, "link": i.link,
+                             "timestamp_display": i.timestamp_display} for i in items]
+    assert fields(server.parse_twstalker_profile(html, "sentdefender", limit=100)) == expected
+    assert fields(server.parse_twstalker_profile(html, "sentdefender")) == expected[:5]
+
+
+def test_twstalker_block_text_rules():
+    block = '<div class="activity-group1">'
+    html = (
+        "<html><head><script>var x = '<div>';</script></head><body>"
+        + block + '<a href="/osint/status/1">3 hours ago</a><p>First line of this tweet is here'
+        "<script>track('long script text that is not tweet')</script> and continues</p>"
+        "<svg><text>svg label text long enough to count</text></svg><p>1,234,567,890,123,456,789,000</p>"
+        "<p>https://t.co/abcdefghijklmnopqrstuvwxyz</p>"
+        + block + '<a href="/osint/status/2">5 minutes ago</a><img src="media.jpg">'  # media-only
+        + block + "<p>A block without any status link in it</p>"
+        + block + '<a href="/other/status/3">2 days ago</a><p>Retweeted text &amp; more than twenty</p>'
+    )
+    items = server.parse_twstalker_profile(html, "osint")
+    assert [(i.text, i.link, i.timestamp_display) for i in items] == [
+        ("First line of this tweet is here and continues", "https://twitter.com/osint/status/1", "3 hours ago"),
+        ("RT @other: Retweeted text & more than twenty", "https://twitter.com/other/status/3", "2 days ago"),
+    ]
+
+
+def _reference_twstalker_text(block):
+    """Tweet text of a block as the old regex cascade extracted it."""
+    clean = re.sub(r'<script[^>]*>.*?</script>', '', block, flags=re.S)
+    clean = re.sub(r'<style[^>]*>.*?</style>', '', clean, flags=re.S)
+    clean = re.sub(r'<svg[^>]*>.*?</svg>', '', clean, flags=re.S)
+    clean = unescape(re.sub(r'<[^>]+>', '\n', clean))
+    lines = [l.strip() for l in clean.split('\n') if l.strip()]
+    return ' '.join([l for l in lines if len(l) > 20 and 'ago' not in l.lower()
+                     and not re.match(r'^[\d,\.]+$', l) and not l.startswith('http')][:3]).strip()
+
+
+def _scanned_twstalker_text(block):
+    html = '<div class="activity-group1">' + block
+    return ' '.join(server._scan_twstalker_text(html, html.index(">") + 1, len(html))[:3]).strip()
+
+
+def test_twstalker_adjacent_elements_join_lines():
+    svg = '<svg><path d="M0 0"/></svg>'
+    for block in (
+        f"<p>Breaking: strikes reported near the{svg}{svg}Isfahan facility overnight</p>",
+        f"<p>Breaking: strikes reported near{svg}{svg} Isfahan 2 minutes ago</p>",
+        f"<p>Breaking: strikes reported{svg}<script>x()</script><style>p{{}}</style>near the facility</p>",
+    ):
+        assert _scanned_twstalker_text(block) == _reference_twstalker_text(block), block
+    assert _scanned_twstalker_text(f"<p>Breaking: strikes reported near{svg}{svg} Isfahan 2 minutes ago</p>") == ""
+    assert "near theIsfahan" in _scanned_twstalker_text(f"<p>Breaking: strikes near the{svg}{svg}Isfahan</p>")
+
+
+def test_twstalker_scanner_matches_cascade_on_random_blocks():
+    """Random mixes of text, tags, entities and (adjacent, nested) script/style/svg
+    elements give the same text as the old cascade."""
+    rng = random.Random(31)
+    texts = ["Breaking: strikes reported near", "Isfahan facility overnight", "3 hours ago", "1,234",
+             "https://t.co/abcdefghijklmnop", "AT&amp;T &#8217;quoted&#8217;", " ", "a\nb", "x" * 25,
+             "short", "more than twenty characters of text"]
+    tags = ["<p>", "</p>", "<b>", "</b>", "<br/>", '<a href="/x/status/1">', "</a>", "<img src=x>"]
+
+    def element(depth):
+        kind = rng.choice(["script", "style", "svg"])
+        inner = "".join(piece(depth + 1) for _ in range(rng.randint(0, 3)))
+        return f"<{kind}{rng.choice(['', ' type=x'])}>{inner}</{kind}>"
+
+    def piece(depth=0):
+        roll = rng.random()
+        if roll < 0.45:
+            return rng.choice(texts)
+        if roll < 0.75 or depth > 1:
+            return rng.choice(tags)
+        return element(depth)
+
+    for _ in range(3000):
+        block = "".join(piece() for _ in range(rng.randint(1, 12)))
+        assert _scanned_twstalker_text(block) == _reference_twstalker_text(block), block
+
+
+# ============ TEXT EXTRACTION ============
+
+_TEXT_CASES = [
+    "",
+    "Plain headline with no markup",
+    "  padded plain text  ",
+    "AT&amp;T &amp; Verizon &#8217;quoted&#8217; &hellip; &unknown; &#x2014;",
+    "<p>First paragraph.</p><p>Second <b>bold</b> and <i>italic</i>.</p>",
+    "<div><script>var x = '<p>no</p>';</script><style>p { color: red }</style>Visible</div>",
+    "<!-- comment -->Before<br/>after<![CDATA[ cdata text ]]>",
+    'Read <a href="https://example.com/story">the story</a> now',
+    '<a href="https://example.com/x">https://example.com/x</a>',
+    '<a href="https://example.com/empty"></a> trailing',
+    '<p>Post body <a href="https://truthsocial.com/@realDonaldTrump/posts/1">'
+    'https://truthsocial.com/@realDonaldTrump/posts/1</a></p>',
+    '<p>RT <a href="https://www.example.com/a">@source</a>:   spaced\n\n text</p>',
+    "Unclosed <b>tag and < stray bracket",
+]
+
+
+def _reference_clean_html(html_text):
+    """clean_html() as a full BeautifulSoup parse."""
+    if not html_text:
+        return ""
+    return unescape(BeautifulSoup(html_text, "html.parser").get_text(separator=" ", strip=True))
+
+
+def _reference_text_with_links(html_text):
+    """extract_text_with_links() as a full BeautifulSoup parse."""
+    if not html_text:
+        return ""
+    soup = BeautifulSoup(html_text, "html.parser")
+    for a_tag in soup.find_all("a", href=True):
+        href, link_text = a_tag["href"], a_tag.get_text(strip=True)
+        a_tag.replace_with(f"{link_text} [{href}]" if href != link_text else link_text or href)
+    text = soup.get_text(separator=" ", strip=True)
+    text = re.sub(r'\[?https?://(?:www\.)?truthsocial\.com/\S+\]?', '', text)
+    return unescape(re.sub(r'\s+', ' ', text).strip())
+
+
+def test_text_extraction_matches_full_tree():
+    server._text_memo.clear()
+    for html_text in _TEXT_CASES:
+        assert server.clean_html(html_text) == _reference_clean_html(html_text), html_text
+        assert server.extract_text_with_links(html_text) == _reference_text_with_links(html_text), html_text
+
+
+def test_text_extraction_memo():
+    server._text_memo.clear()
+    stats = dict(server._text_memo_stats)
+    html_text = "<p>Memo <b>me</b></p>"
+    assert server.clean_html(html_text) == server.clean_html(html_text) == "Memo me"
+    assert server._text_memo_stats["misses"] - stats["misses"] == 1
+    assert server._text_memo_stats["hits"] - stats["hits"] == 1
+    # Plain text never enters the memo
+    server.clean_html("no markup here")
+    assert server._text_memo_stats["plain"] - stats["plain"] == 1
+    assert len(server._text_memo) == 1
+    # The memo is bounded
+    for i in range(server._TEXT_MEMO_MAX + 10):
+        server.clean_html(f"<i>{i}</i>")
+    assert len(server._text_memo) == server._TEXT_MEMO_MAX
+
+
+def test_news_rss_fixture_ingest():
+    feed = server.parse_feed(_fixture("news_rss.xml"))
+    items = [server._news_rss_item(entry, 300) for entry in feed.entries]
+    assert len(items) == 100 and not feed.bozo
+    assert all(i.title and i.link and i.epoch for i in items)
+    assert "<" not in items[0].summary and "&nbsp;" not in items[0].summary
+
+
+def test_ai_bullets_fixture():
+    bullets = server._parse_ai_bullets(_fixture("ai_bullets.txt").decode())
+    assert len(bullets) == 8  # the [Market Signal] line is dropped
+    assert all(b["category"] and b["text"].startswith(f"[{b['category']}] ") for b in bullets)
+    hours = [server.datetime.strptime(b["timestamp_display"], "%I:%M %p") for b in bullets]
+    assert hours == sorted(hours)
+
+
+if __name__ == "__main__":
+    import testrunner
+    testrunner.run("Testing HTML scrapers", globals())
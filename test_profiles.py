@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Tests for multi-profile serving: shared upstream fetches, and per-profile
+calendar, account filtering, AI summaries and routes.
+
+Runs offline — per-account fetches and the AI client are stubs.
+
+Usage:
+    python test_profiles.py
+    python -m pytest test_profiles.py
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+sys.path.insert(0, '.')
+
+import profiles
+import server
+
+_JERUSALEM = {
+    "TITLE": "Jerusalem Situation Monitor",
+    "LOCATION_LAT": 31.7683, "LOCATION_LON": 35.2137, "LOCATION_TZ": "Asia/Jerusalem",
+    "CANDLE_LIGHTING_OFFSET": 40, "YOM_TOV_ISRAEL": True,
+    "TWITTER_ACCOUNTS": ["shared", "local"],
+    "AI_SUMMARY_REGULAR_PROMPT": "Jerusalem prompt",
+}
+
+
+class _Profiles:
+    """Serve a "jerusalem" profile next to the default one for the block."""
+
+    def __enter__(self):
+        server.configure_profiles({"jerusalem": _JERUSALEM})
+        return profiles.get("jerusalem")
+
+    def __exit__(self, *exc):
+        server.configure_profiles({})
+
+
+def test_calendar_is_per_profile():
+    with _Profiles() as jerusalem:
+        default_times = server.get_shabbos_times()
+        with profiles.use(jerusalem):
+            times = server.get_shabbos_times()
+            friday = times["friday_date"]
+            sunset = server._sunset(friday)
+            assert server._get_calendar_index() is not server._calendar_indexes[profiles.default()]
+        assert str(times["candle_lighting"].tzinfo) == "Asia/Jerusalem"
+        assert times["candle_lighting"] == sunset - timedelta(minutes=40)
+        assert default_times["candle_lighting"].utcoffset() != times["candle_lighting"].utcoffset()
+        assert server.get_shabbos_times() == default_times  # the default profile is unaffected
+
+
+def test_accounts_are_fetched_once_and_filtered_per_profile():
+    fetched = []
+    now = datetime.now(timezone.utc).isoformat()
+
+    def fetch_account(username):
+        fetched.append(username)
+        return [server.FeedItem(author=username, text=f"post from {username}", timestamp=now,
+                                link=f"https://x.com/{username}/1", feed_source="osint")]
+
+    saved = (server.fetch_single_twitter_account, server.TWITTER_ACCOUNTS)
+    server.fetch_single_twitter_account = fetch_account
+    server.TWITTER_ACCOUNTS = ["national", "shared"]
+    try:
+        with _Profiles():
+            server.fetch_twitter_accounts()
+            client = server.app.test_client()
+            default_page = client.get("/").get_data(as_text=True)
+            jerusalem_page = client.get("/p/jerusalem/").get_data(as_text=True)
+            assert client.get("/p/nowhere/").status_code == 404
+    finally:
+        server.fetch_single_twitter_account, server.TWITTER_ACCOUNTS = saved
+    assert sorted(fetched) == ["local", "national", "shared"]  # each upstream account once
+    assert "post from national" in default_page and "post from local" not in default_page
+    assert "post from local" in jerusalem_page and "post from national" not in jerusalem_page
+    assert "post from shared" in default_page and "post from shared" in jerusalem_page
+    assert "Jerusalem Situation Monitor" in jerusalem_page and 'data-base="/p/jerusalem"' in jerusalem_page
+    assert 'data-base=""' in default_page
+
+
+def test_ai_summaries_are_per_profile():
+    prompts = []
+
+    def create(**kwargs):
+        prompts.append(kwargs["system"])
+        usage = SimpleNamespace(input_tokens=10, output_tokens=5)
+        return SimpleNamespace(content=[SimpleNamespace(text="[Military] 9:00 PM - Jerusalem bullet")], usage=usage)
+
+    saved = (server.anthropic.Anthropic, server.ai_summary_enabled, os.environ.get("ANTHROPIC_API_KEY"))
+    server.anthropic.Anthropic = lambda api_key: SimpleNamespace(messages=SimpleNamespace(create=create))
+    server.ai_summary_enabled, os.environ["ANTHROPIC_API_KEY"] = True, "test-key"  # the page shows summaries
+    try:
+        with _Profiles() as jerusalem:
+            server.publish("reuters", items=[server.FeedItem(title="Shared headline", link="https://n.example/1")],
+                           last_updated=datetime.now())
+            with profiles.use(jerusalem):
+                server._generate_regular_summary("test-key")
+            client = server.app.test_client()
+            assert client.get("/p/jerusalem/api/ai-status").get_json()["item_count"] == 1
+            assert client.get("/api/ai-status").get_json()["item_count"] == 0
+            assert "Jerusalem bullet" in client.get("/p/jerusalem/").get_data(as_text=True)
+            assert "Jerusalem bullet" not in client.get("/").get_data(as_text=True)
+            assert server.cache["ai_summary@jerusalem"]["items"]
+    finally:
+        server.anthropic.Anthropic, server.ai_summary_enabled, api_key = saved
+        if api_key is None:
+            os.environ.pop("ANTHROPIC_API_KEY")
+        else:
+            os.environ["ANTHROPIC_API_KEY"] = api_key
+    assert prompts == ["Jerusalem prompt"]
+    assert "ai_summary@jerusalem" not in server.cache  # gone with the profile
+
+
+if __name__ == "__main__":
+    import testrunner
+    testrunner.run("Testing profiles", globals())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Tests for upstream record/replay.
+
+Runs offline — recording captures canned responses, replay must not touch
+the network at all.
+
+Usage:
+    python test_replay.py
+    python -m pytest test_replay.py
+"""
+
+import os
+import sys
+import tempfile
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+sys.path.insert(0, '.')
+
+import requests
+
+import server
+
+_RSS = """<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>
+<item><guid>r1</guid><title>Recorded headline</title><link>https://n/r1</link>
+<pubDate>{now}</pubDate><description>Recorded summary</description></item>
+</channel></rss>"""
+
+
+def _canned(url, **kwargs) -> requests.Response:
+    response = requests.Response()
+    response.url = url
+    if "bbc" in url:
+        response.status_code = 500
+        response._content = b"upstream error"
+    else:
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/rss+xml; charset=utf-8"
+        response.headers["Content-Encoding"] = "gzip"
+        response._content = _RSS.format(now=datetime.now(timezone.utc).strftime(
+            "%a, %d %b %Y %H:%M:%S +0000")).encode()
+    return response
+
+
+def _offline(url, **kwargs):
+    raise AssertionError(f"network used while replaying: {url}")
+
+
+def test_record_then_replay_reuters():
+    fd, path = tempfile.mkstemp(suffix=".json.gz")
+    os.close(fd)
+    saved_get = server.requests.get
+    try:
+        server.requests.get = _canned
+        server.set_upstream_mode(record=path)
+        server.fetch_reuters()
+        server._recorder.store.save()
+        recorded = [i.to_row() for i in server.cache["reuters"]["items"]]
+        assert [i.title for i in server.cache["reuters"]["items"]] == ["Recorded headline"]
+
+        server.requests.get = _offline
+        server.set_upstream_mode(replay_from=path, latency_scale=0)
+        entry = server._replayer.store.responses[server.REUTERS_MIDEAST_RSS][0]
+        assert "Content-Encoding" not in entry["headers"] and entry["latency"] >= 0
+        server.publish("reuters", items=[])
+        server.fetch_reuters()
+        assert [i.to_row() for i in server.cache["reuters"]["items"]] == recorded
+
+        # Replayed responses behave like live ones; unknown URLs look unreachable
+        replayed = server.http_get(server.REUTERS_MIDEAST_RSS)
+        assert replayed.headers["content-type"].startswith("application/rss+xml")
+        assert replayed.encoding == "utf-8" and "Recorded headline" in replayed.text
+        assert server.safe_request("https://not-recorded.example/") is None
+        assert "https://not-recorded.example/" in server._replayer.misses
+    finally:
+        server.set_upstream_mode()
+        server.requests.get = saved_get
+        os.unlink(path)
+
+
+def test_replay_orders_repeated_urls_and_ai_replies():
+    store = server.replay.FixtureStore("unused")
+    store.add("https://x.example/a", 200, {}, b"first", 0.0)
+    store.add("https://x.example/a", 429, {}, b"", 0.0)
+    ai_kwargs = {"model": "test-model", "system": "s", "messages": [{"role": "user", "content": "hi"}]}
+    store.add(server._ai_fixture_key(ai_kwargs), 200, {"input_tokens": "7", "output_tokens": "3"}, b"reply", 0.0)
+    replayer = server.replay.Replayer(store, latency_scale=0)
+
+    assert [replayer.response("https://x.example/a").status_code for _ in range(3)] == [200, 429, 200]
+    replayer.rewind()
+    assert replayer.response("https://x.example/a").content == b"first"
+
+    server._replayer = replayer
+    try:
+        message = server.create_ai_message(SimpleNamespace(), **ai_kwargs)
+    finally:
+        server._replayer = None
+    assert message.content[0].text == "reply" and message.usage.output_tokens == 3
+
+
+if __name__ == "__main__":
+    import testrunner
+    testrunner.run("Testing upstream record/replay", globals())
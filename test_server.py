@@ -1,12 +1,27 @@
 #!/usr/bin/env python3
-"""Quick test script to verify the server works."""
+"""Quick test script to verify the server works.
 
+Usage:
+    python test_server.py                      # live upstreams
+    python test_server.py --record FIXTURES    # live, and save every upstream response
+    python test_server.py --replay FIXTURES    # offline, from recorded responses
+"""
+
+import argparse
 import sys
 sys.path.insert(0, '.')
 
-from server import app, update_all_feeds, cache
+import server
+from server import app, update_all_feeds
 from datetime import datetime
 
+parser = argparse.ArgumentParser()
+parser.add_argument("--record", metavar="FIXTURES", help="save upstream responses (e.g. fixtures/upstream.json.gz)")
+parser.add_argument("--replay", metavar="FIXTURES", help="serve upstream responses from a recording")
+args = parser.parse_args()
+if args.record or args.replay:
+    server.set_upstream_mode(record=args.record, replay_from=args.replay, latency_scale=0)
+
 print("Testing Shabbos Monitor Server")
 print("=" * 50)
 
@@ -16,7 +31,7 @@ update_all_feeds()
 
 # Check cache
 print("\n2. Cache status:")
-for name, data in cache.items():
+for name, data in server.cache.items():
     count = len(data['items'])
     error = data['error']
     status = 'OK' if count > 0 else 'FAIL'
@@ -29,7 +44,7 @@ print("\n3. Testing template...")
 with app.app_context():
     try:
         from flask import render_template
-        html = render_template('index.html', cache=cache, generated_at=datetime.now(), refresh_interval=600)
+        html = render_template('index.html', cache=server.cache, generated_at=datetime.now(), refresh_interval=600)
         print(f"   Template OK ({len(html)} chars)")
     except Exception as e:
         print(f"   Template ERROR: {e}")
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Tests for leader/follower sync: the leader's versioned snapshot endpoint,
+a follower pulling it over HTTP and keeping the last good one on disk, and
+a follower rendering what it applied.
+
+Runs offline — the "leader" is this process's app on a local port.
+
+Usage:
+    python test_sync.py
+    python -m pytest test_sync.py
+"""
+
+import os
+import sys
+import tempfile
+import threading
+from datetime import datetime
+
+from werkzeug.serving import make_server
+
+sys.path.insert(0, '.')
+
+import server
+import sync
+
+
+class _Leader:
+    """Serve this process's app as a leader on a local port for the block."""
+
+    def __enter__(self):
+        self.saved_role, server.ROLE = server.ROLE, "leader"
+        self.httpd = make_server("127.0.0.1", 0, server.app, threaded=True)
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return f"http://127.0.0.1:{self.httpd.server_port}"
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        server.ROLE = self.saved_role
+
+
+def test_leader_serves_versioned_snapshot():
+    client = server.app.test_client()
+    assert client.get("/api/snapshot").status_code == 404  # standalone: no snapshots
+    saved_role, server.ROLE = server.ROLE, "leader"
+    try:
+        item = server.FeedItem(title="Leader headline", link="https://n.example/1")
+        published = server.publish("reuters", items=[item], last_updated=datetime.now(), error=None)
+        response = client.get("/api/snapshot")
+        version = response.headers["ETag"].strip('"')
+        again = client.get("/api/snapshot", headers={"If-None-Match": f'"{version}"'})
+        server.publish("reuters", error="newer")
+        changed = client.get("/api/snapshot", headers={"If-None-Match": f'"{version}"'})
+    finally:
+        server.ROLE = saved_role
+    assert response.status_code == 200 and response.mimetype == "application/gzip"
+    payload = sync.decode(response.data)
+    assert payload["version"] == version == server.snapshot_version(published)
+    assert payload["feeds"]["reuters"]["items"][0][server.FeedItem.FIELDS.index("title")] == "Leader headline"
+    assert "ai_summary" in payload["feeds"] and set(payload["ai"]) == {"enabled", "has_anthropic", "has_api_key"}
+    assert again.status_code == 304 and not again.data
+    assert changed.status_code == 200 and sync.decode(changed.data)["feeds"]["reuters"]["error"] == "newer"
+
+
+def test_follower_pulls_and_keeps_last_good_snapshot():
+    applied = []
+    fd, path = tempfile.mkstemp(suffix=".json.gz")
+    os.close(fd)
+    os.unlink(path)
+    saved_view = server._last_dashboard_view
+    server._last_dashboard_view = None
+    try:
+        with _Leader() as leader_url:
+            follower = sync.Follower(leader_url, applied.append, path, timeout=5,
+                                     headers=lambda: {"X-Last-View-Age": "30"})
+            first = follower.pull()
+            second = follower.pull()
+            viewed = server._last_dashboard_view
+        down = follower.pull()
+        restarted = sync.Follower(leader_url, applied.append, path)
+        restored = restarted.restore()
+    finally:
+        server._last_dashboard_view = saved_view
+        if os.path.exists(path):
+            os.unlink(path)
+    assert (first, second, down) == ("updated", "unchanged", "error")
+    assert follower.version == applied[0]["version"] and follower.error  # leader gone: keeps its snapshot
+    assert restored and restarted.version == follower.version and len(applied) == 2
+    assert viewed is not None and 25 < (datetime.now() - viewed).total_seconds() < 60  # follower views count
+    assert sync.load_last_good(path + ".missing") is None
+
+
+def test_corrupt_or_foreign_snapshots_are_rejected():
+    fd, path = tempfile.mkstemp(suffix=".json.gz")
+    os.close(fd)
+    try:
+        sync.save_last_good(path, sync.encode({"snapshot_schema": sync.SCHEMA_VERSION, "version": "v1", "feeds": {}}))
+        try:
+            sync.decode(b"not gzip")
+            assert False, "corrupt snapshot decoded"
+        except sync.SnapshotError:
+            pass
+        try:
+            sync.decode(sync.encode({"snapshot_schema": sync.SCHEMA_VERSION + 1, "version": "v2", "feeds": {}}))
+            assert False, "snapshot of another schema decoded"
+        except sync.SnapshotError:
+            pass
+        assert sync.load_last_good(path)["version"] == "v1"
+    finally:
+        os.unlink(path)
+
+
+def test_follower_renders_the_leaders_state():
+    saved = (server.ai_summary_enabled, server._leader_ai, server.ROLE)
+    server.ROLE = "follower"
+    os_key = os.environ.pop("ANTHROPIC_API_KEY", None)  # a follower has no API key
+    try:
+        server.publish("reuters", items=[server.FeedItem(title="Relayed headline", link="https://n.example/2")],
+                       last_updated=datetime.now(), error=None)
+        payload = sync.decode(sync.encode(server.snapshot_payload(server.cache)))
+        payload["ai"] = {"enabled": True, "has_anthropic": True, "has_api_key": True}
+        payload["feeds"]["ai_summary@elsewhere"] = payload["feeds"]["ai_summary"]  # a profile not served here
+        server.publish("reuters", items=[], last_updated=None)
+        server.apply_snapshot(payload)
+        client = server.app.test_client()
+        page = client.get("/").get_data(as_text=True)
+        status = client.get("/api/ai-status").get_json()
+        toggle = client.post("/api/toggle-ai")
+    finally:
+        server.ai_summary_enabled, server._leader_ai, server.ROLE = saved
+        if os_key is not None:
+            os.environ["ANTHROPIC_API_KEY"] = os_key
+    assert server.cache["reuters"]["items"][0].title == "Relayed headline"
+    assert isinstance(server.cache["reuters"]["last_updated"], datetime)
+    assert "Relayed headline" in page and "API key needed" not in page
+    assert status["ai_enabled"] and status["has_api_key"]
+    assert toggle.status_code == 409 and 'id="ai-toggle" checked disabled' in page  # toggled on the leader
+    assert "ai_summary@elsewhere" not in server.cache
+
+
+if __name__ == "__main__":
+    import testrunner
+    testrunner.run("Testing leader/follower sync", globals())
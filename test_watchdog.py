@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Tests for hung-fetcher handling in the update cycle and targeted watchdog
+recovery.
+
+Runs offline — every fetcher is replaced with a stub.
+
+Usage:
+    python test_watchdog.py
+    python -m pytest test_watchdog.py
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, '.')
+
+import server
+
+_FETCHER_FUNCTIONS = {
+    "twitter": "fetch_twitter_accounts", "trump": "fetch_trump", "reuters": "fetch_reuters",
+    "toi": "fetch_toi", "think_tanks": "fetch_think_tanks",
+    "prediction_markets": "fetch_prediction_markets", "oil_price": "fetch_oil_price",
+}
+
+
+class _Stubs:
+    """Replace every fetcher with a counting no-op (or a given function)."""
+
+    def __init__(self, **overrides):
+        self.calls = {name: 0 for name in _FETCHER_FUNCTIONS}
+        self.overrides = overrides
+
+    def __enter__(self):
+        self.saved = {attr: getattr(server, attr) for attr in (*_FETCHER_FUNCTIONS.values(), "CACHE_FILE")}
+        for name, attr in _FETCHER_FUNCTIONS.items():
+            setattr(server, attr, self._counting(name, self.overrides.get(name)))
+        fd, server.CACHE_FILE = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        return self
+
+    def _counting(self, name, fn):
+        def fetch():
+            self.calls[name] += 1
+            if fn:
+                fn()
+        return fetch
+
+    def __exit__(self, *exc):
+        os.unlink(server.CACHE_FILE)
+        for attr, value in self.saved.items():
+            setattr(server, attr, value)
+
+
+def test_hung_fetcher_does_not_stall_cycles():
+    release = threading.Event()
+    saved = (server.CYCLE_TIMEOUT, server.FETCHER_HUNG_AFTER)
+    server.CYCLE_TIMEOUT, server.FETCHER_HUNG_AFTER = 0.3, 0
+    try:
+        with _Stubs(trump=lambda: release.wait(10)) as stubs:
+            start = time.monotonic()
+            server.update_all_feeds()
+            assert time.monotonic() - start < 3, "cycle waited for the hung fetcher"
+            assert "trump" in server.running_fetchers()
+
+            server.update_all_feeds()  # the hung run is not started a second time
+            assert stubs.calls["trump"] == 1 and stubs.calls["reuters"] == 2
+
+            hung_before = server.FETCHER_HUNG.value(fetcher="trump")
+            assert "trump" in server.watchdog_check()["hung"]
+            server.watchdog_check()  # reported once per hung run
+            assert server.FETCHER_HUNG.value(fetcher="trump") == hung_before + 1
+            release.set()
+            for _ in range(100):
+                if "trump" not in server.running_fetchers():
+                    break
+                time.sleep(0.02)
+            assert "trump" not in server.running_fetchers()
+    finally:
+        release.set()
+        server.CYCLE_TIMEOUT, server.FETCHER_HUNG_AFTER = saved
+
+
+def test_watchdog_recovers_only_the_stale_feed():
+    now = datetime.now()
+    old = now - timedelta(hours=5)
+    server.publish_feeds({
+        "twitter_list": {"last_updated": now}, "trump": {"last_updated": now},
+        "toi_liveblog": {"last_updated": now},
+        "reuters": {"last_updated": old},  # stale, and its fetcher hasn't run: recover
+        "think_tanks": {"last_updated": now - timedelta(hours=12)},  # stale, but its fetcher ran recently
+        "prediction_markets": {"last_updated": now - timedelta(minutes=90)},  # within its own cadence
+    })
+    recent_run, long_ago = time.monotonic(), time.monotonic() - 10 * 3600
+    with server._fetcher_state_lock:
+        server._fetcher_finished.update({name: recent_run for name in _FETCHER_FUNCTIONS})
+        server._fetcher_finished["reuters"] = long_ago
+    saved = threading.Event()  # the cache is saved once the recovered fetcher finishes
+    save_cache_to_disk, server.save_cache_to_disk = server.save_cache_to_disk, saved.set
+    try:
+        with _Stubs() as stubs:
+            result = server.watchdog_check()
+            assert saved.wait(5)
+    finally:
+        server.save_cache_to_disk = save_cache_to_disk
+    assert result["recovering"] == ["reuters"]
+    assert any(s.startswith("think_tanks") for s in result["stale"])
+    assert not any(s.startswith("prediction_markets") for s in result["stale"])
+    assert stubs.calls == {**{name: 0 for name in _FETCHER_FUNCTIONS}, "reuters": 1}
+
+
+if __name__ == "__main__":
+    import testrunner
+    testrunner.run("Testing watchdog", globals())
@@ -0,0 +1,26 @@
+"""
+Shabbos Situation Monitor - Test Runner
+
+Lets each test module run without pytest (`python test_x.py`): calls its
+test_* functions in order, prints OK/FAIL for each, and exits non-zero if
+any failed.
+"""
+
+import sys
+from typing import Dict
+
+
+def run(title: str, namespace: Dict) -> None:
+    """Run the test_* functions of `namespace` (a module's globals()) and exit."""
+    print(title)
+    print("=" * 50)
+    failed = 0
+    for name, fn in list(namespace.items()):
+        if name.startswith("test_") and callable(fn):
+            try:
+                fn()
+                print(f"   {name}: OK")
+            except AssertionError as e:
+                failed += 1
+                print(f"   {name}: FAIL — {e}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,196 @@
+"""
+Shabbos Situation Monitor - Cycle Tracing
+
+Lightweight nested timing spans. A trace starts with `trace(name)` (one per
+feed update cycle); `span(name, **attrs)` inside it records a child of the
+current span. Finished traces go into a bounded in-memory ring and,
+optionally, one JSON line each in a trace file.
+
+The current span lives in a ContextVar. Worker threads don't inherit it, so
+work handed to a ThreadPoolExecutor goes through `submit()`, which runs it
+in a copy of the submitter's context. Outside a trace, `span()` records
+nothing and costs one ContextVar lookup.
+"""
+
+import itertools
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from functools import wraps
+from typing import Callable, Dict, List, Optional, Tuple
+
+_current: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+_ids = itertools.count(1)
+_span_ids = itertools.count(1)
+
+_ring: deque = deque(maxlen=20)
+_ring_lock = threading.Lock()
+_trace_file: Optional[str] = None
+
+
+class Span:
+    __slots__ = ("id", "trace_id", "name", "attrs", "start", "duration", "error", "children", "_lock", "_t0")
+
+    def __init__(self, name: str, attrs: Dict, trace_id: Optional[int] = None):
+        self.id = next(_span_ids)
+        self.trace_id = trace_id
+        self.name = name
+        self.attrs = attrs
+        self.start = time.time()
+        self.duration: Optional[float] = None
+        self.error: Optional[str] = None
+        self.children: List["Span"] = []
+        self._lock = threading.Lock()
+        self._t0 = time.perf_counter()
+
+    def set(self, **attrs) -> None:
+        """Add attributes known only after the work started (status, bytes, items)."""
+        self.attrs.update(attrs)
+
+    def _child(self, name: str, attrs: Dict) -> "Span":
+        child = Span(name, attrs, self.trace_id)
+        with self._lock:
+            self.children.append(child)
+        return child
+
+    def _finish(self, error: Optional[BaseException]) -> None:
+        self.duration = time.perf_counter() - self._t0
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"[:200]
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            children = list(self.children)
+        return {
+            "id": self.id,
+            "name": self.name,
+            "attrs": self.attrs,
+            "start": round(self.start, 6),
+            "duration": round(self.duration, 6) if self.duration is not None else None,
+            "error": self.error,
+            "children": [child.to_dict() for child in children],
+        }
+
+
+def configure(ring_size: int, trace_file: Optional[str] = None) -> None:
+    """Set how many traces are kept in memory and where (if anywhere) to append them."""
+    global _ring, _trace_file
+    with _ring_lock:
+        _ring = deque(_ring, maxlen=ring_size)
+    _trace_file = trace_file
+
+
+@contextmanager
+def trace(name: str, **attrs):
+    """Record a new trace rooted at `name`; kept once the block exits."""
+    root = Span(name, attrs)
+    root.trace_id = root.attrs.setdefault("trace_id", next(_ids))
+    token = _current.set(root)
+    error = None
+    try:
+        yield root
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        _current.reset(token)
+        root._finish(error)
+        _keep(root)
+
+
+@contextmanager
+def span(name: str, **attrs):
+    """Record a child of the current span (nothing when no trace is active)."""
+    parent = _current.get()
+    if parent is None:
+        yield None
+        return
+    child = parent._child(name, attrs)
+    token = _current.set(child)
+    error = None
+    try:
+        yield child
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        _current.reset(token)
+        child._finish(error)
+
+
+def traced(name: str) -> Callable:
+    """Decorator: run the function inside span(name)."""
+    def decorate(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _current.get() is None:
+                return fn(*args, **kwargs)
+            with span(name, fn=fn.__name__):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def current() -> Optional[Span]:
+    return _current.get()
+
+
+def current_ids() -> Tuple[Optional[int], Optional[int]]:
+    """(trace id, span id) of the current span, for log records; (None, None) outside a trace."""
+    span = _current.get()
+    return (span.trace_id, span.id) if span is not None else (None, None)
+
+
+def submit(executor, fn: Callable, *args, **kwargs):
+    """executor.submit() that keeps the caller's current span as the parent."""
+    return executor.submit(copy_context().run, fn, *args, **kwargs)
+
+
+def _keep(root: Span) -> None:
+    with _ring_lock:
+        _ring.append(root)
+    if _trace_file:
+        try:
+            with open(_trace_file, "a") as f:
+                f.write(json.dumps(root.to_dict()) + "\n")
+        except OSError:
+            pass  # tracing must never break a cycle
+
+
+def recent() -> List[Span]:
+    """Kept traces, oldest first."""
+    with _ring_lock:
+        return list(_ring)
+
+
+def find(trace_id: int) -> Optional[Span]:
+    for root in recent():
+        if root.attrs.get("trace_id") == trace_id:
+            return root
+    return None
+
+
+def render_tree(root: Span) -> str:
+    """The span tree as indented text: duration, name, attributes.
+
+    The hot path — the root, its slowest child, that child's slowest child
+    and so on — is marked with `*`.
+    """
+    lines: List[str] = []
+
+    def walk(node: Dict, depth: int, hot: bool) -> None:
+        duration = f"{node['duration'] * 1000:9.1f} ms" if node["duration"] is not None else "  running   "
+        attrs = " ".join(f"{k}={v}" for k, v in node["attrs"].items())
+        error = f"  !! {node['error']}" if node["error"] else ""
+        lines.append(f"{duration} {'*' if hot else ' '} {'  ' * depth}{node['name']}"
+                     f"{'  ' + attrs if attrs else ''}{error}")
+        children = sorted(node["children"], key=lambda c: c["start"])
+        slowest = max(children, key=lambda c: c["duration"] or 0, default=None)
+        for child in children:
+            walk(child, depth + 1, hot and child is slowest)
+
+    walk(root.to_dict(), 0, True)
+    return "\n".join(lines) + "\n"